@@ -10,6 +10,7 @@ project_dir = script_dir.parent
 sys.path.insert(0, str(project_dir))
 
 from dotenv import load_dotenv
+from gspread.utils import rowcol_to_a1
 from src.sheets_manager import SheetsManager
 
 
@@ -51,7 +52,8 @@ def main():
     all_rows = sheets.sheet.get_all_records()
     print(f"   Total rows: {len(all_rows)}")
 
-    updated = 0
+    # Collect every change, then write them in one batch_update call
+    cell_updates = []
     for i, row in enumerate(all_rows):
         status = str(row.get("status", "")).strip().upper()
         email = str(row.get("email", "")).strip()
@@ -61,13 +63,20 @@ def main():
 
         # If APPROVED but email missing -> set to REJECTED_NO_EMAIL
         if status == "APPROVED" and not email:
-            try:
-                sheets.sheet.update_cell(sheet_row, status_col, "REJECTED_NO_EMAIL")
-                business = row.get("business_name", "Unknown")[:30]
-                print(f"   Row {sheet_row}: {business} -> REJECTED_NO_EMAIL")
-                updated += 1
-            except Exception as e:
-                print(f"   ⚠️ Failed to update row {sheet_row}: {e}")
+            cell_updates.append({
+                "range": rowcol_to_a1(sheet_row, status_col),
+                "values": [["REJECTED_NO_EMAIL"]],
+            })
+            business = row.get("business_name", "Unknown")[:30]
+            print(f"   Row {sheet_row}: {business} -> REJECTED_NO_EMAIL")
+
+    updated = 0
+    if cell_updates:
+        try:
+            sheets.sheet.batch_update(cell_updates)
+            updated = len(cell_updates)
+        except Exception as e:
+            print(f"   ⚠️ Failed to update {len(cell_updates)} rows: {e}")
 
     print()
     print("=" * 60)
@@ -115,6 +115,8 @@ def health_check() -> bool:
 # =============================================================================
 def show_status():
     """Show current system status."""
+    from collections import Counter
+    from src.sequencer_models import EnhancedLead
     from src.sequencer_sheets import SequencerSheetsManager
     from src.queue_generator import get_queue_stats
 
@@ -180,14 +182,21 @@ def show_status():
     print("-" * 70)
 
     try:
-        new_leads = sheets.get_leads_by_status("NEW", limit=10000)
-        approved = sheets.get_leads_by_status("APPROVED", limit=10000)
-        sent = sheets.get_leads_by_status("SENT", limit=10000)
-        eligible = sheets.get_eligible_leads(limit=10000)
-
-        print(f"  NEW: {len(new_leads)}")
-        print(f"  APPROVED: {len(approved)}")
-        print(f"  SENT: {len(sent)}")
+        # One leads read (or the local snapshot) instead of one per count
+        batch = sheets.get_leads_batch()
+        status_counts = Counter(value.upper() for value in batch.column("status"))
+
+        leads = []
+        for row in batch.rows():
+            try:
+                leads.append(EnhancedLead.from_sheets_row(row))
+            except Exception:
+                continue
+        eligible = sheets.select_eligible_leads(leads, limit=10000)
+
+        print(f"  NEW: {status_counts['NEW']}")
+        print(f"  APPROVED: {status_counts['APPROVED']}")
+        print(f"  SENT: {status_counts['SENT']}")
         print(f"  Send-eligible: {len(eligible)}")
     except Exception as e:
         print(f"  [ERROR] Cannot get lead stats: {e}")
@@ -235,6 +235,9 @@ def main():
     # Send follow-up 1s first, then follow-up 2s
     sent = 0
     failed = 0
+    # Pacing deadline: each send starts DELAY_BETWEEN_SENDS after the previous
+    # one started, so time spent in the send itself counts toward the gap
+    next_send_at = time.monotonic()
 
     for followup_num, key in [(1, "followup_1"), (2, "followup_2")]:
         leads = queue[key][:args.limit - sent]  # Respect total limit
@@ -254,15 +257,16 @@ def main():
             print(f"\n[{sent+1}] {lead['business_name']} ({lead['email']})")
             print(f"    Sent {lead['days_since_sent']} days ago")
 
+            if not args.dry_run:
+                time.sleep(max(0.0, next_send_at - time.monotonic()))
+                next_send_at = time.monotonic() + DELAY_BETWEEN_SENDS
+
             success = send_followup(lead, followup_num, sheets, dry_run=args.dry_run)
             if success:
                 sent += 1
             else:
                 failed += 1
 
-            if not args.dry_run:
-                time.sleep(DELAY_BETWEEN_SENDS)
-
     print(f"\n{'='*50}")
     print(f"FOLLOW-UP SUMMARY")
     print(f"  Sent: {sent}")
@@ -15,7 +15,8 @@ from dataclasses import dataclass
 # - Requires: @ symbol followed by domain with at least one dot
 # - TLD must be 2-10 characters
 EMAIL_REGEX = re.compile(
-    r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,10}$'
+    r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,10}$',
+    re.ASCII
 )
 
 # Common invalid/test email patterns to reject
@@ -35,6 +36,12 @@ INVALID_PATTERNS = [
     r'\.\.+',  # Multiple consecutive dots
 ]
 
+# Compiled once at import (pattern source kept for the rejection reason)
+_INVALID_PATTERN_RES = [
+    (pattern, re.compile(pattern, re.IGNORECASE | re.ASCII))
+    for pattern in INVALID_PATTERNS
+]
+
 # Common spam trap domains
 SPAM_TRAP_DOMAINS = {
     'mailinator.com',
@@ -129,8 +136,8 @@ def sanitize_email(email: str) -> SanitizationResult:
         )
 
     # Step 8: Check against invalid patterns
-    for pattern in INVALID_PATTERNS:
-        if re.search(pattern, cleaned, re.IGNORECASE):
+    for pattern, pattern_re in _INVALID_PATTERN_RES:
+        if pattern_re.search(cleaned):
             return SanitizationResult(
                 original=original,
                 sanitized=None,
@@ -13,6 +13,7 @@ Soft matches are flagged but NOT blocked - they're still added to the
 leads table but marked with soft_match=True for manual review.
 """
 
+import functools
 from typing import Dict, List, Set, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
@@ -119,8 +120,11 @@ class EnhancedDeduplicator:
     # =========================================================================
     # KEY NORMALIZATION
     # =========================================================================
+    # Memoized: filter_duplicates normalizes each lead's keys once in
+    # check_duplicate and again in register_lead
 
     @staticmethod
+    @functools.lru_cache(maxsize=16384)
     def normalize_email(email: str) -> str:
         """Normalize an email address for comparison."""
         if not email:
@@ -128,6 +132,7 @@ class EnhancedDeduplicator:
         return email.lower().strip()
 
     @staticmethod
+    @functools.lru_cache(maxsize=16384)
     def normalize_phone(phone: str) -> str:
         """Normalize a phone number for comparison."""
         if not phone:
@@ -136,6 +141,7 @@ class EnhancedDeduplicator:
         return phone.replace(" ", "").replace("-", "").replace("(", "").replace(")", "").lower()
 
     @staticmethod
+    @functools.lru_cache(maxsize=16384)
     def normalize_name_city(name: str, city: str) -> str:
         """Create normalized name+city composite key."""
         if not name or not city:
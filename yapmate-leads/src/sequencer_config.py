@@ -263,6 +263,9 @@ class EmailSenderConfig:
     from_name: str = "Connor from YapMate"
     reply_to: str = "support@yapmate.co.uk"
 
+    # Per-send CTA URL / Resend ID prints (the ID is always in the structured log)
+    verbose_send_logging: bool = False
+
 
 # =============================================================================
 # DEDUPE SETTINGS
@@ -308,6 +311,8 @@ SHEETS_TABS = {
     "dedupe_keys": "dedupe_keys", # Fast dedupe lookup table
     "campaigns": "campaigns",     # Email campaigns
     "email_blocklist": "email_blocklist",  # Bounced/complained addresses
+    "sends_today": "sends_today",  # Today's sends (small roll-up for quota/dedupe)
+    "helpers": "helpers",         # Formula cells read instead of scanning leads
 }
 
 
@@ -355,6 +360,18 @@ DEFAULT_EMAIL_SENDER_CONFIG = EmailSenderConfig(
     warmup_increment_per_day=_parse_int_env("WARMUP_RAMP_INCREMENT", 5),
     warmup_max_daily_limit=_parse_int_env("WARMUP_MAX_CAP", 100),
     warmup_start_date=os.getenv("WARMUP_START_DATE", "").strip(),
+    verbose_send_logging=_parse_bool_env("VERBOSE_SEND_LOGGING", False),
 )
 
 DEFAULT_DEDUPE_CONFIG = DedupeConfig()
+
+# Local copy of the leads tab for read-only analytics (see
+# SequencerSheetsManager.get_leads_batch). It holds every lead's email, so
+# it is off unless LEADS_SNAPSHOT_ENABLED=true. Kept under the project's
+# data/ dir unless LEADS_SNAPSHOT_PATH says otherwise
+PROJECT_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+LEADS_SNAPSHOT_ENABLED = _parse_bool_env("LEADS_SNAPSHOT_ENABLED", False)
+LEADS_SNAPSHOT_PATH = (
+    os.getenv("LEADS_SNAPSHOT_PATH", "").strip()
+    or os.path.join(PROJECT_DATA_DIR, "snapshots", "leads.json")
+)
@@ -11,28 +11,203 @@ This module handles email sending with:
 - Structured logging for each lead
 """
 
+import itertools
 import os
+import sys
+import threading
 import time
-from typing import List, Dict, Optional, Any
-from datetime import datetime, timedelta
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from string import Template
+from typing import TYPE_CHECKING, List, Dict, Mapping, Optional, Any, Tuple
+from datetime import date, datetime, timedelta, timezone
 from dataclasses import dataclass
 from enum import Enum
 
-import resend
-from dotenv import load_dotenv
 
 from src.sequencer_config import DEFAULT_EMAIL_SENDER_CONFIG, EmailSenderConfig
-from src.sequencer_models import EnhancedLead, RunnerState
-from src.sequencer_sheets import SequencerSheetsManager
+from src.sequencer_models import NEW_OR_APPROVED, EnhancedLead, RunnerState
 from src.sequencer_alerts import alert_sending_paused, alert_sender_error
 from src.email_sanitizer import sanitize_email, SanitizationResult
+from src.templates import (
+    APP_STORE_URL,
+    generate_email_content,
+    generate_email_html,
+    generate_email_subject,
+    generate_email_text,
+)
 from src.config import get_config
 
+if TYPE_CHECKING:
+    import requests
+    from src.sequencer_sheets import SequencerSheetsManager
+
+
+# Test email bodies (TEST_EMAIL fallback) - parsed once at import
+_TEST_EMAIL_HTML = Template("""
+            <html>
+            <body style="font-family: Arial, sans-serif; color: #333;">
+            <h2>YapMate Lead Engine - Test Email</h2>
+            <p>This is a test email from the YapMate Lead Engine.</p>
+            <p>If you received this, the email sender is working correctly.</p>
+            <hr style="border: none; border-top: 1px solid #ddd; margin: 20px 0;">
+            <p style="color: #666; font-size: 12px;">
+                Sent at: $timestamp<br>
+                From: $from_email
+            </p>
+            </body>
+            </html>
+            """)
+
+_TEST_EMAIL_TEXT = Template("""YapMate Lead Engine - Test Email
+
+This is a test email from the YapMate Lead Engine.
+
+If you received this, the email sender is working correctly.
+
+Sent at: $timestamp
+From: $from_email""")
+
+# Resend circuit breaker: consecutive failures before opening, and the
+# first / maximum cooldown in seconds
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_COOLDOWN_SECONDS = 30
+CIRCUIT_MAX_COOLDOWN_SECONDS = 300
+
+# Lead fields written by queued status updates (None = leave unchanged)
+UPDATE_FIELDS = ("status", "sent_at", "resend_id", "eligibility_reason")
+
+# Upper bound on memoized sanitize_email() results per sender
+SANITIZE_CACHE_MAX = 20000
+
+# Leads read for the eligibility breakdown (and eligible selection) per batch
+ELIGIBILITY_SCAN_LIMIT = 10000
+
+# Seconds before the safety window is re-read from the sheet, so bounces and
+# complaints recorded by the webhook reach a long-running sender
+SAFETY_WINDOW_TTL = 60
+
+# Ineligibility reasons reported by the eligibility breakdown (display order)
+REASON_KEYS = (
+    "No email address",
+    "Already sent",
+    "Invalid email",
+    "Not approved (status)",
+    "send_eligible = False",
+    "Not eligible (other)",
+)
+
+# Ineligibility reason by failed-check bits, first failing check wins:
+# 8 = already SENT, 4 = no email, 2 = not NEW/APPROVED, 1 = not send_eligible
+_INELIGIBLE_REASONS = tuple(
+    "Already sent" if bits & 8 else
+    "No email address" if bits & 4 else
+    "Not approved (status)" if bits & 2 else
+    "send_eligible = False" if bits & 1 else
+    "Not eligible (other)"
+    for bits in range(16)
+)
+
+# One-click unsubscribe headers - identical for every lead email
+UNSUBSCRIBE_HEADERS = {
+    "List-Unsubscribe": "<https://www.yapmate.co.uk/unsubscribe>",
+    "List-Unsubscribe-Post": "List-Unsubscribe=One-Click",
+}
+
+
+# Resend REST API. Sends go over one pooled keep-alive session (the SDK opens
+# a new connection per call); only 429s and connection errors are retried, so
+# an email is never POSTed twice after Resend may have accepted it
+RESEND_API_URL = "https://api.resend.com"
+RESEND_TIMEOUT = (3.05, 30)  # (connect, read) seconds
+
+_resend_session: Optional["requests.Session"] = None
+_resend_session_lock = threading.Lock()
+
+
+def _get_resend_session() -> "requests.Session":
+    """Get the shared Resend HTTP session, creating it on first use."""
+    global _resend_session
+    with _resend_session_lock:
+        if _resend_session is None:
+            # Imported here so --status and disabled runs never load requests
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            retry = Retry(
+                total=3,
+                read=0,
+                backoff_factor=0.5,
+                status_forcelist=[429],
+                allowed_methods=frozenset({"POST"}),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=16, max_retries=retry))
+            _resend_session = session
+    return _resend_session
+
+
+def _is_sent_status(status: str) -> bool:
+    """True if a status cell reads SENT (exact match allocates nothing)."""
+    if status == "SENT":
+        return True
+    # Single-char slices are cached by CPython - no allocation
+    first = status[:1]
+    if first != "S" and first != "s" and not first.isspace():
+        return False
+    # Rare: padded or lower/mixed-case values edited by hand in the sheet
+    return status.strip().upper() == "SENT"
+
+
+def _sent_on(sent_at: str, day: str) -> bool:
+    """True if a sent_at cell starts with the given YYYY-MM-DD date."""
+    return sent_at.startswith(day) or (sent_at[:1].isspace() and sent_at.strip().startswith(day))
+
+
+def _header_index(headers: List[str]) -> Dict[str, int]:
+    """Map lowercased sheet header -> column index (first occurrence wins)."""
+    index: Dict[str, int] = {}
+    for i, header in enumerate(headers):
+        index.setdefault(header.strip().lower(), i)
+    return index
+
 
 # =============================================================================
 # STRUCTURED LOGGING
 # =============================================================================
 
+_LOG_RULE = "-" * 40
+
+# (epoch second, formatted string) - log timestamps have 1s resolution,
+# so the string only needs re-formatting when the second changes
+_timestamp_cache = (0, "")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as 'YYYY-MM-DD HH:MM:SS UTC', cached per second."""
+    global _timestamp_cache
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache = (now, datetime.fromtimestamp(now, timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC"))
+    return _timestamp_cache[1]
+
+
+# (epoch day, 'YYYY-MM-DD') - refreshed only when the UTC date rolls over
+_today_cache = (-1, "")
+
+
+def _utc_today() -> str:
+    """Current UTC date as 'YYYY-MM-DD' (matches the sent_at prefix), cached per day."""
+    global _today_cache
+    day = int(time.time()) // 86400
+    if day != _today_cache[0]:
+        _today_cache = (day, datetime.fromtimestamp(day * 86400, timezone.utc).strftime("%Y-%m-%d"))
+    return _today_cache[1]
+
+
 class SendStatus(Enum):
     """Status of a send operation."""
     SENT = "SENT"
@@ -42,7 +217,7 @@ class SendStatus(Enum):
     SKIPPED = "SKIPPED"
 
 
-@dataclass
+@dataclass(slots=True)
 class StructuredLog:
     """Structured log entry for each lead."""
     lead_id: str
@@ -55,7 +230,26 @@ class StructuredLog:
 
     def __post_init__(self):
         if not self.timestamp:
-            self.timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
+            self.timestamp = _utc_timestamp()
+
+    @classmethod
+    def for_lead(
+        cls,
+        lead: EnhancedLead,
+        status: SendStatus,
+        reason: str,
+        email_original: Optional[str] = None,
+        email_sanitized: Optional[str] = None,
+    ) -> "StructuredLog":
+        """Build a log entry for a lead (email_original defaults to lead.email)."""
+        return cls(
+            lead_id=lead.lead_id,
+            status=status,
+            reason=reason,
+            email_original=(lead.email or "") if email_original is None else email_original,
+            email_sanitized=email_sanitized,
+            business_name=lead.business_name,
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -69,14 +263,16 @@ class StructuredLog:
         }
 
     def log(self) -> None:
-        """Print structured log entry."""
-        print(f"  STATUS: {self.status.value}")
-        print(f"  REASON: {self.reason}")
-        print(f"  EMAIL_ORIGINAL: {self.email_original}")
-        print(f"  EMAIL_SANITIZED: {self.email_sanitized or 'N/A'}")
-        print(f"  BUSINESS: {self.business_name}")
-        print(f"  TIMESTAMP: {self.timestamp}")
-        print("-" * 40)
+        """Print structured log entry (one write per entry)."""
+        print(
+            f"  STATUS: {self.status.value}\n"
+            f"  REASON: {self.reason}\n"
+            f"  EMAIL_ORIGINAL: {self.email_original}\n"
+            f"  EMAIL_SANITIZED: {self.email_sanitized or 'N/A'}\n"
+            f"  BUSINESS: {self.business_name}\n"
+            f"  TIMESTAMP: {self.timestamp}\n"
+            f"{_LOG_RULE}"
+        )
 
 
 @dataclass
@@ -120,8 +316,9 @@ class SequencerEmailSender:
 
     def __init__(
         self,
-        sheets: SequencerSheetsManager,
-        config: EmailSenderConfig = None
+        sheets: "SequencerSheetsManager",
+        config: EmailSenderConfig = None,
+        env: Optional[Mapping[str, str]] = None
     ):
         """
         Initialize the email sender.
@@ -129,26 +326,101 @@ class SequencerEmailSender:
         Args:
             sheets: Sheets manager instance
             config: Email sender configuration
+            env: Environment snapshot to read settings from (defaults to
+                 os.environ, which already includes .env)
         """
         self.sheets = sheets
         self.config = config or DEFAULT_EMAIL_SENDER_CONFIG
 
-        # Load environment
-        load_dotenv()
+        # .env is loaded once at import time by src.config
+        if env is None:
+            env = os.environ
+        self._env = env
 
         # Initialize Resend - strip whitespace to handle secrets with trailing newlines
-        resend_key = os.getenv("RESEND_API_KEY", "").strip()
+        resend_key = env.get("RESEND_API_KEY", "").strip()
         if not resend_key:
             raise ValueError("RESEND_API_KEY not found in environment")
 
-        resend.api_key = resend_key
+        # Used as the bearer token by _resend_post()
+        self._resend_key = resend_key
 
         # Get email configuration from env (with fallbacks from config)
         # Use 'or' to handle empty strings from GitHub Actions when secrets aren't set
-        self.from_email = os.getenv("EMAIL_FROM") or self.config.from_email
-        self.from_name = os.getenv("EMAIL_FROM_NAME") or self.config.from_name
-        self.reply_to = os.getenv("EMAIL_REPLY_TO") or self.config.reply_to
-        self.footer_image_url = os.getenv("EMAIL_FOOTER_IMAGE_URL", "")
+        self.from_email = env.get("EMAIL_FROM") or self.config.from_email
+        self.from_name = env.get("EMAIL_FROM_NAME") or self.config.from_name
+        self.reply_to = env.get("EMAIL_REPLY_TO") or self.config.reply_to
+        self.footer_image_url = env.get("EMAIL_FOOTER_IMAGE_URL", "")
+        self._from_header = f"{self.from_name} <{self.from_email}>"
+
+        # Run-mode flags, parsed once from the env snapshot
+        self._force_run_env = env.get("FORCE_RUN", "false").lower() == "true"
+        self._live_send_test_mode = env.get("LIVE_SEND_TEST_MODE", "false").lower() == "true"
+        self._test_email = env.get("TEST_EMAIL", "").strip()
+
+        # SEND_ENABLED gate (fail-closed) and DRY_RUN, resolved once - config
+        # is static for the life of the process, so sends don't re-evaluate
+        # them (refresh_send_gate() re-reads on demand)
+        self.refresh_send_gate()
+
+        # Warm-up start date, parsed once (None if unset or unparseable)
+        self._warmup_start: Optional[date] = None
+        self._warmup_start_invalid = False
+        if self.config.warmup_start_date:
+            try:
+                self._warmup_start = datetime.strptime(self.config.warmup_start_date, "%Y-%m-%d").date()
+            except ValueError:
+                self._warmup_start_invalid = True
+        # (date, limit) - the daily limit only changes when the day does
+        self._daily_limit_cache: Optional[Tuple[date, int]] = None
+
+        # Emails sent today, read from the sheet once per batch and then
+        # tracked locally so the send loop never re-reads the sheet for quota
+        self._sent_today_local = 0
+
+        # Sliding safety window (UTC epoch seconds, oldest first). Read from
+        # the sheet every SAFETY_WINDOW_TTL seconds; sends in between are
+        # added in memory. Loaded-at is a monotonic time (None = not yet)
+        self._sent_times: deque = deque()
+        self._bounce_times: deque = deque()
+        self._complaint_times: deque = deque()
+        self._safety_window_loaded_at: Optional[float] = None
+
+        # Leads tab snapshot shared by the "sent today" helpers:
+        # (rows, header index map, fetched_at monotonic time)
+        self._leads_snapshot: Optional[Tuple[List[List[str]], Dict[str, int], float]] = None
+        # Column views of the snapshot (header -> cells below it), built on demand
+        self._leads_columns: Dict[str, List[str]] = {}
+        # _get_emails_sent_today() result: (UTC day, fetched_at monotonic, emails)
+        self._sent_today_emails: Optional[Tuple[str, float, frozenset]] = None
+
+        # Lead status updates waiting to be written in one batch (flush_updates),
+        # column-oriented: lead IDs plus one value list per UPDATE_FIELDS entry
+        self._pending_lead_ids: List[str] = []
+        self._pending_updates: Dict[str, List[Any]] = {field: [] for field in UPDATE_FIELDS}
+        # Sends waiting to be appended to the sends_today tab: [lead_id, email, sent_at]
+        # (email stripped + lowercased, the same key the duplicate check uses)
+        self._pending_sends: List[List[str]] = []
+        # UTC day the sends_today tab was last pruned for (see _record_sends)
+        self._sends_pruned_on: Optional[str] = None
+
+        # sanitize_email() results by raw address, shared by the eligibility
+        # breakdown and the send pass (bounded - see _sanitize)
+        self._sanitize_cache: Dict[str, SanitizationResult] = {}
+
+        # Resend POSTs run on worker threads so the send loop isn't blocked on
+        # network latency; the semaphore caps concurrent requests to Resend.
+        # The pool is started on first use and shut down by close()
+        self._io_executor: Optional[ThreadPoolExecutor] = None
+        self._resend_slots = threading.Semaphore(8)
+
+        # Circuit breaker on Resend: after CIRCUIT_FAILURE_THRESHOLD consecutive
+        # failures, sends fail fast for a cooldown that doubles on each re-trip.
+        # A success resets both counters
+        self._circuit_lock = threading.Lock()
+        self._send_failures = 0
+        self._circuit_trips = 0
+        self._send_circuit_open_until = 0.0
 
     # =========================================================================
     # DAILY LIMIT CALCULATION
@@ -160,101 +432,159 @@ class SequencerEmailSender:
 
         If warm-up is enabled, limit increases gradually from
         warmup_start_daily_limit to warmup_max_daily_limit.
+        The result is cached until the (local) date changes.
 
         Returns:
             Maximum emails allowed today
         """
+        today = date.today()
+        if self._daily_limit_cache is not None and self._daily_limit_cache[0] == today:
+            return self._daily_limit_cache[1]
+
+        limit = self._compute_daily_limit(today)
+        self._daily_limit_cache = (today, limit)
+        return limit
+
+    def _compute_daily_limit(self, today: date) -> int:
+        """Daily limit for the given date (see calculate_daily_limit)."""
         if not self.config.warmup_enabled:
             return self.config.daily_limit
 
+        if self._warmup_start_invalid:
+            # Invalid date format, use base limit
+            return self.config.daily_limit
+
         # Check if warm-up has started
-        if not self.config.warmup_start_date:
+        if self._warmup_start is None:
             # Warm-up not started, use base limit
             return self.config.warmup_start_daily_limit
 
-        try:
-            start_date = datetime.strptime(self.config.warmup_start_date, "%Y-%m-%d")
-            today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-            days_since_start = (today - start_date).days
-
-            if days_since_start < 0:
-                # Warm-up hasn't started yet
-                return self.config.warmup_start_daily_limit
-
-            # Calculate ramped limit
-            ramped_limit = (
-                self.config.warmup_start_daily_limit +
-                (days_since_start * self.config.warmup_increment_per_day)
-            )
+        days_since_start = (today - self._warmup_start).days
 
-            # Cap at maximum
-            return min(ramped_limit, self.config.warmup_max_daily_limit)
+        if days_since_start < 0:
+            # Warm-up hasn't started yet
+            return self.config.warmup_start_daily_limit
 
-        except ValueError:
-            # Invalid date format, use base limit
-            return self.config.daily_limit
+        # Calculate ramped limit
+        ramped_limit = (
+            self.config.warmup_start_daily_limit +
+            (days_since_start * self.config.warmup_increment_per_day)
+        )
+
+        # Cap at maximum
+        return min(ramped_limit, self.config.warmup_max_daily_limit)
 
-    def get_remaining_daily_quota(self) -> int:
+    def get_remaining_daily_quota(self, sent_today: Optional[int] = None) -> int:
         """
         Get remaining emails that can be sent today.
 
         Counts actual SENT leads with today's date from the sheet
         for accurate tracking (not relying on a state counter).
 
+        Args:
+            sent_today: Pre-fetched sent count (skips the sheet read if given)
+
         Returns:
             Number of emails remaining in today's quota
         """
         daily_limit = self.calculate_daily_limit()
 
         # Count actual emails sent today from the leads sheet
-        sent_today = self._count_emails_sent_today()
+        if sent_today is None:
+            sent_today = self._count_emails_sent_today()
         print(f"    Sent today (from sheet): {sent_today}")
 
         return max(0, daily_limit - sent_today)
 
-    def _count_emails_sent_today(self) -> int:
-        """Count actual SENT leads with today's sent_at date from the sheet."""
-        try:
-            all_rows = self.sheets.get_leads_tab().get_all_values()
-            if not all_rows or len(all_rows) < 2:
-                return 0
+    def _get_leads_snapshot(self, ttl: float = 30) -> Tuple[List[List[str]], Dict[str, int]]:
+        """
+        Get all leads tab rows plus a header -> column index map.
 
-            headers = all_rows[0]
-            col_status = headers.index("status") if "status" in headers else None
-            col_sent_at = headers.index("sent_at") if "sent_at" in headers else None
+        The sheet is read once and reused for up to ttl seconds, so the
+        per-batch "sent today" lookups share a single get_all_values() call.
 
-            if col_status is None:
-                return 0
+        Args:
+            ttl: Seconds a snapshot stays valid
 
-            today = datetime.utcnow().strftime("%Y-%m-%d")
-            count = 0
+        Returns:
+            Tuple of (all_rows including header row, header index map)
+        """
+        now = time.monotonic()
+        if self._leads_snapshot is not None:
+            rows, col_index, fetched_at = self._leads_snapshot
+            if now - fetched_at < ttl:
+                return (rows, col_index)
+
+        rows = self.sheets.get_leads_tab().get_all_values()
+        col_index = _header_index(rows[0]) if rows else {}
+        self._leads_snapshot = (rows, col_index, now)
+        self._leads_columns = {}
+        return (rows, col_index)
+
+    def _get_leads_column(self, name: str) -> Optional[List[str]]:
+        """
+        Get one leads tab column (data rows only) from the snapshot.
 
-            for row in all_rows[1:]:
-                if len(row) <= col_status:
-                    continue
-                status = str(row[col_status]).strip().upper()
-                if status != "SENT":
-                    continue
+        Short rows are padded with "", so columns from the same snapshot
+        line up and can be zipped together.
 
-                # Only count if sent_at matches today's date
-                if col_sent_at is not None and len(row) > col_sent_at:
-                    sent_at = str(row[col_sent_at]).strip()
-                    if sent_at and sent_at.startswith(today):
-                        count += 1
+        Args:
+            name: Header name (case-insensitive)
+
+        Returns:
+            List of cell values, or None if the column doesn't exist
+        """
+        rows, col_index = self._get_leads_snapshot()
+        col = col_index.get(name.lower())
+        if col is None:
+            return None
+
+        column = self._leads_columns.get(name)
+        if column is None:
+            column = [row[col] if col < len(row) else "" for row in rows[1:]]
+            self._leads_columns[name] = column
+        return column
+
+    def invalidate_leads_snapshot(self):
+        """Drop the cached leads snapshot (call after writing to the leads tab)."""
+        self._leads_snapshot = None
+        self._leads_columns = {}
+        self._sent_today_emails = None
+
+    def _count_emails_sent_today(self) -> int:
+        """Count actual SENT leads with today's sent_at date from the sheet."""
+        today = _utc_today()
+
+        try:
+            statuses = self._get_leads_column("status")
+            sent_ats = self._get_leads_column("sent_at")
+            if statuses is None or sent_ats is None:
+                return 0
+
+            # Column-wise pass over the snapshot (gspread cells are already str)
+            count = sum(
+                1 for status, sent_at in zip(statuses, sent_ats)
+                if _is_sent_status(status) and _sent_on(sent_at, today)
+            )
 
             return count
         except Exception as e:
             print(f"    Warning: Could not count sent today: {e}")
             return 0
 
-    def increment_send_counter(self, count: int = 1):
+    def increment_send_counter(self, count: int = 1, state: Optional[RunnerState] = None):
         """
         Increment the daily send counter.
 
         Args:
             count: Number to increment by
+            state: Runner state already loaded by the caller (skips a re-read)
         """
-        state = self.sheets.get_runner_state()
+        if count <= 0:
+            return  # Nothing changed - no write
+
+        if state is None:
+            state = self.sheets.get_runner_state()
         today = datetime.now().strftime("%Y-%m-%d")
 
         # Reset counter if from different day
@@ -268,40 +598,101 @@ class SequencerEmailSender:
         state.last_run_at = datetime.utcnow()
 
         self.sheets.save_runner_state(state)
+        # Sends were just counted - the cached sent-today set is stale
+        self._sent_today_emails = None
 
     # =========================================================================
     # SAFETY CHECKS
     # =========================================================================
 
-    def check_safety_thresholds(self) -> tuple[bool, Optional[str]]:
+    def _load_safety_window(self):
+        """(Re)load the sliding safety window from the sheet once it is SAFETY_WINDOW_TTL old."""
+        loaded_at = self._safety_window_loaded_at
+        if loaded_at is not None and time.monotonic() - loaded_at < SAFETY_WINDOW_TTL:
+            return
+
+        events = self.sheets.get_safety_events(
+            lookback_days=self.config.safety_lookback_days
+        )
+        self._sent_times = deque(events["sent"])
+        self._bounce_times = deque(events["bounced"])
+        self._complaint_times = deque(events["complained"])
+        self._safety_window_loaded_at = time.monotonic()
+
+    def record_safety_event(self, event_type: str, timestamp: Optional[float] = None):
+        """
+        Record a send, bounce or complaint in the sliding safety window.
+
+        Args:
+            event_type: "sent", "bounced" or "complained"
+            timestamp: UTC epoch seconds (defaults to now)
+        """
+        if self._safety_window_loaded_at is None:
+            # Window is seeded from the sheet, which already includes this event
+            return
+
+        window = {
+            "sent": self._sent_times,
+            "bounced": self._bounce_times,
+            "complained": self._complaint_times,
+        }[event_type]
+        window.append(time.time() if timestamp is None else timestamp)
+
+    def get_safety_metrics(self) -> Dict[str, Any]:
+        """
+        Safety metrics for the lookback window, from the in-memory window.
+
+        Returns:
+            Dict with bounce_count, complaint_count, total_sent, bounce_rate, complaint_rate
+        """
+        self._load_safety_window()
+
+        cutoff = time.time() - self.config.safety_lookback_days * 86400
+        for window in (self._sent_times, self._bounce_times, self._complaint_times):
+            while window and window[0] < cutoff:
+                window.popleft()
+
+        total_sent = len(self._sent_times)
+        bounce_count = len(self._bounce_times)
+        complaint_count = len(self._complaint_times)
+
+        return {
+            "bounce_count": bounce_count,
+            "complaint_count": complaint_count,
+            "total_sent": total_sent,
+            "bounce_rate": (bounce_count / total_sent) if total_sent > 0 else 0.0,
+            "complaint_rate": (complaint_count / total_sent) if total_sent > 0 else 0.0,
+        }
+
+    def check_safety_thresholds(self) -> tuple[bool, Optional[str], Dict[str, Any]]:
         """
         Check if sending should be paused due to safety thresholds.
 
         Returns:
-            Tuple of (is_safe_to_send, pause_reason)
+            Tuple of (is_safe_to_send, pause_reason, metrics) - pass metrics
+            on to pause_sending() so it doesn't recompute them
         """
-        metrics = self.sheets.get_safety_metrics(
-            lookback_days=self.config.safety_lookback_days
-        )
+        metrics = self.get_safety_metrics()
 
         # Check bounce rate
         if metrics["bounce_rate"] > self.config.max_bounce_rate:
             reason = f"Bounce rate {metrics['bounce_rate']:.1%} exceeds threshold {self.config.max_bounce_rate:.1%}"
-            return (False, reason)
+            return (False, reason, metrics)
 
         # Check complaint rate
         if metrics["complaint_rate"] > self.config.max_complaint_rate:
             reason = f"Complaint rate {metrics['complaint_rate']:.3%} exceeds threshold {self.config.max_complaint_rate:.3%}"
-            return (False, reason)
+            return (False, reason, metrics)
 
-        return (True, None)
+        return (True, None, metrics)
 
-    def pause_sending(self, reason: str):
+    def pause_sending(self, reason: str, metrics: Optional[Dict[str, Any]] = None):
         """
         Pause sending and update state.
 
         Args:
             reason: Why sending is being paused
+            metrics: Safety metrics from check_safety_thresholds() (computed if omitted)
         """
         state = self.sheets.get_runner_state()
         state.sending_paused = True
@@ -310,9 +701,8 @@ class SequencerEmailSender:
         print(f"\nSENDING PAUSED: {reason}")
 
         # Send alert
-        metrics = self.sheets.get_safety_metrics(
-            lookback_days=self.config.safety_lookback_days
-        )
+        if metrics is None:
+            metrics = self.get_safety_metrics()
         alert_sending_paused(
             bounce_rate=metrics["bounce_rate"],
             complaint_rate=metrics["complaint_rate"],
@@ -350,7 +740,6 @@ class SequencerEmailSender:
         Returns:
             Tuple of (subject, html_body, text_body)
         """
-        from src.templates import generate_email_content
         return generate_email_content(
             lead.business_name,
             hook=lead.ai_hook or "",
@@ -359,23 +748,103 @@ class SequencerEmailSender:
 
     def generate_subject(self, lead: EnhancedLead) -> str:
         """Generate email subject line (standalone, for backwards compat)."""
-        from src.templates import generate_email_subject
         return generate_email_subject(lead.business_name)
 
     def generate_html_body(self, lead: EnhancedLead) -> str:
         """Generate HTML email body (standalone, for backwards compat)."""
-        from src.templates import generate_email_html
         return generate_email_html(business_name=lead.business_name, hook=lead.ai_hook or "", trade=getattr(lead, 'trade', "") or "")
 
     def generate_text_body(self, lead: EnhancedLead) -> str:
         """Generate plain text email body (standalone, for backwards compat)."""
-        from src.templates import generate_email_text
         return generate_email_text(business_name=lead.business_name, hook=lead.ai_hook or "", trade=getattr(lead, 'trade', "") or "")
 
     # =========================================================================
     # SENDING
     # =========================================================================
 
+    def _build_send_params(self, to_email: str, subject: str, html_body: str, text_body: str) -> Dict[str, Any]:
+        """Build the Resend payload for a lead email."""
+        params = {
+            "from": self._from_header,
+            "to": [to_email],
+            "subject": subject,
+            "html": html_body,
+            "text": text_body,
+            "headers": UNSUBSCRIBE_HEADERS,
+        }
+        if self.reply_to:
+            params["reply_to"] = self.reply_to
+        return params
+
+    def _resend_post(self, path: str, payload: Any) -> Any:
+        """
+        POST to the Resend API over the shared session.
+
+        Args:
+            path: API path, e.g. "/emails"
+            payload: JSON body
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            RuntimeError: If Resend returns an error status
+        """
+        response = _get_resend_session().post(
+            f"{RESEND_API_URL}{path}",
+            json=payload,
+            headers={"Authorization": f"Bearer {self._resend_key}"},
+            timeout=RESEND_TIMEOUT,
+        )
+
+        if response.headers.get("x-ratelimit-remaining") == "0":
+            print("  ⚠️  Resend rate limit reached for this window")
+
+        if response.status_code >= 400:
+            raise RuntimeError(f"Resend API error {response.status_code}: {response.text[:200]}")
+        return response.json()
+
+    def _send_via_resend(self, params: Any, path: str = "/emails") -> Any:
+        """
+        Send via Resend behind the circuit breaker and concurrency cap.
+
+        Args:
+            params: One email's params, or a list of them for "/emails/batch"
+            path: API path
+
+        Raises:
+            RuntimeError("circuit_open") while the breaker is open, or the
+            Resend error itself
+        """
+        with self._circuit_lock:
+            if time.monotonic() < self._send_circuit_open_until:
+                raise RuntimeError("circuit_open")
+
+        try:
+            with self._resend_slots:
+                response = self._resend_post(path, params)
+        except Exception:
+            with self._circuit_lock:
+                self._send_failures += 1
+                # Failures stay counted past a trip, so the first request
+                # after the cooldown (half-open) re-opens the breaker on its
+                # own; requests already in flight when it opened don't re-trip
+                if (self._send_failures >= CIRCUIT_FAILURE_THRESHOLD
+                        and time.monotonic() >= self._send_circuit_open_until):
+                    self._circuit_trips += 1
+                    cooldown = min(
+                        CIRCUIT_COOLDOWN_SECONDS * 2 ** (self._circuit_trips - 1),
+                        CIRCUIT_MAX_COOLDOWN_SECONDS
+                    )
+                    self._send_circuit_open_until = time.monotonic() + cooldown
+                    print(f"  ⚠️  Resend failing - pausing sends for {cooldown}s (circuit open)")
+            raise
+
+        with self._circuit_lock:
+            self._send_failures = 0
+            self._circuit_trips = 0
+        return response
+
     def _send_test_email(self, to_email: str) -> bool:
         """
         Send a test email to verify email sending works.
@@ -389,7 +858,7 @@ class SequencerEmailSender:
             True if test email sent successfully
         """
         try:
-            from_header = f"{self.from_name} <{self.from_email}>"
+            from_header = self._from_header
             clean_to = to_email.strip() if to_email else None
 
             if not clean_to:
@@ -397,34 +866,9 @@ class SequencerEmailSender:
                 return False
 
             # Build test email content
-            html_content = """
-            <html>
-            <body style="font-family: Arial, sans-serif; color: #333;">
-            <h2>YapMate Lead Engine - Test Email</h2>
-            <p>This is a test email from the YapMate Lead Engine.</p>
-            <p>If you received this, the email sender is working correctly.</p>
-            <hr style="border: none; border-top: 1px solid #ddd; margin: 20px 0;">
-            <p style="color: #666; font-size: 12px;">
-                Sent at: {timestamp}<br>
-                From: {from_email}
-            </p>
-            </body>
-            </html>
-            """.format(
-                timestamp=datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC"),
-                from_email=self.from_email
-            )
-
-            text_content = f"""
-YapMate Lead Engine - Test Email
-
-This is a test email from the YapMate Lead Engine.
-
-If you received this, the email sender is working correctly.
-
-Sent at: {datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")}
-From: {self.from_email}
-            """.strip()
+            fields = {"timestamp": _utc_timestamp(), "from_email": self.from_email}
+            html_content = _TEST_EMAIL_HTML.substitute(fields)
+            text_content = _TEST_EMAIL_TEXT.substitute(fields)
 
             params = {
                 "from": from_header,
@@ -437,7 +881,7 @@ From: {self.from_email}
             if self.reply_to:
                 params["reply_to"] = self.reply_to
 
-            response = resend.Emails.send(params)
+            response = self._resend_post("/emails", params)
             email_id = response.get("id", "unknown")
             print(f"    Test email sent successfully (ID: {email_id})")
             return True
@@ -446,6 +890,11 @@ From: {self.from_email}
             print(f"    Test email failed: {e}")
             return False
 
+    def refresh_send_gate(self):
+        """Re-read the SEND_ENABLED and DRY_RUN pipeline flags from config."""
+        self._send_enabled, self._send_enabled_reason = self._check_send_enabled()
+        self._pipeline_dry_run = get_config().pipeline.dry_run
+
     def _check_send_enabled(self) -> tuple[bool, str]:
         """
         Check if sending is enabled. Fail-closed logic.
@@ -461,190 +910,278 @@ From: {self.from_email}
 
         return (True, "SEND_ENABLED is true")
 
-    def _get_emails_sent_today(self) -> set:
+    def _get_emails_sent_today(self, ttl: float = 60) -> frozenset:
         """
         Get set of email addresses already sent to today.
 
         This prevents sending duplicate emails to the same address
-        across multiple runs in the same day.
+        across multiple runs in the same day. The result is reused for up
+        to ttl seconds within the same UTC day, and dropped whenever this
+        sender writes to the leads tab.
+
+        Args:
+            ttl: Seconds a cached result stays valid
 
         Returns:
             Set of lowercase email addresses
         """
+        today = _utc_today()
+        now = time.monotonic()
+        if self._sent_today_emails is not None:
+            day, fetched_at, emails_sent = self._sent_today_emails
+            if day == today and now - fetched_at < ttl:
+                return emails_sent
+
+        emails_sent = self._fetch_emails_sent_today(today)
+        if emails_sent is None:
+            return frozenset()  # Read failed - don't cache
+        self._sent_today_emails = (today, now, emails_sent)
+        return emails_sent
+
+    def _fetch_emails_sent_today(self, today: str) -> Optional[frozenset]:
+        """Read today's sent addresses from the sheet (None if the read failed)."""
+
+        # The sends_today tab only adds to the leads scan: it also covers sends
+        # whose lead update has not reached the leads tab yet, but it misses
+        # leads marked SENT outside this sender
         try:
-            # Get all leads with status SENT and sent_at today
-            all_rows = self.sheets.get_leads_tab().get_all_values()
-            if not all_rows:
-                return set()
-
-            headers = all_rows[0]
-            col_status = headers.index("status") if "status" in headers else None
-            col_email = headers.index("email") if "email" in headers else None
-            col_sent_at = headers.index("sent_at") if "sent_at" in headers else None
-
-            if col_status is None or col_email is None:
-                return set()
-
-            today = datetime.utcnow().strftime("%Y-%m-%d")
-            emails_sent = set()
-
-            for row in all_rows[1:]:
-                if len(row) <= max(col_status, col_email):
-                    continue
-
-                status = str(row[col_status]).strip().upper()
-                if status != "SENT":
-                    continue
-
-                # Check if sent today
-                if col_sent_at and len(row) > col_sent_at:
-                    sent_at = str(row[col_sent_at]).strip()
-                    if sent_at and not sent_at.startswith(today):
-                        continue
+            recorded = {email for email, _ in self.sheets.get_sends_on(today)}
+        except Exception as e:
+            print(f"  Warning: Could not read sends_today: {e}")
+            recorded = set()
 
-                email = str(row[col_email]).strip().lower()
-                if email:
-                    emails_sent.add(email)
+        try:
+            # Get all leads with status SENT and sent_at today
+            statuses = self._get_leads_column("status")
+            emails = self._get_leads_column("email")
+            if statuses is None or emails is None:
+                recorded.discard("")
+                return frozenset(recorded)
+
+            # No sent_at column: every SENT lead counts (as before)
+            sent_ats = self._get_leads_column("sent_at") or [""] * len(statuses)
+
+            # Column-wise pass over the snapshot (gspread cells are already str);
+            # a blank sent_at counts as today
+            emails_sent = {
+                email.strip().lower()
+                for status, sent_at, email in zip(statuses, sent_ats, emails)
+                if _is_sent_status(status)
+                and (not sent_at or sent_at.isspace() or _sent_on(sent_at, today))
+            }
+            emails_sent |= recorded
+            emails_sent.discard("")
 
-            return emails_sent
+            return frozenset(emails_sent)
 
         except Exception as e:
             print(f"  Warning: Could not get emails sent today: {e}")
-            return set()
-
-    def sanitize_and_validate_email(self, lead: EnhancedLead) -> tuple[SanitizationResult, StructuredLog]:
+            return None
+
+    def _sanitize(self, email: str) -> SanitizationResult:
+        """sanitize_email() memoized per sender (results are never mutated)."""
+        result = self._sanitize_cache.get(email)
+        if result is None:
+            if len(self._sanitize_cache) >= SANITIZE_CACHE_MAX:
+                self._sanitize_cache.clear()
+            result = self._sanitize_cache[email] = sanitize_email(email)
+        return result
+
+    def sanitize_and_validate_email(
+        self,
+        lead: EnhancedLead,
+        email_lower: Optional[str] = None
+    ) -> tuple[SanitizationResult, StructuredLog]:
         """
         Sanitize and validate lead email.
 
+        Args:
+            lead: Lead whose email to check
+            email_lower: lead.email stripped + lowercased, if the caller has it
+
         Returns:
             Tuple of (sanitization_result, structured_log)
         """
         original_email = lead.email or ""
-        result = sanitize_email(original_email)
+        result = self._sanitize(original_email)
 
         if not result.valid:
-            log = StructuredLog(
-                lead_id=lead.lead_id,
-                status=SendStatus.INVALID,
-                reason=result.reason or "Unknown validation error",
+            log = StructuredLog.for_lead(
+                lead, SendStatus.INVALID, result.reason or "Unknown validation error",
                 email_original=original_email,
-                email_sanitized=None,
-                business_name=lead.business_name,
             )
             return (result, log)
 
         # Check if email was modified during sanitization
-        was_sanitized = result.sanitized != original_email.lower().strip()
-
-        log = StructuredLog(
-            lead_id=lead.lead_id,
-            status=SendStatus.SENT,  # Will be updated later
-            reason="Email valid" + (" (sanitized)" if was_sanitized else ""),
+        if email_lower is None:
+            email_lower = original_email.strip().lower()
+        was_sanitized = result.sanitized != email_lower
+
+        log = StructuredLog.for_lead(
+            lead,
+            SendStatus.SENT,  # Will be updated later
+            "Email valid" + (" (sanitized)" if was_sanitized else ""),
             email_original=original_email,
             email_sanitized=result.sanitized,
-            business_name=lead.business_name,
         )
 
         return (result, log)
 
-    def send_email(self, lead: EnhancedLead, dry_run: bool = False) -> tuple[SendResult, StructuredLog]:
+    # =========================================================================
+    # BATCHED SHEET WRITES
+    # =========================================================================
+
+    def _queue_lead_update(
+        self,
+        lead_id: str,
+        status: str,
+        sent_at: Any = None,
+        resend_id: Optional[str] = None,
+        eligibility_reason: Optional[str] = None,
+    ):
+        """
+        Queue a lead status update for the next flush_updates().
+
+        Args:
+            lead_id: Lead ID to update
+            status: New status
+            sent_at: Send time (datetime or ISO string)
+            resend_id: Resend email ID
+            eligibility_reason: Reason to record on the lead
         """
-        Send an email to a single lead with sanitization.
+        pending = self._pending_updates
+        self._pending_lead_ids.append(lead_id)
+        pending["status"].append(status)
+        pending["sent_at"].append(sent_at)
+        pending["resend_id"].append(resend_id)
+        pending["eligibility_reason"].append(eligibility_reason)
+
+    def flush_updates(self, record_sends: bool = True) -> int:
+        """
+        Write all queued lead updates to the sheet in a single API call.
 
-        Pipeline: lead.email → sanitize_email() → validate → send
+        Falls back to individual writes with delays if the batch write fails.
 
         Args:
-            lead: Lead to send email to
-            dry_run: If True, validate but don't actually send
+            record_sends: Also append queued sends to the sends_today tab
+                (one append per flush). If False they stay queued for the
+                next flush - the lead update already records the send
 
         Returns:
-            Tuple of (SendResult, StructuredLog)
+            Number of leads updated by the batch write
         """
-        config = get_config()
+        if record_sends and self._pending_sends:
+            self._record_sends()
 
-        # Step 1: Check if sending is enabled (fail-closed)
-        send_enabled, enable_reason = self._check_send_enabled()
+        queued_ids, self._pending_lead_ids = self._pending_lead_ids, []
+        queued, self._pending_updates = self._pending_updates, {field: [] for field in UPDATE_FIELDS}
+        if not queued_ids:
+            return 0
 
-        if not send_enabled and not dry_run:
-            log = StructuredLog(
-                lead_id=lead.lead_id,
-                status=SendStatus.BLOCKED,
-                reason=enable_reason,
-                email_original=lead.email or "",
-                email_sanitized=None,
-                business_name=lead.business_name,
-            )
-            return (SendResult(
-                lead_id=lead.lead_id,
-                success=False,
-                status=SendStatus.BLOCKED,
-                error=enable_reason,
-                email_original=lead.email,
-            ), log)
+        # Coalesce repeats for the same (lead_id, status) - later non-empty
+        # fields win
+        lead_ids: List[str] = []
+        columns: Dict[str, List[Any]] = {field: [] for field in UPDATE_FIELDS}
+        position: Dict[tuple, int] = {}
+        for i, (lead_id, status) in enumerate(zip(queued_ids, queued["status"])):
+            key = (lead_id, status)
+            j = position.get(key)
+            if j is None:
+                position[key] = len(lead_ids)
+                lead_ids.append(lead_id)
+                for field in UPDATE_FIELDS:
+                    columns[field].append(queued[field][i])
+            else:
+                for field in UPDATE_FIELDS:
+                    value = queued[field][i]
+                    if value is not None:
+                        columns[field][j] = value
 
-        # Step 2: Check if email exists
-        if not lead.email:
-            log = StructuredLog(
-                lead_id=lead.lead_id,
-                status=SendStatus.INVALID,
-                reason="No email address",
-                email_original="",
-                email_sanitized=None,
-                business_name=lead.business_name,
-            )
-            return (SendResult(
-                lead_id=lead.lead_id,
-                success=False,
-                status=SendStatus.INVALID,
-                error="No email address",
-                email_original="",
-            ), log)
+        updated = 0
+        print(f"\n  Batch updating {len(lead_ids)} leads (single API call)...")
+        try:
+            updated = self.sheets.batch_update_leads_columns(lead_ids, columns)
+            print(f"  Successfully updated {updated} leads")
+        except Exception as batch_err:
+            print(f"  WARNING: Batch update failed: {batch_err}")
+            print(f"  Will retry with delays...")
+            # Fallback: individual updates with long delays
+            for j, lead_id in enumerate(lead_ids):
+                try:
+                    self.sheets.update_lead_status(
+                        lead_id,
+                        columns["status"][j],
+                        **{
+                            field: columns[field][j] for field in UPDATE_FIELDS[1:]
+                            if columns[field][j] is not None
+                        }
+                    )
+                    if j < len(lead_ids) - 1:
+                        time.sleep(2)  # 2 second delay between writes
+                except Exception as inner_err:
+                    print(f"  Failed to update {lead_id}: {inner_err}")
+
+        # Leads tab has been written - next read must not use the old snapshot
+        self.invalidate_leads_snapshot()
+        return updated
+
+    def _record_sends(self):
+        """Append queued sends to sends_today, pruning earlier days once per UTC day."""
+        sends, self._pending_sends = self._pending_sends, []
+
+        today = _utc_today()
+        if self._sends_pruned_on != today:
+            # Marked before trying - a failing prune isn't retried every flush
+            self._sends_pruned_on = today
+            try:
+                self.sheets.prune_sends_before(today)
+            except Exception as e:
+                print(f"  Warning: Could not prune sends_today: {e}")
 
-        # Step 3: Sanitize and validate email
-        sanitization, log = self.sanitize_and_validate_email(lead)
+        try:
+            self.sheets.append_sends_today(sends)
+        except Exception as e:
+            print(f"  Warning: Could not record sends_today rows: {e}")
 
-        if not sanitization.valid:
-            # Mark as INVALID in sheets
-            self.sheets.update_lead_status(
-                lead.lead_id,
-                "INVALID",
-                eligibility_reason=sanitization.reason
-            )
-            return (SendResult(
-                lead_id=lead.lead_id,
-                success=False,
-                status=SendStatus.INVALID,
-                error=sanitization.reason,
-                email_original=lead.email,
-            ), log)
+    def send_email(
+        self,
+        lead: EnhancedLead,
+        dry_run: bool = False,
+        flush: bool = True
+    ) -> tuple[SendResult, StructuredLog]:
+        """
+        Send an email to a single lead with sanitization.
 
-        # Use sanitized email
-        clean_email = sanitization.sanitized
+        Pipeline: lead.email → sanitize_email() → validate → send
 
-        # Step 4: Check eligibility
-        if not lead.send_eligible:
-            log.status = SendStatus.BLOCKED
-            log.reason = f"Not eligible: {lead.eligibility_reason}"
-            return (SendResult(
-                lead_id=lead.lead_id,
-                success=False,
-                status=SendStatus.BLOCKED,
-                error=f"Not eligible: {lead.eligibility_reason}",
-                email_original=lead.email,
-                email_sanitized=clean_email,
-            ), log)
+        Args:
+            lead: Lead to send email to
+            dry_run: If True, validate but don't actually send
+            flush: If True, write the lead's status update immediately (one
+                   write - its sends_today row waits for the next full
+                   flush_updates()); otherwise leave it queued
 
-        # Step 5: Dry run check
-        if dry_run or config.pipeline.dry_run:
-            log.status = SendStatus.BLOCKED
-            log.reason = "Dry run mode - email validated but not sent"
-            return (SendResult(
-                lead_id=lead.lead_id,
-                success=True,  # Validation passed
-                status=SendStatus.BLOCKED,
-                email_original=lead.email,
-                email_sanitized=clean_email,
-            ), log)
+        Returns:
+            Tuple of (SendResult, StructuredLog)
+        """
+        try:
+            return self._send_email(lead, dry_run=dry_run)
+        finally:
+            if flush:
+                self.flush_updates(record_sends=False)
+
+    def _send_email(self, lead: EnhancedLead, dry_run: bool = False) -> tuple[SendResult, StructuredLog]:
+        """Send an email to a single lead, queueing its status update."""
+        result, log, clean_email = self._prepare_send(lead, dry_run=dry_run)
+        if result is not None:
+            if result.status == SendStatus.INVALID and lead.email:
+                # Mark as INVALID in sheets
+                self._queue_lead_update(
+                    lead.lead_id,
+                    "INVALID",
+                    eligibility_reason=result.error
+                )
+            return (result, log)
 
         # Step 6: Actually send the email
         try:
@@ -652,39 +1189,31 @@ From: {self.from_email}
             subject, html_body, text_body = self.generate_email(lead)
 
             # Log CTA link URL for deliverability verification
-            from src.templates import APP_STORE_URL
-            print(f"  → CTA Link URL: {APP_STORE_URL}")
+            if self.config.verbose_send_logging:
+                print(f"  → CTA Link URL: {APP_STORE_URL}")
 
             # Prepare send parameters (use sanitized email)
-            params = {
-                "from": f"{self.from_name} <{self.from_email}>",
-                "to": [clean_email],
-                "subject": subject,
-                "html": html_body,
-                "text": text_body,
-                "headers": {
-                    "List-Unsubscribe": "<https://www.yapmate.co.uk/unsubscribe>",
-                    "List-Unsubscribe-Post": "List-Unsubscribe=One-Click"
-                }
-            }
-
-            if self.reply_to:
-                params["reply_to"] = self.reply_to
+            params = self._build_send_params(clean_email, subject, html_body, text_body)
 
             # Send via Resend
-            response = resend.Emails.send(params)
+            response = self._send_via_resend(params)
             email_id = response.get("id", "unknown")
 
             # Log Resend email ID for verification
-            print(f"  ✓ Resend email ID: {email_id}")
+            if self.config.verbose_send_logging:
+                print(f"  ✓ Resend email ID: {email_id}")
 
             # Update lead status with Resend ID
-            self.sheets.update_lead_status(
+            sent_at = datetime.utcnow()
+            self._queue_lead_update(
                 lead.lead_id,
                 "SENT",
-                sent_at=datetime.utcnow(),
+                sent_at=sent_at,
                 resend_id=email_id  # Store Resend email ID for tracking
             )
+            self._pending_sends.append(
+                [lead.lead_id, lead.email.strip().lower(), sent_at.isoformat()]
+            )
 
             log.status = SendStatus.SENT
             log.reason = f"Email sent successfully (Resend ID: {email_id})"
@@ -700,7 +1229,7 @@ From: {self.from_email}
 
         except Exception as e:
             # Update lead status to FAILED
-            self.sheets.update_lead_status(
+            self._queue_lead_update(
                 lead.lead_id,
                 "FAILED",
                 eligibility_reason=str(e)
@@ -718,74 +1247,57 @@ From: {self.from_email}
                 email_sanitized=clean_email,
             ), log)
 
-    def send_email_no_sheet_write(self, lead: EnhancedLead, dry_run: bool = False) -> tuple[SendResult, StructuredLog]:
+    def _prepare_send(
+        self,
+        lead: EnhancedLead,
+        dry_run: bool = False,
+        email_lower: Optional[str] = None
+    ) -> tuple[Optional[SendResult], StructuredLog, Optional[str]]:
         """
-        Send an email to a single lead WITHOUT writing to sheets.
-
-        This is used by send_batch() which collects all updates and
-        writes them in a single batch at the end to avoid rate limits.
-
-        Pipeline: lead.email → sanitize_email() → validate → send
+        Run the pre-send checks for a lead (steps 1-5 of the send pipeline).
 
         Args:
             lead: Lead to send email to
             dry_run: If True, validate but don't actually send
+            email_lower: lead.email stripped + lowercased, if the caller has it
 
         Returns:
-            Tuple of (SendResult, StructuredLog)
+            Tuple of (final_result, log, clean_email). final_result is None
+            when the lead passed every check and should be sent to clean_email.
         """
-        config = get_config()
-
-        # Step 1: Check if sending is enabled (fail-closed)
-        send_enabled, enable_reason = self._check_send_enabled()
-
-        if not send_enabled and not dry_run:
-            log = StructuredLog(
-                lead_id=lead.lead_id,
-                status=SendStatus.BLOCKED,
-                reason=enable_reason,
-                email_original=lead.email or "",
-                email_sanitized=None,
-                business_name=lead.business_name,
-            )
+        # Step 1: Check if sending is enabled (fail-closed, resolved at init)
+        if not self._send_enabled and not dry_run:
+            log = StructuredLog.for_lead(lead, SendStatus.BLOCKED, self._send_enabled_reason)
             return (SendResult(
                 lead_id=lead.lead_id,
                 success=False,
                 status=SendStatus.BLOCKED,
-                error=enable_reason,
+                error=self._send_enabled_reason,
                 email_original=lead.email,
-            ), log)
+            ), log, None)
 
         # Step 2: Check if email exists
         if not lead.email:
-            log = StructuredLog(
-                lead_id=lead.lead_id,
-                status=SendStatus.INVALID,
-                reason="No email address",
-                email_original="",
-                email_sanitized=None,
-                business_name=lead.business_name,
-            )
+            log = StructuredLog.for_lead(lead, SendStatus.INVALID, "No email address", email_original="")
             return (SendResult(
                 lead_id=lead.lead_id,
                 success=False,
                 status=SendStatus.INVALID,
                 error="No email address",
                 email_original="",
-            ), log)
+            ), log, None)
 
         # Step 3: Sanitize and validate email
-        sanitization, log = self.sanitize_and_validate_email(lead)
+        sanitization, log = self.sanitize_and_validate_email(lead, email_lower)
 
         if not sanitization.valid:
-            # NO sheet write - caller handles this in batch
             return (SendResult(
                 lead_id=lead.lead_id,
                 success=False,
                 status=SendStatus.INVALID,
                 error=sanitization.reason,
                 email_original=lead.email,
-            ), log)
+            ), log, None)
 
         # Use sanitized email
         clean_email = sanitization.sanitized
@@ -801,10 +1313,10 @@ From: {self.from_email}
                 error=f"Not eligible: {lead.eligibility_reason}",
                 email_original=lead.email,
                 email_sanitized=clean_email,
-            ), log)
+            ), log, None)
 
         # Step 5: Dry run check
-        if dry_run or config.pipeline.dry_run:
+        if dry_run or self._pipeline_dry_run:
             log.status = SendStatus.BLOCKED
             log.reason = "Dry run mode - email validated but not sent"
             return (SendResult(
@@ -813,39 +1325,87 @@ From: {self.from_email}
                 status=SendStatus.BLOCKED,
                 email_original=lead.email,
                 email_sanitized=clean_email,
-            ), log)
+            ), log, None)
 
-        # Step 6: Actually send the email
+        return (None, log, clean_email)
+
+    def send_email_no_sheet_write(self, lead: EnhancedLead, dry_run: bool = False) -> tuple[SendResult, StructuredLog]:
+        """
+        Send an email to a single lead WITHOUT writing to sheets.
+
+        This is used by send_batch() which collects all updates and
+        writes them in a single batch at the end to avoid rate limits.
+
+        Pipeline: lead.email → sanitize_email() → validate → send
+
+        Args:
+            lead: Lead to send email to
+            dry_run: If True, validate but don't actually send
+
+        Returns:
+            Tuple of (SendResult, StructuredLog)
+        """
+        result, log, clean_email = self._prepare_send(lead, dry_run=dry_run)
+        if result is not None:
+            # NO sheet write - caller handles this in batch
+            return (result, log)
+
+        return self._deliver(lead, log, clean_email)
+
+    def submit_send(self, lead: EnhancedLead, dry_run: bool = False) -> Future:
+        """
+        Start sending an email to a single lead WITHOUT writing to sheets.
+
+        Pre-send checks run immediately; the Resend request runs on the
+        sender's worker pool.
+
+        Args:
+            lead: Lead to send email to
+            dry_run: If True, validate but don't actually send
+
+        Returns:
+            Future resolving to (SendResult, StructuredLog)
+        """
+        result, log, clean_email = self._prepare_send(lead, dry_run=dry_run)
+        if result is not None:
+            future = Future()
+            future.set_result((result, log))
+            return future
+
+        return self._get_io_executor().submit(self._deliver, lead, log, clean_email)
+
+    def _get_io_executor(self) -> ThreadPoolExecutor:
+        """The Resend worker pool, started on first use."""
+        if self._io_executor is None:
+            self._io_executor = ThreadPoolExecutor(max_workers=8)
+        return self._io_executor
+
+    def close(self):
+        """Shut down the Resend worker pool, waiting for in-flight sends."""
+        if self._io_executor is not None:
+            self._io_executor.shutdown(wait=True)
+            self._io_executor = None
+
+    def _deliver(self, lead: EnhancedLead, log: StructuredLog, clean_email: str) -> tuple[SendResult, StructuredLog]:
+        """Send a lead's email via Resend (step 6) - no sheet writes."""
         try:
             # Generate email content (subject + body from same template)
             subject, html_body, text_body = self.generate_email(lead)
 
             # Log CTA link URL for deliverability verification
-            from src.templates import APP_STORE_URL
-            print(f"  → CTA Link URL: {APP_STORE_URL}")
+            if self.config.verbose_send_logging:
+                print(f"  → CTA Link URL: {APP_STORE_URL}")
 
             # Prepare send parameters (use sanitized email)
-            params = {
-                "from": f"{self.from_name} <{self.from_email}>",
-                "to": [clean_email],
-                "subject": subject,
-                "html": html_body,
-                "text": text_body,
-                "headers": {
-                    "List-Unsubscribe": "<https://www.yapmate.co.uk/unsubscribe>",
-                    "List-Unsubscribe-Post": "List-Unsubscribe=One-Click"
-                }
-            }
-
-            if self.reply_to:
-                params["reply_to"] = self.reply_to
+            params = self._build_send_params(clean_email, subject, html_body, text_body)
 
             # Send via Resend
-            response = resend.Emails.send(params)
+            response = self._send_via_resend(params)
             email_id = response.get("id", "unknown")
 
             # Log Resend email ID for verification
-            print(f"  ✓ Resend email ID: {email_id}")
+            if self.config.verbose_send_logging:
+                print(f"  ✓ Resend email ID: {email_id}")
 
             # NO sheet write - caller handles this in batch
 
@@ -876,25 +1436,201 @@ From: {self.from_email}
                 email_sanitized=clean_email,
             ), log)
 
-    def _log_eligibility_breakdown(self) -> Dict[str, Any]:
+    def send_emails_batch(
+        self,
+        leads: List[EnhancedLead],
+        dry_run: bool = False,
+        chunk_size: int = 100
+    ) -> List[tuple[SendResult, StructuredLog]]:
+        """
+        Send emails to many leads via Resend's batch endpoint, WITHOUT writing to sheets.
+
+        Runs the same pre-send checks as send_email_no_sheet_write() for every
+        lead, then sends the passing emails in chunks of up to chunk_size
+        (Resend accepts at most 100 per call) - one HTTP request per chunk
+        instead of one per lead. There is no pacing between emails.
+
+        Args:
+            leads: Leads to send email to
+            dry_run: If True, validate but don't actually send
+            chunk_size: Emails per batch request (max 100)
+
+        Returns:
+            List of (SendResult, StructuredLog), in the same order as leads
+        """
+        outcomes: List[Optional[tuple[SendResult, StructuredLog]]] = [None] * len(leads)
+        ready = []  # (index, (lead, log, clean_email))
+
+        for i, lead in enumerate(leads):
+            result, log, clean_email = self._prepare_send(lead, dry_run=dry_run)
+            if result is not None:
+                outcomes[i] = (result, log)
+            else:
+                ready.append((i, (lead, log, clean_email)))
+
+        delivered = self._deliver_batch([item for _, item in ready], chunk_size=chunk_size)
+        for (i, _), outcome in zip(ready, delivered):
+            outcomes[i] = outcome
+
+        return outcomes
+
+    def _deliver_batch(
+        self,
+        items: List[Tuple[EnhancedLead, StructuredLog, str]],
+        chunk_size: int = 100
+    ) -> List[tuple[SendResult, StructuredLog]]:
+        """
+        Send checked leads via Resend's batch endpoint (step 6) - no sheet writes.
+
+        Args:
+            items: (lead, log, clean_email) for leads that passed _prepare_send()
+            chunk_size: Emails per batch request (max 100)
+
+        Returns:
+            List of (SendResult, StructuredLog), in the same order as items
+        """
+        outcomes: List[Optional[tuple[SendResult, StructuredLog]]] = [None] * len(items)
+        ready = []  # (index, lead, log, clean_email, params)
+
+        for i, (lead, log, clean_email) in enumerate(items):
+            try:
+                subject, html_body, text_body = self.generate_email(lead)
+            except Exception as e:
+                log.status = SendStatus.FAILED
+                log.reason = f"Send failed: {str(e)}"
+                outcomes[i] = (SendResult(
+                    lead_id=lead.lead_id,
+                    success=False,
+                    status=SendStatus.FAILED,
+                    error=str(e),
+                    email_original=lead.email,
+                    email_sanitized=clean_email,
+                ), log)
+                continue
+
+            params = self._build_send_params(clean_email, subject, html_body, text_body)
+            ready.append((i, lead, log, clean_email, params))
+
+        # Group identical content (same subject/html/text) so each bucket goes
+        # out in as few batch requests as possible; one message per recipient
+        # so addresses are never exposed to each other. Results map back by index.
+        buckets: Dict[tuple, list] = {}
+        for item in ready:
+            params = item[4]
+            buckets.setdefault((params["subject"], params["html"], params["text"]), []).append(item)
+
+        chunk_size = max(1, min(chunk_size, 100))
+        for chunk in self._chunk_buckets(buckets.values(), chunk_size):
+            try:
+                response = self._send_via_resend([item[4] for item in chunk], path="/emails/batch")
+                # API returns {"data": [{"id": ...}, ...]} (one entry per email, in order)
+                data = response.get("data", []) if isinstance(response, dict) else response
+                email_ids = [entry.get("id", "unknown") for entry in data]
+                error = None
+            except Exception as e:
+                email_ids = []
+                error = str(e)
+
+            print(f"  ✓ Resend batch: {len(email_ids)}/{len(chunk)} accepted")
+
+            for j, (i, lead, log, clean_email, _) in enumerate(chunk):
+                if j < len(email_ids):
+                    email_id = email_ids[j]
+                    log.status = SendStatus.SENT
+                    log.reason = f"Email sent successfully (Resend ID: {email_id})"
+                    outcomes[i] = (SendResult(
+                        lead_id=lead.lead_id,
+                        success=True,
+                        status=SendStatus.SENT,
+                        email_id=email_id,
+                        email_original=lead.email,
+                        email_sanitized=clean_email,
+                    ), log)
+                else:
+                    reason = error or "Missing id in batch response"
+                    log.status = SendStatus.FAILED
+                    log.reason = f"Send failed: {reason}"
+                    outcomes[i] = (SendResult(
+                        lead_id=lead.lead_id,
+                        success=False,
+                        status=SendStatus.FAILED,
+                        error=reason,
+                        email_original=lead.email,
+                        email_sanitized=clean_email,
+                    ), log)
+
+        return outcomes
+
+    def _dispatch_batch(self, pending: List[Tuple[EnhancedLead, StructuredLog, str, Future]]):
+        """Send pending (lead, log, clean_email, future) via _deliver_batch() and resolve the futures."""
+        delivered = self._deliver_batch([item[:3] for item in pending])
+        for (_, _, _, future), outcome in zip(pending, delivered):
+            future.set_result(outcome)
+        pending.clear()
+
+    @staticmethod
+    def _abandon_batch(pending: List[Tuple[EnhancedLead, StructuredLog, str, Future]], reason: str):
+        """Resolve pending batch futures as FAILED without sending anything."""
+        for lead, log, clean_email, future in pending:
+            log.status = SendStatus.FAILED
+            log.reason = f"Send failed: {reason}"
+            future.set_result((SendResult(
+                lead_id=lead.lead_id,
+                success=False,
+                status=SendStatus.FAILED,
+                error=reason,
+                email_original=lead.email,
+                email_sanitized=clean_email,
+            ), log))
+        pending.clear()
+
+    @staticmethod
+    def _chunk_buckets(buckets, chunk_size: int):
+        """Yield chunks of up to chunk_size items, keeping each bucket contiguous."""
+        items = itertools.chain.from_iterable(buckets)
+        while True:
+            chunk = list(itertools.islice(items, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def _log_eligibility_breakdown(self, all_leads: Optional[List[EnhancedLead]] = None) -> Dict[str, Any]:
         """
         Compute and log eligibility breakdown (counts only, no PII).
 
+        Args:
+            all_leads: Leads already fetched by the caller (skips a sheet read)
+
         Returns:
             Dictionary with breakdown statistics
         """
-        print("\n" + "=" * 70)
-        print("ELIGIBILITY BREAKDOWN")
-        print("=" * 70)
-
         # Get all leads
-        all_leads = self.sheets.get_all_leads(limit=10000)
+        if all_leads is None:
+            all_leads = self.sheets.get_all_leads(limit=ELIGIBILITY_SCAN_LIMIT)
         total_leads = len(all_leads)
 
-        print(f"  Total leads: {total_leads}")
-
-        # Count by status
-        status_counts = {}
+        # One pass over the leads: reduce each to its (status, has_email,
+        # valid_email, send_eligible) profile. 10k leads collapse to a handful
+        # of distinct profiles, so every counter below is derived from those.
+        profiles: Counter = Counter()
+        # Raw sheet status -> canonical upper-case string, shared by every
+        # lead with that status (a few distinct values across 10k leads)
+        canonical_status: Dict[Optional[str], str] = {}
+        for lead in all_leads:
+            email = lead.email
+            has_email = bool(email and email.strip())
+            status = canonical_status.get(lead.status)
+            if status is None:
+                status = canonical_status[lead.status] = sys.intern((lead.status or "UNKNOWN").upper())
+            profiles[(
+                status,
+                has_email,
+                has_email and self._sanitize(email).valid,
+                bool(lead.send_eligible),
+            )] += 1
+
+        # Status histogram (Counter sums in C; profiles share few statuses)
+        status_counts: Counter = Counter()
         approved_count = 0
         approved_not_sent_count = 0
         has_email_count = 0
@@ -902,96 +1638,78 @@ From: {self.from_email}
         send_eligible_count = 0
         final_eligible_count = 0
 
-        # Reasons for ineligibility (for top reasons)
-        reason_counts = {
-            "No email address": 0,
-            "Already sent": 0,
-            "Invalid email": 0,
-            "Not approved (status)": 0,
-            "send_eligible = False": 0,
-            "Not eligible (other)": 0,
-        }
+        # Reasons for ineligibility (for top reasons), tallied below
+        reason_tally: Counter = Counter()
 
-        for lead in all_leads:
-            # Count by status
-            status = (lead.status or "UNKNOWN").upper()
-            status_counts[status] = status_counts.get(status, 0) + 1
-
-            # Approved count
+        for (status, has_email, valid_email, send_eligible), n in profiles.items():
+            status_counts[status] += n
             if status == "APPROVED":
-                approved_count += 1
-                if status != "SENT":
-                    approved_not_sent_count += 1
-
-            # Email checks
-            has_email = bool(lead.email and lead.email.strip())
+                approved_count += n
+                approved_not_sent_count += n
             if has_email:
-                has_email_count += 1
-
-                # Sanitize and validate
-                sanitization = sanitize_email(lead.email)
-                if sanitization.valid:
-                    valid_email_count += 1
-
-            # Send eligible check
-            if getattr(lead, 'send_eligible', False):
-                send_eligible_count += 1
+                has_email_count += n
+            if valid_email:
+                valid_email_count += n
+            if send_eligible:
+                send_eligible_count += n
 
             # Final eligibility check (all criteria must pass)
-            is_eligible = (
-                status in ("NEW", "APPROVED") and
-                has_email and
-                getattr(lead, 'send_eligible', False)
-            )
-            
-            if is_eligible:
-                # Double-check email is valid
-                if has_email:
-                    sanitization = sanitize_email(lead.email)
-                    if sanitization.valid:
-                        final_eligible_count += 1
-                    else:
-                        reason_counts["Invalid email"] += 1
+            new_or_approved = status in NEW_OR_APPROVED
+            if new_or_approved and has_email and send_eligible:
+                if valid_email:
+                    final_eligible_count += n
                 else:
-                    reason_counts["No email address"] += 1
+                    reason_tally["Invalid email"] += n
             else:
                 # Track reasons for ineligibility
-                if status == "SENT":
-                    reason_counts["Already sent"] += 1
-                elif not has_email:
-                    reason_counts["No email address"] += 1
-                elif status not in ("NEW", "APPROVED"):
-                    reason_counts["Not approved (status)"] += 1
-                elif not getattr(lead, 'send_eligible', False):
-                    reason_counts["send_eligible = False"] += 1
-                else:
-                    reason_counts["Not eligible (other)"] += 1
-
-        # Log breakdown
-        print(f"\n  By status:")
-        for status in sorted(status_counts.keys()):
-            print(f"    {status}: {status_counts[status]}")
-
-        print(f"\n  Approved: {approved_count}")
-        print(f"  Approved + not sent: {approved_not_sent_count}")
-        print(f"  Has email: {has_email_count}")
-        print(f"  Valid email (sanitized): {valid_email_count}")
-        print(f"  send_eligible = True: {send_eligible_count}")
-        print(f"  Final eligible (status=APPROVED + has_email + send_eligible=True + valid_email): {final_eligible_count}")
+                bits = (
+                    (status == "SENT") << 3
+                    | (not has_email) << 2
+                    | (not new_or_approved) << 1
+                    | (not send_eligible)
+                )
+                reason_tally[_INELIGIBLE_REASONS[bits]] += n
+
+        # Every reason listed, zeros included, in the usual order
+        reason_counts = {reason: reason_tally[reason] for reason in REASON_KEYS}
+
+        # Log breakdown - built up and written in one go
+        out = [
+            "",
+            "=" * 70,
+            "ELIGIBILITY BREAKDOWN",
+            "=" * 70,
+            f"  Total leads: {total_leads}",
+            "",
+            "  By status:",
+        ]
+        for status in sorted(status_counts):
+            out.append(f"    {status}: {status_counts[status]}")
+
+        out += [
+            "",
+            f"  Approved: {approved_count}",
+            f"  Approved + not sent: {approved_not_sent_count}",
+            f"  Has email: {has_email_count}",
+            f"  Valid email (sanitized): {valid_email_count}",
+            f"  send_eligible = True: {send_eligible_count}",
+            f"  Final eligible (status=APPROVED + has_email + send_eligible=True + valid_email): {final_eligible_count}",
+        ]
 
         # If 0 eligible, show top reasons
         if final_eligible_count == 0:
-            print(f"\n  TOP REASONS (counts only, no PII):")
+            out += ["", "  TOP REASONS (counts only, no PII):"]
             sorted_reasons = sorted(reason_counts.items(), key=lambda x: x[1], reverse=True)
             for i, (reason, count) in enumerate(sorted_reasons[:3], 1):
                 if count > 0:
-                    print(f"    {i}. {reason}: {count}")
+                    out.append(f"    {i}. {reason}: {count}")
 
-        print("=" * 70)
+        out.append("=" * 70)
+        print("\n".join(out))
 
         return {
             "total_leads": total_leads,
-            "status_counts": status_counts,
+            "status_counts": dict(status_counts),
             "approved_count": approved_count,
             "approved_not_sent_count": approved_not_sent_count,
             "has_email_count": has_email_count,
@@ -1027,21 +1745,17 @@ From: {self.from_email}
         print("\n" + "=" * 70)
         print("EMAIL SENDER - STRUCTURED PIPELINE")
         print("=" * 70)
-        print(f"  Timestamp: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}")
+        print(f"  Timestamp: {_utc_timestamp()}")
 
         # =====================================================================
         # SIMPLIFIED GATE CHAIN - Only SEND_ENABLED matters
         # =====================================================================
 
         # Gate 1: SEND_ENABLED (fail-closed) - the only gate that matters
-        send_enabled, enable_reason = self._check_send_enabled()
-
-        # Get runner state for logging (but don't use sheet_paused to block)
-        state = self.sheets.get_runner_state()
+        send_enabled, enable_reason = self._send_enabled, self._send_enabled_reason
 
         # Force run from env or parameter
-        force_run_env = os.getenv("FORCE_RUN", "false").lower() == "true"
-        force_run = force_run or force_run_env
+        force_run = force_run or self._force_run_env
 
         # Calculate effective dry run
         effective_dry_run = dry_run or config.pipeline.dry_run or not send_enabled
@@ -1054,13 +1768,15 @@ From: {self.from_email}
         if not send_enabled:
             block_reason = f"SEND_ENABLED is not 'true' - sending blocked"
 
-        # Print simplified gate status
-        print(f"\n  GATE CHECKS:")
-        print(f"    SEND_ENABLED: {send_enabled} ({enable_reason})")
-        print(f"    FORCE_RUN: {force_run}")
-        print(f"    DRY_RUN: {config.pipeline.dry_run}")
-        print(f"    EFFECTIVE MODE: {'DRY RUN' if effective_dry_run else 'LIVE SEND'}")
-        print(f"    SEND_ALLOWED: {send_allowed}")
+        # Print simplified gate status (one write)
+        print(
+            f"\n  GATE CHECKS:\n"
+            f"    SEND_ENABLED: {send_enabled} ({enable_reason})\n"
+            f"    FORCE_RUN: {force_run}\n"
+            f"    DRY_RUN: {config.pipeline.dry_run}\n"
+            f"    EFFECTIVE MODE: {'DRY RUN' if effective_dry_run else 'LIVE SEND'}\n"
+            f"    SEND_ALLOWED: {send_allowed}"
+        )
 
         if block_reason:
             print(f"\n  ⚠️  BLOCKED: {block_reason}")
@@ -1094,8 +1810,10 @@ From: {self.from_email}
             daily_limit = self.config.daily_limit
             print(f"    → Warmup BYPASSED - using DAILY_LIMIT: {daily_limit}")
 
-        # Calculate remaining quota (uses actual sheet count, not state counter)
-        remaining_quota = self.get_remaining_daily_quota()
+        # Calculate remaining quota (uses actual sheet count, not state counter).
+        # The count is read once here; the send loop tracks it locally.
+        self._sent_today_local = self._count_emails_sent_today()
+        remaining_quota = self.get_remaining_daily_quota(sent_today=self._sent_today_local)
         print(f"    Remaining quota: {remaining_quota}")
 
         # Get sending limits from config
@@ -1106,7 +1824,7 @@ From: {self.from_email}
 
         if remaining_quota <= 0 and not effective_dry_run:
             print("\n  ⚠️  BLOCKED: Daily limit reached")
-            print(f"      Daily limit: {daily_limit}, Sent today: {state.emails_sent_today}")
+            print(f"      Daily limit: {daily_limit}, Sent today: {self._sent_today_local}")
             return SendBatchResult(
                 total_attempted=0,
                 total_sent=0,
@@ -1120,8 +1838,7 @@ From: {self.from_email}
             )
 
         # Check for LIVE_SEND_TEST_MODE (send exactly 1 email for testing)
-        test_mode = os.getenv("LIVE_SEND_TEST_MODE", "false").lower() == "true"
-        if test_mode:
+        if self._live_send_test_mode:
             print(f"\n  🧪 LIVE_SEND_TEST_MODE: ENABLED (will send exactly 1 email)")
             send_limit = 1
         else:
@@ -1133,12 +1850,35 @@ From: {self.from_email}
 
         print(f"  Will process up to: {send_limit}")
 
-        # Log eligibility breakdown BEFORE fetching
-        breakdown = self._log_eligibility_breakdown()
+        # Nothing to send (e.g. SEND_LIMIT_PER_RUN=0) - skip the leads scan
+        if send_limit <= 0 and not effective_dry_run:
+            print("\n  ⚠️  BLOCKED: Send limit is 0")
+            return SendBatchResult(
+                total_attempted=0,
+                total_sent=0,
+                total_failed=0,
+                total_blocked=0,
+                total_invalid=0,
+                total_sanitized=0,
+                results=[],
+                logs=[],
+                stopped_reason="Send limit is 0"
+            )
+
+        # One leads read serves both the breakdown and the eligible list
+        all_leads = self.sheets.get_all_leads(limit=ELIGIBILITY_SCAN_LIMIT)
+
+        # Log eligibility breakdown BEFORE selecting
+        breakdown = self._log_eligibility_breakdown(all_leads)
 
         # Get eligible leads
         print(f"\n  Fetching eligible leads...")
-        leads = self.sheets.get_eligible_leads(limit=send_limit)
+        if len(all_leads) < ELIGIBILITY_SCAN_LIMIT:
+            # Reuses the breakdown's sanitize results
+            leads = self.sheets.select_eligible_leads(all_leads, limit=send_limit, sanitize=self._sanitize)
+        else:
+            # Breakdown read was capped - eligible leads may lie beyond it
+            leads = self.sheets.get_eligible_leads(limit=send_limit)
         print(f"  Found {len(leads)} eligible leads")
 
         # Sort by sole trader score (highest first) to prioritize small businesses
@@ -1163,7 +1903,7 @@ From: {self.from_email}
                 if count > 0:
                     print(f"        {i}. {reason}: {count}")
             # Check for TEST_EMAIL fallback
-            test_email = os.getenv("TEST_EMAIL", "").strip()
+            test_email = self._test_email
             if test_email and not effective_dry_run:
                 print(f"\n  No eligible leads, but TEST_EMAIL is set: {test_email}")
                 print(f"  Sending test email...")
@@ -1200,8 +1940,6 @@ From: {self.from_email}
         # Process leads with structured logging
         # IMPORTANT: We collect ALL status updates and batch them at the end
         # to avoid hitting Google Sheets 60 writes/minute quota
-        results = []
-        logs = []
         sent_count = 0
         failed_count = 0
         blocked_count = 0
@@ -1209,15 +1947,18 @@ From: {self.from_email}
         sanitized_count = 0
         skipped_count = 0
         duplicate_count = 0
+        stopped_reason = None
 
-        # Collect status updates for batch write at end
-        pending_updates = []
+        # Why leads were rejected (for the summary) - rejects are queued for
+        # the batch write like everything else, never written per-lead
+        rejection_counts = Counter()
 
         # CRITICAL: Track emails already sent in this batch to prevent duplicates
         # This catches cases where multiple leads have the same email address
         emails_sent_this_batch = set()
 
-        # Also get emails already sent today (from previous runs)
+        # Also get emails already sent today (from previous runs) - fetched
+        # once per batch; addresses are already lowercased and stripped
         emails_sent_today = self._get_emails_sent_today()
         print(f"\n  Emails already sent today: {len(emails_sent_today)}")
 
@@ -1231,13 +1972,31 @@ From: {self.from_email}
         # get_config already imported at module level (line 29)
         sole_trader_mode = get_config().auto_approve.sole_trader_mode
 
+        # Runner state for the send counter - read only once past every
+        # gate, so blocked / empty runs skip it (sheet_paused never blocks)
+        state = self.sheets.get_runner_state()
+
+        # (lead, Future[(SendResult, StructuredLog)]) for every lead that
+        # reached the send step, and how many of those went to Resend
+        outcomes = []
+        queued_sends = 0
+        # Monotonic time the next Resend send may start (send pacing)
+        next_send_at = time.monotonic()
+        # With no pacing configured, sends go out via Resend's batch endpoint
+        # (up to 100 per request) instead of one request per lead
+        use_batch_api = delay_between_sends <= 0
+        batch_pending: List[Tuple[EnhancedLead, StructuredLog, str, Future]] = []
+
         try:
             for i, lead in enumerate(leads, 1):
-                print(f"\n[{i}/{len(leads)}] {lead.business_name}")
-                print(f"  Lead ID: {lead.lead_id[:8]}...")
-                print(f"  Email: {lead.email}")
-                print(f"  Status: {lead.status}")
-                print("-" * 40)
+                print(
+                    f"\n[{i}/{len(leads)}] {lead.business_name}\n"
+                    f"  Lead ID: {lead.lead_id[:8]}...\n"
+                    f"  Email: {lead.email}\n"
+                    f"  Status: {lead.status}\n"
+                    + "-" * 40
+                )
+                email_lower = (lead.email or "").strip().lower()
 
                 # Extract review count from raw_data if available
                 review_count = None
@@ -1261,43 +2020,100 @@ From: {self.from_email}
                     print(f"  ⚠️  SAFETY REJECTED: {safety_check.reason}")
                     print(f"      Lead was APPROVED but fails full validation - skipping")
                     skipped_count += 1
+                    rejection_counts["Safety check failed"] += 1
                     # Mark as SKIPPED in sheet to prevent re-processing
-                    pending_updates.append({
-                        'lead_id': lead.lead_id,
-                        'status': 'SKIPPED',
-                        'eligibility_reason': f"Safety check failed: {safety_check.reason}",
-                    })
+                    self._queue_lead_update(
+                        lead.lead_id,
+                        'SKIPPED',
+                        eligibility_reason=f"Safety check failed: {safety_check.reason}",
+                    )
                     continue
 
                 # DUPLICATE CHECK: Skip if we've already sent to this email
-                email_lower = (lead.email or "").lower().strip()
-                if email_lower in emails_sent_this_batch:
-                    print(f"  ⚠️  SKIPPED: Duplicate email (already sent in this batch)")
+                if email_lower in emails_sent_this_batch or email_lower in emails_sent_today:
+                    if email_lower in emails_sent_this_batch:
+                        seen, where = "already sent in this batch", "this batch"
+                        reason = 'Duplicate email - already sent to this address'
+                    else:
+                        seen, where = "already sent today", "sent today"
+                        reason = 'Duplicate email - already sent today'
+                    print(f"  ⚠️  SKIPPED: Duplicate email ({seen})")
                     duplicate_count += 1
                     skipped_count += 1
+                    rejection_counts[f"Duplicate ({where})"] += 1
                     # Mark as skipped so it's not picked up again
-                    pending_updates.append({
-                        'lead_id': lead.lead_id,
-                        'status': 'SKIPPED',
-                        'eligibility_reason': 'Duplicate email - already sent to this address',
-                    })
+                    self._queue_lead_update(
+                        lead.lead_id,
+                        'SKIPPED',
+                        eligibility_reason=reason,
+                    )
                     continue
 
-                if email_lower in emails_sent_today:
-                    print(f"  ⚠️  SKIPPED: Duplicate email (already sent today)")
-                    duplicate_count += 1
-                    skipped_count += 1
-                    pending_updates.append({
-                        'lead_id': lead.lead_id,
-                        'status': 'SKIPPED',
-                        'eligibility_reason': 'Duplicate email - already sent today',
-                    })
+                # Step 1: Start the send (NO sheet writes during this loop).
+                # Checks run now; the Resend request runs on a worker thread
+                result, log, clean_email = self._prepare_send(
+                    lead, dry_run=effective_dry_run, email_lower=email_lower
+                )
+                if result is not None:
+                    future = Future()
+                    future.set_result((result, log))
+                    outcomes.append((lead, future))
                     continue
 
-                # Step 1: Send the email (NO sheet writes during this loop)
-                result, log = self.send_email_no_sheet_write(lead, dry_run=effective_dry_run)
-                results.append(result)
-                logs.append(log)
+                if use_batch_api:
+                    future = Future()
+                    batch_pending.append((lead, log, clean_email, future))
+                    outcomes.append((lead, future))
+                    if len(batch_pending) >= 100:
+                        self._dispatch_batch(batch_pending)
+                else:
+                    # Rate limiting for email deliverability: sends start at most
+                    # once per delay_between_sends. Time spent on the checks above
+                    # counts toward the gap, and nothing waits after the last send
+                    wait = next_send_at - time.monotonic()
+                    if wait > 0:
+                        time.sleep(wait)
+                    next_send_at = max(next_send_at, time.monotonic()) + delay_between_sends
+
+                    outcomes.append((lead, self._get_io_executor().submit(self._deliver, lead, log, clean_email)))
+                queued_sends += 1
+
+                # Track this email to prevent duplicates within the batch
+                # (on submission - the send result arrives later)
+                emails_sent_this_batch.add(email_lower)
+
+                # Local quota check - no sheet read per send. Queued sends
+                # count against the quota until their result is known
+                if self._sent_today_local + queued_sends >= daily_limit:
+                    stopped_reason = "Daily limit reached"
+                    print(f"\n  ⚠️  Daily limit reached ({self._sent_today_local + queued_sends}/{daily_limit}) - stopping")
+                    break
+
+            # Send whatever is still waiting for a batch request - only on a
+            # normal loop exit, never from the error path below
+            if batch_pending:
+                self._dispatch_batch(batch_pending)
+
+        except Exception as e:
+            # Unexpected error in sender loop - alert and re-raise
+            print(f"\n  UNEXPECTED ERROR: {e}")
+            alert_sender_error(e, sheets_manager=self.sheets)
+            raise
+
+        finally:
+            # The loop raised before these went out - they were never sent
+            if batch_pending:
+                self._abandon_batch(batch_pending, "Batch not sent: sender loop aborted")
+
+            # Collect every started send, in lead order - also on error, so a
+            # lead that was emailed is always recorded as SENT. The count is
+            # known here, so results/logs are sized once and filled by index
+            results: List[SendResult] = [None] * len(outcomes)
+            logs: List[StructuredLog] = [None] * len(outcomes)
+            for k, (lead, future) in enumerate(outcomes):
+                result, log = future.result()
+                results[k] = result
+                logs[k] = log
                 log.log()
 
                 # Track sanitization
@@ -1308,75 +2124,54 @@ From: {self.from_email}
                 # Collect status update for batch write
                 if result.status == SendStatus.SENT:
                     sent_count += 1
-                    # Track this email to prevent duplicates within the batch
-                    emails_sent_this_batch.add(email_lower)
-                    pending_updates.append({
-                        'lead_id': lead.lead_id,
-                        'status': 'SENT',
-                        'sent_at': datetime.utcnow().isoformat(),
-                        'resend_id': result.email_id or '',
-                    })
+                    self._sent_today_local += 1
+                    self.record_safety_event("sent")
+                    sent_at = datetime.utcnow().isoformat()
+                    self._queue_lead_update(
+                        lead.lead_id,
+                        'SENT',
+                        sent_at=sent_at,
+                        resend_id=result.email_id or '',
+                    )
+                    self._pending_sends.append(
+                        [lead.lead_id, lead.email.strip().lower(), sent_at]
+                    )
                 elif result.status == SendStatus.BLOCKED:
                     blocked_count += 1
                     # Revert to original status
-                    pending_updates.append({
-                        'lead_id': lead.lead_id,
-                        'status': lead.status,  # Keep original
-                        'eligibility_reason': log.reason,
-                    })
+                    self._queue_lead_update(
+                        lead.lead_id,
+                        lead.status,  # Keep original
+                        eligibility_reason=log.reason,
+                    )
                 elif result.status == SendStatus.INVALID:
                     invalid_count += 1
-                    pending_updates.append({
-                        'lead_id': lead.lead_id,
-                        'status': 'INVALID',
-                        'eligibility_reason': log.reason,
-                    })
+                    rejection_counts["Invalid email"] += 1
+                    self._queue_lead_update(
+                        lead.lead_id,
+                        'INVALID',
+                        eligibility_reason=log.reason,
+                    )
                 elif result.status == SendStatus.FAILED:
                     failed_count += 1
-                    pending_updates.append({
-                        'lead_id': lead.lead_id,
-                        'status': lead.status,  # Keep original so lead isn't lost
-                        'eligibility_reason': f"Send failed: {result.error}",
-                    })
+                    self._queue_lead_update(
+                        lead.lead_id,
+                        lead.status,  # Keep original so lead isn't lost
+                        eligibility_reason=f"Send failed: {result.error}",
+                    )
                 elif result.status == SendStatus.SKIPPED:
                     skipped_count += 1
                     # No update needed for skipped
 
-                # Rate limiting for email deliverability only (no sheet writes in loop)
-                if result.status == SendStatus.SENT:
-                    time.sleep(delay_between_sends)
-
-            # BATCH UPDATE: Write all status changes in ONE API call
-            if pending_updates:
-                print(f"\n  Batch updating {len(pending_updates)} leads (single API call)...")
-                try:
-                    updated = self.sheets.batch_update_leads(pending_updates)
-                    print(f"  Successfully updated {updated} leads")
-                except Exception as batch_err:
-                    print(f"  WARNING: Batch update failed: {batch_err}")
-                    print(f"  Will retry with delays...")
-                    # Fallback: individual updates with long delays
-                    for j, update in enumerate(pending_updates):
-                        try:
-                            self.sheets.update_lead_status(
-                                update['lead_id'],
-                                update['status'],
-                                **{k: v for k, v in update.items() if k not in ('lead_id', 'status')}
-                            )
-                            if j < len(pending_updates) - 1:
-                                time.sleep(2)  # 2 second delay between writes
-                        except Exception as inner_err:
-                            print(f"  Failed to update {update['lead_id']}: {inner_err}")
-
-        except Exception as e:
-            # Unexpected error in sender loop - alert and re-raise
-            print(f"\n  UNEXPECTED ERROR: {e}")
-            alert_sender_error(e, sheets_manager=self.sheets)
-            raise
+            # BATCH UPDATE: Write all status changes in ONE API call -
+            # also on error, so partial progress is never lost
+            self.flush_updates()
+            # Update send counter once per batch (only for actual sends),
+            # reusing the state loaded above - persisted even if the loop raised
+            self.increment_send_counter(sent_count, state=state)
 
-        # Update send counter (only for actual sends)
-        if sent_count > 0:
-            self.increment_send_counter(sent_count)
+            # Every send has resolved - release the worker threads
+            self.close()
 
         # Summary
         print("\n" + "=" * 70)
@@ -1391,10 +2186,16 @@ From: {self.from_email}
         if duplicate_count > 0:
             print(f"  DUPLICATES:{duplicate_count} (same email, skipped)")
         print(f"  Sanitized: {sanitized_count}")
+        if rejection_counts:
+            print(f"  Rejections:")
+            for reason, count in rejection_counts.most_common():
+                print(f"    {reason}: {count}")
         print("=" * 70)
+        # Per-lead output is buffered - push it out once at batch end
+        sys.stdout.flush()
 
         return SendBatchResult(
-            total_attempted=len(leads) - skipped_count,
+            total_attempted=len(results),
             total_sent=sent_count,
             total_failed=failed_count,
             total_blocked=blocked_count,
@@ -1402,6 +2203,7 @@ From: {self.from_email}
             total_sanitized=sanitized_count,
             results=results,
             logs=logs,
+            stopped_reason=stopped_reason,
         )
 
 
@@ -1421,8 +2223,6 @@ def main():
     sys.path.insert(0, str(project_dir))
     os.chdir(project_dir)
 
-    load_dotenv()
-
     parser = argparse.ArgumentParser(
         description="Send emails to eligible leads"
     )
@@ -1445,6 +2245,14 @@ def main():
 
     args = parser.parse_args()
 
+    # Fail-closed gate before any Google API call: a disabled cron tick
+    # shouldn't pay for OAuth + sheet metadata just to be blocked in send_batch()
+    if not args.status and not args.resume and not get_config().pipeline.send_enabled:
+        print("SEND_ENABLED=false, exiting")
+        return
+
+    from src.sequencer_sheets import SequencerSheetsManager
+
     # Connect to sheets
     print("Connecting to Google Sheets...")
     sheets = SequencerSheetsManager()
@@ -1458,10 +2266,12 @@ def main():
         print("SENDER STATUS")
         print("=" * 60)
 
+        # Sequential on purpose: the sheets manager's caches and rate
+        # limiting aren't thread-safe
         state = sheets.get_runner_state()
-        daily_limit = sender.calculate_daily_limit()
         remaining = sender.get_remaining_daily_quota()
-        metrics = sheets.get_safety_metrics()
+        metrics = sender.get_safety_metrics()
+        daily_limit = sender.calculate_daily_limit()
 
         print(f"  Paused: {state.sending_paused}")
         if state.pause_reason:
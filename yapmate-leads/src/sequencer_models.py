@@ -4,17 +4,113 @@ This module defines all data structures used by the sequencing system:
 - QueueTask: Individual scraping tasks in the queue
 - RunnerState: Current state of the task runner
 - EnhancedLead: Lead with full metadata and eligibility flags
+- EnhancedLeadBatch: Column-oriented view over raw leads tab rows
 - DedupeKey: Entry in the dedupe_keys lookup table
 - RunLogEntry: Execution history entry
 - EmailCampaign: Email campaign tracking
 """
 
+import functools
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+from operator import attrgetter, itemgetter
+from itertools import compress
+from typing import Any, ClassVar, Dict, Iterable, Iterator, List, Optional, Tuple
+from datetime import datetime, timedelta
 from enum import Enum
 
 
+@functools.lru_cache(maxsize=8192)
+def _parse_iso(value: str) -> datetime:
+    """datetime.fromisoformat(), memoized - rows written in one batch share timestamps."""
+    return datetime.fromisoformat(value)
+
+
+@functools.lru_cache(maxsize=8192)
+def _format_iso_cached(value: datetime, utcoffset: Optional[timedelta]) -> str:
+    """Memoized isoformat() for _format_iso (utcoffset is only part of the key)."""
+    return value.isoformat()
+
+
+def _format_iso(value: datetime) -> str:
+    """
+    datetime.isoformat(), memoized - leads in one batch share created/updated times.
+
+    Keyed on the UTC offset too: aware datetimes for the same instant compare
+    (and hash) equal whatever their offset, but format differently.
+    """
+    return _format_iso_cached(value, value.utcoffset())
+
+
+def _parse_dt_or_none(val) -> Optional[datetime]:
+    """Parse an ISO timestamp cell; blank or malformed cells give None."""
+    if not val:
+        return None
+    if isinstance(val, datetime):
+        return val
+    try:
+        return _parse_iso(str(val))
+    except:
+        return None
+
+
+# Set by freeze_now() - the shared default timestamp for models built in a batch
+_frozen_now: Optional[datetime] = None
+
+
+def batch_now() -> datetime:
+    """datetime.utcnow(), or the time frozen by an enclosing freeze_now() block."""
+    return _frozen_now or datetime.utcnow()
+
+
+@contextmanager
+def freeze_now():
+    """
+    Give every model built inside the block the same default timestamp.
+
+    Bulk construction (thousands of leads from one scrape) then reads the
+    clock once instead of twice per lead, and created_at/updated_at come
+    out uniform across the batch. Nested blocks keep the outer time.
+    """
+    global _frozen_now
+    outer = _frozen_now
+    if outer is None:
+        _frozen_now = datetime.utcnow()
+    try:
+        yield _frozen_now
+    finally:
+        _frozen_now = outer
+
+
+# Boolean cell tokens (compared after strip().lower())
+_TRUE_TOKENS = frozenset({"true", "1", "yes", "y", "t"})
+_FALSE_TOKENS = frozenset({"false", "0", "no", "n", "f", ""})
+_STRICT_TRUE_TOKENS = frozenset({"true", "1", "yes"})
+
+
+def _parse_bool(val) -> bool:
+    """Robust boolean parsing: handles TRUE/FALSE, true/false, Yes/No, 1/0, strips whitespace."""
+    if isinstance(val, bool):
+        return val
+    if isinstance(val, str):
+        val_clean = val.strip().lower()
+        if val_clean in _TRUE_TOKENS:
+            return True
+        if val_clean in _FALSE_TOKENS:
+            return False
+    # For numbers, 0 is False, anything else is True
+    if isinstance(val, (int, float)):
+        return val != 0
+    return bool(val)
+
+
+def _parse_bool_strict(val) -> bool:
+    """Strict boolean parsing (no truthy coercion) - only explicit true tokens count."""
+    if not val:
+        return False
+    return str(val).strip().lower() in _STRICT_TRUE_TOKENS
+
+
 class TaskStatus(str, Enum):
     """Status of a queue task."""
     PENDING = "pending"
@@ -39,11 +135,48 @@ class DedupeMatchType(str, Enum):
     NAME_CITY = "name_city"  # Soft match
 
 
+# Enum members by cell value - a plain dict lookup instead of Enum.__call__
+# per row (see _enum_from_str)
+_TASK_STATUS_FROM_STR = {s.value: s for s in TaskStatus}
+_SESSION_FROM_STR = {s.value: s for s in SessionType}
+
+
+def _enum_from_str(table: Dict[str, Enum], value: Any, enum_cls: type) -> Enum:
+    """Enum member for a cell value; unknown values raise ValueError, like Enum(value)."""
+    member = table.get(value)
+    if member is None:
+        raise ValueError(f"{value!r} is not a valid {enum_cls.__name__}")
+    return member
+
+
+# Lead statuses that can still be sent to
+NEW_OR_APPROVED = frozenset({"NEW", "APPROVED"})
+
+
+def _build_status_norm() -> Dict[str, str]:
+    """Every common spelling of a lead status cell, mapped to its canonical value."""
+    table = {}
+    canonical = ("APPROVED", "NEW", "SENT", "QUEUED", "FAILED", "INVALID", "BOUNCED", "REPLIED")
+    for status in canonical:
+        for form in (status, status.lower(), status.title()):
+            table[form] = status
+    # String booleans (legacy data)
+    for tokens, status in ((("true", "1", "yes"), "APPROVED"), (("false", "0", "no"), "NEW")):
+        for token in tokens:
+            for form in (token, token.upper(), token.title()):
+                table[form] = status
+    return table
+
+
+# Status cell -> canonical status; a miss falls back to strip/lower/upper
+_STATUS_NORM = _build_status_norm()
+
+
 # =============================================================================
 # QUEUE TASK
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class QueueTask:
     """A single task in the queue (one city+trade combination)."""
 
@@ -59,7 +192,7 @@ class QueueTask:
 
     # Status tracking
     status: TaskStatus = TaskStatus.PENDING
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=batch_now)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
 
@@ -78,32 +211,35 @@ class QueueTask:
             self.priority,
             self.tier,
             self.status.value,
-            self.created_at.isoformat() if self.created_at else "",
-            self.started_at.isoformat() if self.started_at else "",
-            self.completed_at.isoformat() if self.completed_at else "",
+            _format_iso(self.created_at) if self.created_at else "",
+            _format_iso(self.started_at) if self.started_at else "",
+            _format_iso(self.completed_at) if self.completed_at else "",
             self.leads_found,
             self.leads_after_dedupe,
             self.error_message or "",
         ]
 
-    @staticmethod
-    def headers() -> List[str]:
+    # Column headers for Google Sheets (built once, at import)
+    HEADERS: ClassVar[Tuple[str, ...]] = (
+        "task_id",
+        "trade",
+        "city",
+        "session",
+        "priority",
+        "tier",
+        "status",
+        "created_at",
+        "started_at",
+        "completed_at",
+        "leads_found",
+        "leads_after_dedupe",
+        "error_message",
+    )
+
+    @classmethod
+    def headers(cls) -> Tuple[str, ...]:
         """Column headers for Google Sheets."""
-        return [
-            "task_id",
-            "trade",
-            "city",
-            "session",
-            "priority",
-            "tier",
-            "status",
-            "created_at",
-            "started_at",
-            "completed_at",
-            "leads_found",
-            "leads_after_dedupe",
-            "error_message",
-        ]
+        return cls.HEADERS
 
     @classmethod
     def from_sheets_row(cls, row: List[Any]) -> "QueueTask":
@@ -112,13 +248,13 @@ class QueueTask:
             task_id=str(row[0]),
             trade=str(row[1]),
             city=str(row[2]),
-            session=SessionType(row[3]),
+            session=_enum_from_str(_SESSION_FROM_STR, row[3], SessionType),
             priority=int(row[4]),
             tier=int(row[5]),
-            status=TaskStatus(row[6]),
-            created_at=datetime.fromisoformat(row[7]) if row[7] else None,
-            started_at=datetime.fromisoformat(row[8]) if row[8] else None,
-            completed_at=datetime.fromisoformat(row[9]) if row[9] else None,
+            status=_enum_from_str(_TASK_STATUS_FROM_STR, row[6], TaskStatus),
+            created_at=_parse_iso(row[7]) if row[7] else None,
+            started_at=_parse_iso(row[8]) if row[8] else None,
+            completed_at=_parse_iso(row[9]) if row[9] else None,
             leads_found=int(row[10]) if row[10] else 0,
             leads_after_dedupe=int(row[11]) if row[11] else 0,
             error_message=str(row[12]) if row[12] else None,
@@ -129,7 +265,7 @@ class QueueTask:
 # RUNNER STATE
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class RunnerState:
     """Current state of the task runner."""
 
@@ -161,7 +297,7 @@ class RunnerState:
         return [
             self.focus_trade_id or "",
             self.focus_trade_date or "",
-            self.last_run_at.isoformat() if self.last_run_at else "",
+            _format_iso(self.last_run_at) if self.last_run_at else "",
             self.last_session.value if self.last_session else "",
             self.last_task_id or "",
             self.emails_sent_today,
@@ -171,68 +307,121 @@ class RunnerState:
             self.sending_paused,
             self.pause_reason or "",
             self.last_alert_key or "",
-            self.last_alert_at.isoformat() if self.last_alert_at else "",
+            _format_iso(self.last_alert_at) if self.last_alert_at else "",
         ]
 
-    @staticmethod
-    def headers() -> List[str]:
+    # Column headers for the state tab (built once, at import)
+    HEADERS: ClassVar[Tuple[str, ...]] = (
+        "focus_trade_id",
+        "focus_trade_date",
+        "last_run_at",
+        "last_session",
+        "last_task_id",
+        "emails_sent_today",
+        "bounces_last_7_days",
+        "complaints_last_7_days",
+        "total_sent_last_7_days",
+        "sending_paused",
+        "pause_reason",
+        "last_alert_key",
+        "last_alert_at",
+    )
+
+    @classmethod
+    def headers(cls) -> Tuple[str, ...]:
         """Column headers for state tab."""
-        return [
-            "focus_trade_id",
-            "focus_trade_date",
-            "last_run_at",
-            "last_session",
-            "last_task_id",
-            "emails_sent_today",
-            "bounces_last_7_days",
-            "complaints_last_7_days",
-            "total_sent_last_7_days",
-            "sending_paused",
-            "pause_reason",
-            "last_alert_key",
-            "last_alert_at",
-        ]
+        return cls.HEADERS
 
     @classmethod
     def from_sheets_row(cls, row: List[Any]) -> "RunnerState":
         """Create from Google Sheets row."""
-        def parse_datetime(val):
-            if not val:
-                return None
-            try:
-                return datetime.fromisoformat(str(val))
-            except:
-                return None
-
-        # Strict boolean parsing for sending_paused (no truthy coercion)
-        def parse_bool_strict(val):
-            if not val:
-                return False
-            val_str = str(val).strip().lower()
-            return val_str in ("true", "1", "yes")
-        
+        # The alert/pause columns were added later - pad older rows so they
+        # read as blank. The first nine columns are still required
+        n = len(row)
+        if n < 9:
+            raise IndexError(f"State row has {n} columns, expected at least 9")
+        if n < _STATE_COLUMN_COUNT:
+            row = list(row) + [""] * (_STATE_COLUMN_COUNT - n)
+
+        (
+            focus_trade_id, focus_trade_date, last_run_at, last_session,
+            last_task_id, emails_sent_today, bounces_last_7_days,
+            complaints_last_7_days, total_sent_last_7_days, sending_paused,
+            pause_reason, last_alert_key, last_alert_at,
+        ) = _STATE_GETTER(row)
+
         return cls(
-            focus_trade_id=str(row[0]) if row[0] else None,
-            focus_trade_date=str(row[1]) if row[1] else None,
-            last_run_at=parse_datetime(row[2]),
-            last_session=SessionType(row[3]) if row[3] else None,
-            last_task_id=str(row[4]) if row[4] else None,
-            emails_sent_today=int(row[5]) if row[5] else 0,
-            bounces_last_7_days=int(row[6]) if row[6] else 0,
-            complaints_last_7_days=int(row[7]) if row[7] else 0,
-            total_sent_last_7_days=int(row[8]) if row[8] else 0,
-            sending_paused=parse_bool_strict(row[9]) if len(row) > 9 and row[9] else False,
-            pause_reason=str(row[10]) if len(row) > 10 and row[10] else None,
-            last_alert_key=str(row[11]) if len(row) > 11 and row[11] else None,
-            last_alert_at=parse_datetime(row[12]) if len(row) > 12 else None,
+            focus_trade_id=str(focus_trade_id) if focus_trade_id else None,
+            focus_trade_date=str(focus_trade_date) if focus_trade_date else None,
+            last_run_at=_parse_dt_or_none(last_run_at),
+            last_session=(
+                _enum_from_str(_SESSION_FROM_STR, last_session, SessionType) if last_session else None
+            ),
+            last_task_id=str(last_task_id) if last_task_id else None,
+            emails_sent_today=int(emails_sent_today) if emails_sent_today else 0,
+            bounces_last_7_days=int(bounces_last_7_days) if bounces_last_7_days else 0,
+            complaints_last_7_days=int(complaints_last_7_days) if complaints_last_7_days else 0,
+            total_sent_last_7_days=int(total_sent_last_7_days) if total_sent_last_7_days else 0,
+            sending_paused=_parse_bool_strict(sending_paused),
+            pause_reason=str(pause_reason) if pause_reason else None,
+            last_alert_key=str(last_alert_key) if last_alert_key else None,
+            last_alert_at=_parse_dt_or_none(last_alert_at),
         )
 
 
+_STATE_COLUMN_COUNT = len(RunnerState.HEADERS)
+_STATE_GETTER = itemgetter(*range(_STATE_COLUMN_COUNT))
+
+
 # =============================================================================
 # ENHANCED LEAD
 # =============================================================================
 
-@dataclass
+# Leads tab columns in sheet order, with how each value is written:
+# "raw" as-is, "text" None -> "", "time" datetime -> ISO string (None -> "")
+_LEAD_COLUMNS = (
+    ("lead_id", "raw"),
+    ("business_name", "raw"),
+    ("email", "text"),
+    ("phone", "text"),
+    ("website", "text"),
+    ("trade", "raw"),
+    ("city", "raw"),
+    ("lead_source", "raw"),
+    ("place_id", "text"),
+    ("source_url", "text"),
+    ("discovered_email", "text"),
+    ("email_source", "raw"),
+    ("discovery_url", "text"),
+    ("ai_hook", "text"),
+    ("enriched_at", "time"),
+    ("send_eligible", "raw"),
+    ("eligibility_reason", "text"),
+    ("generic_address", "raw"),
+    ("soft_match", "raw"),
+    ("soft_match_lead_id", "text"),
+    ("status", "raw"),
+    ("created_at", "time"),
+    ("updated_at", "time"),
+    ("campaign_id", "text"),
+    ("sent_at", "time"),
+    ("resend_id", "text"),
+    ("opened_at", "time"),
+    ("clicked_at", "time"),
+    ("replied_at", "time"),
+    ("bounced_at", "time"),
+    ("complained_at", "time"),
+    ("last_event", "text"),
+    ("task_id", "text"),
+)
+
+_LEAD_COLUMN_COUNT = len(_LEAD_COLUMNS)
+
+# Pulls every lead column out of a (padded) row in one C-level call
+_LEAD_GETTER = itemgetter(*range(_LEAD_COLUMN_COUNT))
+
+
+@dataclass(slots=True)
 class EnhancedLead:
     """Lead with full metadata and eligibility flags.
 
@@ -280,8 +469,8 @@ class EnhancedLead:
 
     # Status tracking
     status: str = "NEW"  # NEW, APPROVED, SENT, BOUNCED, REPLIED, etc.
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=batch_now)
+    updated_at: datetime = field(default_factory=batch_now)
 
     # Campaign tracking
     campaign_id: Optional[str] = None
@@ -317,174 +506,228 @@ class EnhancedLead:
             self.email_source,
             self.discovery_url or "",
             self.ai_hook or "",
-            self.enriched_at.isoformat() if self.enriched_at else "",
+            _format_iso(self.enriched_at) if self.enriched_at else "",
             self.send_eligible,
             self.eligibility_reason or "",
             self.generic_address,
             self.soft_match,
             self.soft_match_lead_id or "",
             self.status,
-            self.created_at.isoformat() if self.created_at else "",
-            self.updated_at.isoformat() if self.updated_at else "",
+            _format_iso(self.created_at) if self.created_at else "",
+            _format_iso(self.updated_at) if self.updated_at else "",
             self.campaign_id or "",
-            self.sent_at.isoformat() if self.sent_at else "",
+            _format_iso(self.sent_at) if self.sent_at else "",
             self.resend_id or "",
-            self.opened_at.isoformat() if self.opened_at else "",
-            self.clicked_at.isoformat() if self.clicked_at else "",
-            self.replied_at.isoformat() if self.replied_at else "",
-            self.bounced_at.isoformat() if self.bounced_at else "",
-            self.complained_at.isoformat() if self.complained_at else "",
+            _format_iso(self.opened_at) if self.opened_at else "",
+            _format_iso(self.clicked_at) if self.clicked_at else "",
+            _format_iso(self.replied_at) if self.replied_at else "",
+            _format_iso(self.bounced_at) if self.bounced_at else "",
+            _format_iso(self.complained_at) if self.complained_at else "",
             self.last_event or "",
             self.task_id or "",
         ]
 
     @staticmethod
-    def headers() -> List[str]:
+    def to_sheets_rows_bulk(leads: List["EnhancedLead"]) -> List[List[Any]]:
+        """
+        Convert many leads to Google Sheets rows (same output as to_sheets_row).
+
+        Works a column at a time, so each column's formatting runs as one
+        comprehension over values of the same type.
+        """
+        if not leads:
+            return []
+
+        columns = []
+        for name, kind in _LEAD_COLUMNS:
+            values = map(attrgetter(name), leads)
+            if kind == "text":
+                columns.append([v or "" for v in values])
+            elif kind == "time":
+                columns.append([_format_iso(v) if v else "" for v in values])
+            else:
+                columns.append(list(values))
+
+        return [list(row) for row in zip(*columns)]
+
+    # Column headers for Google Sheets (built once, at import)
+    HEADERS: ClassVar[Tuple[str, ...]] = tuple(name for name, _ in _LEAD_COLUMNS)
+
+    @classmethod
+    def headers(cls) -> Tuple[str, ...]:
         """Column headers for Google Sheets."""
-        return [
-            "lead_id",
-            "business_name",
-            "email",
-            "phone",
-            "website",
-            "trade",
-            "city",
-            "lead_source",
-            "place_id",
-            "source_url",
-            "discovered_email",
-            "email_source",
-            "discovery_url",
-            "ai_hook",
-            "enriched_at",
-            "send_eligible",
-            "eligibility_reason",
-            "generic_address",
-            "soft_match",
-            "soft_match_lead_id",
-            "status",
-            "created_at",
-            "updated_at",
-            "campaign_id",
-            "sent_at",
-            "resend_id",
-            "opened_at",
-            "clicked_at",
-            "replied_at",
-            "bounced_at",
-            "complained_at",
-            "last_event",
-            "task_id",
-        ]
+        return cls.HEADERS
 
     @staticmethod
     def _normalize_status(status_val: Any) -> str:
         """Normalize status value to uppercase standard values."""
         if not status_val:
             return "NEW"
-        
-        status_str = str(status_val).strip()
-        
+
         # Handle boolean values (legacy data)
         if isinstance(status_val, bool):
-            return "APPROVED" if status_val else "NEW"
-        
-        # Handle string boolean values
-        status_lower = status_str.lower()
-        if status_lower in ("true", "1", "yes"):
             return "APPROVED"
-        if status_lower in ("false", "0", "no"):
-            return "NEW"
-        
-        # Normalize to uppercase
-        status_upper = status_str.upper()
-        
-        # Map common variations
-        status_map = {
-            "APPROVED": "APPROVED",
-            "NEW": "NEW",
-            "SENT": "SENT",
-            "QUEUED": "QUEUED",
-            "FAILED": "FAILED",
-            "INVALID": "INVALID",
-            "BOUNCED": "BOUNCED",
-            "REPLIED": "REPLIED",
-        }
-        
-        return status_map.get(status_upper, status_upper)
+
+        # Exact spellings seen in the sheet hit the table directly
+        if isinstance(status_val, str):
+            status = _STATUS_NORM.get(status_val)
+            if status is not None:
+                return status
+
+        status_str = str(status_val).strip()
+        return _STATUS_NORM.get(status_str.lower()) or status_str.upper()
     
     @classmethod
     def from_sheets_row(cls, row: List[Any]) -> "EnhancedLead":
         """Create from Google Sheets row."""
-        def parse_bool(val) -> bool:
-            """Robust boolean parsing: handles TRUE/FALSE, true/false, Yes/No, 1/0, strips whitespace."""
-            if isinstance(val, bool):
-                return val
-            if isinstance(val, str):
-                val_clean = val.strip().lower()
-                # Handle various true values
-                if val_clean in ("true", "1", "yes", "y", "t"):
-                    return True
-                # Handle various false values
-                if val_clean in ("false", "0", "no", "n", "f", ""):
-                    return False
-            # For numbers, 0 is False, anything else is True
-            if isinstance(val, (int, float)):
-                return val != 0
-            return bool(val)
-
-        def parse_datetime(val) -> Optional[datetime]:
-            if not val:
-                return None
-            if isinstance(val, datetime):
-                return val
-            try:
-                return datetime.fromisoformat(str(val))
-            except:
-                return None
-
+        # Pad short rows (older sheets) once so every column can be indexed
+        # directly - missing trailing cells read as blank. The first ten
+        # columns are still required
+        n = len(row)
+        if n < 10:
+            raise IndexError(f"Lead row has {n} columns, expected at least 10")
+        if n < _LEAD_COLUMN_COUNT:
+            row = list(row) + [""] * (_LEAD_COLUMN_COUNT - n)
+
+        (
+            lead_id, business_name, email, phone, website, trade, city,
+            lead_source, place_id, source_url, discovered_email, email_source,
+            discovery_url, ai_hook, enriched_at, send_eligible,
+            eligibility_reason, generic_address, soft_match, soft_match_lead_id,
+            status, created_at, updated_at, campaign_id, sent_at, resend_id,
+            opened_at, clicked_at, replied_at, bounced_at, complained_at,
+            last_event, task_id,
+        ) = _LEAD_GETTER(row)
+
+        # str() on a cell that is already a str returns the same object (no
+        # copy), so the coercions below only do work for cells that aren't
+        # str yet (numbers, booleans). Kept inline - a type-check helper call
+        # per field measured slower than str() itself
         return cls(
-            lead_id=str(row[0]),
-            business_name=str(row[1]),
-            email=str(row[2]) if row[2] else None,
-            phone=str(row[3]) if row[3] else None,
-            website=str(row[4]) if row[4] else None,
-            trade=str(row[5]),
-            city=str(row[6]),
-            lead_source=str(row[7]),
-            place_id=str(row[8]) if row[8] else None,
-            source_url=str(row[9]) if row[9] else None,
-            discovered_email=str(row[10]) if len(row) > 10 and row[10] else None,
-            email_source=str(row[11]) if len(row) > 11 and row[11] else "none",
-            discovery_url=str(row[12]) if len(row) > 12 and row[12] else None,
-            ai_hook=str(row[13]) if len(row) > 13 and row[13] else None,
-            enriched_at=parse_datetime(row[14]) if len(row) > 14 else None,
-            send_eligible=parse_bool(row[15]) if len(row) > 15 else False,
-            eligibility_reason=str(row[16]) if len(row) > 16 and row[16] else None,
-            generic_address=parse_bool(row[17]) if len(row) > 17 else False,
-            soft_match=parse_bool(row[18]) if len(row) > 18 else False,
-            soft_match_lead_id=str(row[19]) if len(row) > 19 and row[19] else None,
-            status=cls._normalize_status(row[20]) if len(row) > 20 and row[20] else "NEW",
-            created_at=parse_datetime(row[21]) if len(row) > 21 else datetime.utcnow(),
-            updated_at=parse_datetime(row[22]) if len(row) > 22 else datetime.utcnow(),
-            campaign_id=str(row[23]) if len(row) > 23 and row[23] else None,
-            sent_at=parse_datetime(row[24]) if len(row) > 24 else None,
-            resend_id=str(row[25]) if len(row) > 25 and row[25] else None,
-            opened_at=parse_datetime(row[26]) if len(row) > 26 else None,
-            clicked_at=parse_datetime(row[27]) if len(row) > 27 else None,
-            replied_at=parse_datetime(row[28]) if len(row) > 28 else None,
-            bounced_at=parse_datetime(row[29]) if len(row) > 29 else None,
-            complained_at=parse_datetime(row[30]) if len(row) > 30 else None,
-            last_event=str(row[31]) if len(row) > 31 and row[31] else None,
-            task_id=str(row[32]) if len(row) > 32 and row[32] else None,
+            lead_id=str(lead_id),
+            business_name=str(business_name),
+            email=str(email) if email else None,
+            phone=str(phone) if phone else None,
+            website=str(website) if website else None,
+            trade=str(trade),
+            city=str(city),
+            lead_source=str(lead_source),
+            place_id=str(place_id) if place_id else None,
+            source_url=str(source_url) if source_url else None,
+            discovered_email=str(discovered_email) if discovered_email else None,
+            email_source=str(email_source) if email_source else "none",
+            discovery_url=str(discovery_url) if discovery_url else None,
+            ai_hook=str(ai_hook) if ai_hook else None,
+            enriched_at=_parse_dt_or_none(enriched_at),
+            send_eligible=_parse_bool(send_eligible),
+            eligibility_reason=str(eligibility_reason) if eligibility_reason else None,
+            generic_address=_parse_bool(generic_address),
+            soft_match=_parse_bool(soft_match),
+            soft_match_lead_id=str(soft_match_lead_id) if soft_match_lead_id else None,
+            status=cls._normalize_status(status) if status else "NEW",
+            # Columns absent from the sheet (not just blank) default to now
+            created_at=_parse_dt_or_none(created_at) if n > 21 else batch_now(),
+            updated_at=_parse_dt_or_none(updated_at) if n > 22 else batch_now(),
+            campaign_id=str(campaign_id) if campaign_id else None,
+            sent_at=_parse_dt_or_none(sent_at),
+            resend_id=str(resend_id) if resend_id else None,
+            opened_at=_parse_dt_or_none(opened_at),
+            clicked_at=_parse_dt_or_none(clicked_at),
+            replied_at=_parse_dt_or_none(replied_at),
+            bounced_at=_parse_dt_or_none(bounced_at),
+            complained_at=_parse_dt_or_none(complained_at),
+            last_event=str(last_event) if last_event else None,
+            task_id=str(task_id) if task_id else None,
         )
 
 
+class EnhancedLeadBatch:
+    """
+    Column-oriented view over raw leads tab rows.
+
+    Each column is kept as a list of cell values, so bulk filters scan
+    one column instead of parsing every row into an EnhancedLead first.
+    Only the rows that survive a filter are materialized.
+    """
+
+    __slots__ = ("columns", "widths")
+
+    def __init__(self, columns: Dict[str, List[Any]], widths: List[int]):
+        self.columns = columns
+        # Original row lengths - from_sheets_row treats absent columns
+        # differently from blank ones, so rows() hands back the unpadded row
+        self.widths = widths
+
+    @classmethod
+    def from_sheets_rows(cls, rows: List[List[Any]]) -> "EnhancedLeadBatch":
+        """Transpose raw sheet rows (no header) into per-column lists."""
+        width = _LEAD_COLUMN_COUNT
+        widths = [len(row) for row in rows]
+        padded = [
+            row if n >= width else list(row) + [""] * (width - n)
+            for row, n in zip(rows, widths)
+        ]
+        if padded:
+            columns = {
+                name: list(values)
+                for name, values in zip(EnhancedLead.HEADERS, zip(*padded))
+            }
+        else:
+            columns = {name: [] for name in EnhancedLead.HEADERS}
+        return cls(columns, widths)
+
+    def __len__(self) -> int:
+        return len(self.widths)
+
+    def column(self, name: str) -> List[Any]:
+        """Raw cell values for one column."""
+        return self.columns[name]
+
+    def filter(self, mask: Iterable[bool]) -> "EnhancedLeadBatch":
+        """New batch holding only the rows where mask is true."""
+        mask = list(mask)
+        columns = {
+            name: list(compress(values, mask))
+            for name, values in self.columns.items()
+        }
+        return EnhancedLeadBatch(columns, list(compress(self.widths, mask)))
+
+    def send_candidate_mask(self) -> List[bool]:
+        """
+        Rows that could pass the send eligibility check, from raw cells.
+
+        True where the status normalizes to NEW/APPROVED (as in
+        from_sheets_row, so blank counts as NEW), the email is non-blank and
+        either the status is APPROVED or send_eligible parses true - a
+        superset of the final per-lead check, which needs a parsed lead.
+        """
+        normalize = EnhancedLead._normalize_status
+        return [
+            status in NEW_OR_APPROVED
+            and bool(email.strip())
+            and (status == "APPROVED" or _parse_bool(eligible))
+            for status, email, eligible in zip(
+                map(normalize, self.columns["status"]),
+                (str(v) for v in self.columns["email"]),
+                self.columns["send_eligible"],
+            )
+        ]
+
+    def rows(self) -> Iterator[List[Any]]:
+        """Yield rows in their original (unpadded) length."""
+        for row, n in zip(zip(*self.columns.values()), self.widths):
+            yield list(row[:n])
+
+    def to_sheets_rows(self) -> List[List[Any]]:
+        """Full-width rows in leads tab column order."""
+        return [list(row) for row in zip(*self.columns.values())]
+
+
 # =============================================================================
 # DEDUPE KEY
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class DedupeKey:
     """Entry in the dedupe_keys lookup table.
 
@@ -495,7 +738,7 @@ class DedupeKey:
     key_type: str  # "place_id", "source_url", "email", "phone", "name_city"
     key_value: str  # The actual key value (normalized/lowercase)
     lead_id: str   # Reference to the lead that owns this key
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=batch_now)
 
     def to_sheets_row(self) -> List[Any]:
         """Convert to Google Sheets row format."""
@@ -503,18 +746,21 @@ class DedupeKey:
             self.key_type,
             self.key_value,
             self.lead_id,
-            self.created_at.isoformat() if self.created_at else "",
+            _format_iso(self.created_at) if self.created_at else "",
         ]
 
-    @staticmethod
-    def headers() -> List[str]:
+    # Column headers for Google Sheets (built once, at import)
+    HEADERS: ClassVar[Tuple[str, ...]] = (
+        "key_type",
+        "key_value",
+        "lead_id",
+        "created_at",
+    )
+
+    @classmethod
+    def headers(cls) -> Tuple[str, ...]:
         """Column headers for Google Sheets."""
-        return [
-            "key_type",
-            "key_value",
-            "lead_id",
-            "created_at",
-        ]
+        return cls.HEADERS
 
     @classmethod
     def from_sheets_row(cls, row: List[Any]) -> "DedupeKey":
@@ -523,7 +769,7 @@ class DedupeKey:
             key_type=str(row[0]),
             key_value=str(row[1]),
             lead_id=str(row[2]),
-            created_at=datetime.fromisoformat(row[3]) if row[3] else datetime.utcnow(),
+            created_at=_parse_iso(row[3]) if row[3] else batch_now(),
         )
 
 
@@ -531,7 +777,7 @@ class DedupeKey:
 # RUN LOG ENTRY
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class RunLogEntry:
     """Entry in the run_log table for execution history."""
 
@@ -562,8 +808,8 @@ class RunLogEntry:
             self.trade,
             self.city,
             self.session.value,
-            self.started_at.isoformat() if self.started_at else "",
-            self.completed_at.isoformat() if self.completed_at else "",
+            _format_iso(self.started_at) if self.started_at else "",
+            _format_iso(self.completed_at) if self.completed_at else "",
             self.status,
             self.leads_found,
             self.leads_after_dedupe,
@@ -574,39 +820,42 @@ class RunLogEntry:
             self.duration_seconds or "",
         ]
 
-    @staticmethod
-    def headers() -> List[str]:
+    # Column headers for Google Sheets (built once, at import)
+    HEADERS: ClassVar[Tuple[str, ...]] = (
+        "run_id",
+        "task_id",
+        "trade",
+        "city",
+        "session",
+        "started_at",
+        "completed_at",
+        "status",
+        "leads_found",
+        "leads_after_dedupe",
+        "leads_enriched",
+        "leads_eligible",
+        "leads_auto_approved",
+        "error_message",
+        "duration_seconds",
+    )
+
+    @classmethod
+    def headers(cls) -> Tuple[str, ...]:
         """Column headers for Google Sheets."""
-        return [
-            "run_id",
-            "task_id",
-            "trade",
-            "city",
-            "session",
-            "started_at",
-            "completed_at",
-            "status",
-            "leads_found",
-            "leads_after_dedupe",
-            "leads_enriched",
-            "leads_eligible",
-            "leads_auto_approved",
-            "error_message",
-            "duration_seconds",
-        ]
+        return cls.HEADERS
 
 
 # =============================================================================
 # EMAIL CAMPAIGN
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class EmailCampaign:
     """Email campaign tracking."""
 
     campaign_id: str  # UUID
     name: str
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=batch_now)
 
     # Stats (updated after sends)
     total_sent: int = 0
@@ -633,12 +882,24 @@ class EmailCampaign:
     def complaint_rate(self) -> float:
         return (self.total_complained / self.total_sent) if self.total_sent > 0 else 0
 
+    def record_event(self, kind: str, n: int = 1):
+        """
+        Add n to a campaign total.
+
+        Args:
+            kind: Total to bump - "sent", "opened", "clicked", "replied",
+                "bounced" or "complained"
+            n: Amount to add
+        """
+        attr = f"total_{kind}"
+        setattr(self, attr, getattr(self, attr) + n)
+
     def to_sheets_row(self) -> List[Any]:
         """Convert to Google Sheets row format."""
         return [
             self.campaign_id,
             self.name,
-            self.created_at.isoformat() if self.created_at else "",
+            _format_iso(self.created_at) if self.created_at else "",
             self.total_sent,
             self.total_opened,
             self.total_clicked,
@@ -647,17 +908,20 @@ class EmailCampaign:
             self.total_complained,
         ]
 
-    @staticmethod
-    def headers() -> List[str]:
+    # Column headers for Google Sheets (built once, at import)
+    HEADERS: ClassVar[Tuple[str, ...]] = (
+        "campaign_id",
+        "name",
+        "created_at",
+        "total_sent",
+        "total_opened",
+        "total_clicked",
+        "total_replied",
+        "total_bounced",
+        "total_complained",
+    )
+
+    @classmethod
+    def headers(cls) -> Tuple[str, ...]:
         """Column headers for Google Sheets."""
-        return [
-            "campaign_id",
-            "name",
-            "created_at",
-            "total_sent",
-            "total_opened",
-            "total_clicked",
-            "total_replied",
-            "total_bounced",
-            "total_complained",
-        ]
+        return cls.HEADERS
@@ -12,15 +12,22 @@ This module provides multi-tab support for the sequencing system:
 
 import os
 import json
+import random
 import tempfile
+import threading
 import time
 import functools
-from typing import List, Dict, Set, Optional, Any, Tuple
+from collections import deque
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Dict, Set, Optional, Any, Tuple
 from datetime import datetime
 
 import gspread
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.service_account import Credentials
 from gspread.exceptions import APIError
+from gspread.urls import DRIVE_FILES_API_V3_URL
+from requests.adapters import HTTPAdapter
 
 
 class SheetsWriteStats:
@@ -57,12 +64,148 @@ def get_write_stats() -> SheetsWriteStats:
     return _write_stats
 
 
+class AdaptivePacer:
+    """
+    AIMD pacing for Sheets API calls.
+
+    The minimum gap enforced between calls doubles on every rate-limit
+    error (multiplicative decrease of the request rate) and shrinks by a
+    fixed step on every success (additive increase), so a run that hits
+    the quota slows itself down instead of retrying at the same rate.
+    """
+
+    def __init__(self, step: float = 0.05, max_interval: float = 10.0):
+        self.interval = 0.0
+        self.step = step
+        self.max_interval = max_interval
+        self._last_call = 0.0
+
+    def wait(self):
+        """Sleep until the current interval has passed since the last call."""
+        if self.interval > 0:
+            remaining = self._last_call + self.interval - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+        self._last_call = time.monotonic()
+
+    def on_success(self):
+        if self.interval:
+            self.interval = max(0.0, self.interval - self.step)
+
+    def on_rate_limit(self):
+        self.interval = min(self.max_interval, max(self.interval * 2, 0.5))
+
+
+# Shared by every decorated call - the quota is per user, not per method
+_pacer = AdaptivePacer()
+
+
+class RequestWindow:
+    """
+    Sliding one-minute window over Sheets API requests for one quota bucket.
+
+    acquire() blocks while the last minute already holds limit requests, or
+    while the server has told us to back off, so calls wait for quota up
+    front instead of spending a request on a 429. Thread-safe.
+    """
+
+    def __init__(self, limit: int, window: float = 60.0):
+        self.limit = limit
+        self.window = window
+        self.blocked_until = 0.0
+        self._sent: deque = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Wait for a free slot in the window, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._sent and now - self._sent[0] >= self.window:
+                    self._sent.popleft()
+                wait = self.blocked_until - now
+                if wait <= 0:
+                    if len(self._sent) < self.limit:
+                        self._sent.append(now)
+                        return
+                    wait = self._sent[0] + self.window - now
+            time.sleep(wait)
+
+    def block_for(self, seconds: float):
+        """Hold every caller back for the next seconds."""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+# Sheets quotas are per minute per user, counted separately for reads and
+# writes (60 each by default)
+SHEETS_READS_PER_MINUTE = 60
+SHEETS_WRITES_PER_MINUTE = 60
+
+_read_window = RequestWindow(SHEETS_READS_PER_MINUTE)
+_write_window = RequestWindow(SHEETS_WRITES_PER_MINUTE)
+
+
+class QuotaGatedSession(AuthorizedSession):
+    """
+    AuthorizedSession that passes every API request through a RequestWindow.
+
+    Covers all traffic on the client - decorated or not - and feeds any
+    Retry-After (or X-RateLimit-Remaining/-Reset, where a server sends
+    them) back into the window so other callers pause too.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # .active is set on a thread while its request holds a window slot
+        self._gate = threading.local()
+
+    def request(self, method, url, *args, **kwargs):
+        # AuthorizedSession.request calls itself again to retry after a
+        # credentials refresh (401) - that retry rides on the outer call's
+        # slot rather than taking, or waiting for, a second one
+        if getattr(self._gate, "active", False):
+            return super().request(method, url, *args, **kwargs)
+
+        window = _read_window if method.upper() == "GET" else _write_window
+        window.acquire()
+        self._gate.active = True
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        finally:
+            self._gate.active = False
+
+        # Hints are capped at one window, in case a server sends an epoch
+        # timestamp rather than a delay
+        headers = response.headers
+        try:
+            if response.status_code == 429 and "Retry-After" in headers:
+                window.block_for(min(float(headers["Retry-After"]), window.window))
+            elif headers.get("X-RateLimit-Remaining") == "0" and "X-RateLimit-Reset" in headers:
+                window.block_for(min(float(headers["X-RateLimit-Reset"]), window.window))
+        except (TypeError, ValueError):
+            pass  # Unparseable hint - the retry decorator still backs off
+        return response
+
+
+def _retry_after_seconds(e: APIError) -> float:
+    """Seconds from the response's Retry-After header (0 if absent or not a number)."""
+    response = getattr(e, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("Retry-After", 0))
+    except (TypeError, ValueError):
+        return 0.0
+
+
 def retry_on_rate_limit(max_retries: int = 3, base_delay: float = 10.0, max_delay: float = 65.0):
     """
     Decorator to retry operations on Google Sheets API errors (429 rate limit, 500 internal).
 
-    Uses exponential backoff with a minimum delay of base_delay and maximum of max_delay.
-    The per-minute quota limit requires waiting ~60s, so max_delay defaults to 65s.
+    Uses jittered exponential backoff with a minimum delay of base_delay and maximum of
+    max_delay, never shorter than the server's Retry-After. The per-minute quota limit
+    requires waiting ~60s, so max_delay defaults to 65s. Calls are also paced by the
+    shared AdaptivePacer, which widens the gap between calls after a 429.
 
     Args:
         max_retries: Maximum number of retry attempts
@@ -78,7 +221,9 @@ def retry_on_rate_limit(max_retries: int = 3, base_delay: float = 10.0, max_dela
             retry_count = 0
             for attempt in range(max_retries + 1):
                 try:
+                    _pacer.wait()
                     result = func(*args, **kwargs)
+                    _pacer.on_success()
                     if retry_count > 0:
                         _write_stats.retries += retry_count
                     return result
@@ -87,8 +232,12 @@ def retry_on_rate_limit(max_retries: int = 3, base_delay: float = 10.0, max_dela
                     if status_code in RETRYABLE_STATUS_CODES:
                         last_exception = e
                         retry_count += 1
+                        if status_code == 429:
+                            _pacer.on_rate_limit()
                         if attempt < max_retries:
-                            delay = min(base_delay * (2 ** attempt), max_delay)
+                            # Jitter keeps concurrent runs from retrying in lockstep
+                            delay = min(base_delay * (2 ** attempt) * random.uniform(0.5, 1.5), max_delay)
+                            delay = max(delay, _retry_after_seconds(e))
                             print(f"  [Sheets] API error ({status_code}), waiting {delay:.0f}s (attempt {attempt + 1}/{max_retries})...")
                             time.sleep(delay)
                             continue
@@ -102,13 +251,43 @@ def retry_on_rate_limit(max_retries: int = 3, base_delay: float = 10.0, max_dela
         return wrapper
     return decorator
 
-from src.sequencer_config import SHEETS_TABS
+from src.email_sanitizer import sanitize_email
+from src.sequencer_config import LEADS_SNAPSHOT_ENABLED, LEADS_SNAPSHOT_PATH, SHEETS_TABS
 from src.sequencer_models import (
     QueueTask, TaskStatus, SessionType,
-    RunnerState, EnhancedLead, DedupeKey,
-    RunLogEntry, EmailCampaign, DedupeMatchType
+    RunnerState, EnhancedLead, EnhancedLeadBatch, DedupeKey,
+    RunLogEntry, EmailCampaign, DedupeMatchType, NEW_OR_APPROVED
 )
 
+# sanitize_email() memoized per process for select_eligible_leads (results
+# are never mutated, and repeat addresses are common across scans)
+_sanitize_email_cached = functools.lru_cache(maxsize=4096)(sanitize_email)
+
+# Header row of the helpers tab; each column holds one formula in row 2
+HELPER_HEADERS = ["eligible_rows"]
+
+# Cell on the helpers tab whose FILTER formula spills down the row numbers
+# of leads that may be send-eligible (see _get_eligible_row_numbers)
+ELIGIBLE_ROWS_CELL = "A2"
+
+# A1 ranges per values_batch_get when fetching eligible rows (keeps the
+# request URL short)
+ELIGIBLE_FETCH_RANGES = 100
+
+# Seconds a tab's get_all_values() result is reused (see _get_values_cached)
+VALUES_CACHE_TTL = 30.0
+
+# Rows per range read when streaming the leads tab (see iter_all_leads)
+LEADS_READ_CHUNK = 1000
+
+# Rows per append_rows request in append_leads
+LEADS_APPEND_CHUNK = 500
+
+# Render options for lead row reads that are parsed straight into
+# EnhancedLead: TRUE/FALSE cells arrive as Python bools and numbers as
+# numbers (from_sheets_row coerces those), while dates stay strings
+TYPED_READ_PARAMS = {"valueRenderOption": "UNFORMATTED_VALUE", "dateTimeRenderOption": "FORMATTED_STRING"}
+
 
 class SequencerSheetsManager:
     """Multi-tab Google Sheets manager for the sequencing engine."""
@@ -159,7 +338,14 @@ class SequencerSheetsManager:
 
             credentials = Credentials.from_service_account_file(creds_path, scopes=scopes)
 
-        self.client = gspread.authorize(credentials)
+        # One authorized session (keep-alive connection pool) for the manager's
+        # lifetime, so each call reuses a warm TLS connection. No adapter-level
+        # retries - retry_on_rate_limit owns retry policy; the session itself
+        # holds calls back once the per-minute quota is used up
+        session = QuotaGatedSession(credentials)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        session.mount("https://", adapter)
+        self.client = gspread.Client(auth=credentials, session=session)
 
         sheet_id = sheet_id or os.getenv("GOOGLE_SHEET_ID")
         if not sheet_id:
@@ -171,6 +357,40 @@ class SequencerSheetsManager:
         # Cache worksheet references
         self._worksheets: Dict[str, gspread.Worksheet] = {}
 
+        # title -> Worksheet from the last full tab listing (see _load_worksheets),
+        # so get_or_create_tab needn't fetch metadata once per tab
+        self._tab_lookup: Dict[str, gspread.Worksheet] = {}
+
+        # Whether the state tab's header row is known to exist (see save_runner_state)
+        self._state_tab_initialized = False
+
+        # Whether ELIGIBLE_ROWS_CELL's formula has been written (see get_eligible_leads)
+        self._eligible_rows_formula_set = False
+
+        # tab title -> (fetched_at monotonic time, get_all_values() rows)
+        self._values_cache: Dict[str, Tuple[float, List[List[str]]]] = {}
+
+        # tab title -> {header: 0-based column}, read once per tab (see _get_headers)
+        self._headers: Dict[str, Dict[str, int]] = {}
+
+        # (built_at monotonic time, lead_id -> row number) read from the
+        # leads tab's lead_id column only, kept current on append_leads -
+        # see _find_lead_row
+        self._lead_id_index: Optional[Tuple[float, Dict[str, int]]] = None
+
+    def _load_worksheets(self) -> List[gspread.Worksheet]:
+        """All worksheets from one metadata fetch, remembered for get_or_create_tab."""
+        worksheets = self.spreadsheet.worksheets()
+        self._tab_lookup = {ws.title: ws for ws in worksheets}
+        return worksheets
+
+    def _reload_worksheet(self, tab_name: str) -> gspread.Worksheet:
+        """Re-fetch one worksheet's metadata (e.g. a grid size grown by appends)."""
+        worksheet = self.spreadsheet.worksheet(tab_name)
+        self._worksheets[tab_name] = worksheet
+        self._tab_lookup[tab_name] = worksheet
+        return worksheet
+
     def get_service_account_email(self) -> Optional[str]:
         """Get the service account email used for authentication."""
         return self._service_account_email
@@ -197,12 +417,12 @@ class SequencerSheetsManager:
             return self._worksheets[tab_name]
 
         try:
-            worksheet = self.spreadsheet.worksheet(tab_name)
+            worksheet = self._tab_lookup.get(tab_name) or self.spreadsheet.worksheet(tab_name)
         except gspread.exceptions.WorksheetNotFound:
             # For critical tabs (like leads), fail with helpful error
             if headers and tab_name == SHEETS_TABS.get("leads", "leads"):
                 # List all available tabs
-                all_tabs = [ws.title for ws in self.spreadsheet.worksheets()]
+                all_tabs = [ws.title for ws in self._load_worksheets()]
                 raise ValueError(
                     f"Required tab '{tab_name}' not found. Available tabs: {', '.join(all_tabs)}\n"
                     f"Set LEADS_SHEET_TAB environment variable to the correct tab name."
@@ -223,14 +443,93 @@ class SequencerSheetsManager:
         self._worksheets[tab_name] = worksheet
         return worksheet
     
+    def _get_values_cached(self, sheet: gspread.Worksheet, ttl: float = VALUES_CACHE_TTL) -> List[List[str]]:
+        """
+        get_all_values() for a tab, reused for ttl seconds.
+
+        Row lookups in a loop (status updates, task updates) then share one
+        read instead of re-downloading the tab per call. Writers through this
+        manager invalidate or patch the entry. The returned rows are shared -
+        don't mutate them.
+
+        Args:
+            sheet: Worksheet to read
+            ttl: Seconds a cached read stays valid (0 to force a re-read)
+
+        Returns:
+            All rows, header included
+        """
+        now = time.monotonic()
+        cached = self._values_cache.get(sheet.title)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+
+        all_rows = sheet.get_all_values()
+        self._values_cache[sheet.title] = (now, all_rows)
+        return all_rows
+
+    def _get_headers(self, sheet: gspread.Worksheet) -> Dict[str, int]:
+        """
+        Header name -> 0-based column for a tab, read once and memoized.
+
+        Writers only need the header row to resolve columns, so this saves
+        re-reading (and list-scanning) it on every call. Re-read only when
+        the leads headers are re-validated.
+
+        Args:
+            sheet: Worksheet to read
+
+        Returns:
+            Dict of stripped header -> column index (first match wins, like
+            list.index)
+        """
+        cols = self._headers.get(sheet.title)
+        if cols is None:
+            cols = {}
+            for i, header in enumerate(sheet.row_values(1)):
+                cols.setdefault(header.strip(), i)
+            self._headers[sheet.title] = cols
+        return cols
+
+    def _invalidate_cache(self, tab_name: str = None):
+        """Drop the cached values for one tab (or every tab)."""
+        if tab_name is None:
+            self._values_cache.clear()
+        else:
+            self._values_cache.pop(tab_name, None)
+
+    def _patch_cached_values(self, tab_name: str, cells: List[Tuple[int, int, Any]]):
+        """
+        Apply just-written cells to a tab's cached rows, keeping it warm.
+
+        Args:
+            tab_name: Tab the cells were written to
+            cells: (1-based row, 0-based column, value) triples
+        """
+        cached = self._values_cache.get(tab_name)
+        if cached is None:
+            return
+        all_rows = cached[1]
+        for row_idx, col, value in cells:
+            if row_idx > len(all_rows):
+                # Row not in the snapshot - can't patch, re-read next time
+                self._invalidate_cache(tab_name)
+                return
+            row = all_rows[row_idx - 1]
+            if len(row) <= col:
+                row.extend([""] * (col + 1 - len(row)))
+            row[col] = "" if value is None else str(value)
+
     @retry_on_rate_limit(max_retries=3, base_delay=10.0)
     def _validate_leads_headers(self, worksheet: gspread.Worksheet, expected_headers: List[str]):
         """Validate that leads tab has required headers."""
-        all_rows = worksheet.get_all_values()
-        if len(all_rows) == 0:
+        # Headers may have been fixed since they were memoized
+        self._headers.pop(worksheet.title, None)
+        # Header row only - not the whole tab
+        actual_headers = [h.strip() for h in worksheet.row_values(1)]
+        if not actual_headers:
             return  # Empty sheet, will be created with headers
         
-        actual_headers = [h.strip() for h in all_rows[0]]
         missing_headers = []
         for expected in expected_headers:
             if expected not in actual_headers:
@@ -260,30 +559,65 @@ class SequencerSheetsManager:
                 )
             raise ValueError(error_msg)
 
+        # Seed the header map from this read so _get_headers needn't repeat it
+        cols: Dict[str, int] = {}
+        for i, header in enumerate(actual_headers):
+            cols.setdefault(header, i)
+        self._headers[worksheet.title] = cols
+
     def ensure_all_tabs(self):
         """Create all required tabs with headers if they don't exist."""
         print("Ensuring all required tabs exist...")
 
-        # Queue tab
-        self.get_or_create_tab(SHEETS_TABS["queue"], QueueTask.headers())
-
-        # State tab
-        self.get_or_create_tab(SHEETS_TABS["state"], RunnerState.headers())
-
-        # Leads tab
-        self.get_or_create_tab(SHEETS_TABS["leads"], EnhancedLead.headers())
-
-        # Dedupe keys tab
-        self.get_or_create_tab(SHEETS_TABS["dedupe_keys"], DedupeKey.headers())
-
-        # Run log tab
-        self.get_or_create_tab(SHEETS_TABS["run_log"], RunLogEntry.headers())
+        required = [
+            (SHEETS_TABS["queue"], QueueTask.headers()),
+            (SHEETS_TABS["state"], RunnerState.headers()),
+            (SHEETS_TABS["leads"], EnhancedLead.headers()),
+            (SHEETS_TABS["dedupe_keys"], DedupeKey.headers()),
+            (SHEETS_TABS["run_log"], RunLogEntry.headers()),
+            (SHEETS_TABS["campaigns"], EmailCampaign.headers()),
+            (SHEETS_TABS["email_blocklist"], ["email", "reason", "added_at"]),
+            (SHEETS_TABS["sends_today"], ["lead_id", "email", "sent_at"]),
+            (SHEETS_TABS["helpers"], HELPER_HEADERS),
+        ]
 
-        # Campaigns tab
-        self.get_or_create_tab(SHEETS_TABS["campaigns"], EmailCampaign.headers())
+        # One metadata fetch, then every missing tab is created in one
+        # batch_update and given its headers in one values_batch_update,
+        # rather than a lookup + add_worksheet + update per tab. The leads
+        # tab is never created here - get_or_create_tab reports it missing.
+        existing = {ws.title for ws in self._load_worksheets()}
+        missing = [
+            (tab_name, headers)
+            for tab_name, headers in required
+            if tab_name not in existing and tab_name != SHEETS_TABS["leads"]
+        ]
+        if missing:
+            for tab_name, _ in missing:
+                print(f"  Creating tab: {tab_name}")
+            self.spreadsheet.batch_update({
+                "requests": [
+                    {
+                        "addSheet": {
+                            "properties": {
+                                "title": tab_name,
+                                "gridProperties": {"rowCount": 1000, "columnCount": len(headers)},
+                            }
+                        }
+                    }
+                    for tab_name, headers in missing
+                ]
+            })
+            self.spreadsheet.values_batch_update({
+                "valueInputOption": "USER_ENTERED",
+                "data": [
+                    {"range": f"'{tab_name}'!A1", "values": [list(headers)]}
+                    for tab_name, headers in missing
+                ],
+            })
+            self._load_worksheets()
 
-        # Email blocklist tab
-        self.get_or_create_tab(SHEETS_TABS["email_blocklist"], ["email", "reason", "added_at"])
+        for tab_name, headers in required:
+            self.get_or_create_tab(tab_name, headers)
 
         print("All tabs ready.")
 
@@ -312,6 +646,7 @@ class SequencerSheetsManager:
         sheet = self.get_queue_tab()
         rows = [task.to_sheets_row() for task in tasks]
         sheet.append_rows(rows, value_input_option="USER_ENTERED")
+        self._invalidate_cache(sheet.title)
         return len(rows)
 
     @retry_on_rate_limit(max_retries=3, base_delay=10.0)
@@ -326,7 +661,7 @@ class SequencerSheetsManager:
             List of QueueTask objects
         """
         sheet = self.get_queue_tab()
-        all_rows = sheet.get_all_values()
+        all_rows = self._get_values_cached(sheet)
 
         if len(all_rows) < 2:
             return []
@@ -355,9 +690,29 @@ class SequencerSheetsManager:
         Returns:
             List of QueueTask objects
         """
-        all_pending = self.get_pending_tasks(limit=500)
-        filtered = [t for t in all_pending if t.trade == trade]
-        return filtered[:limit]
+        # Served from the cached queue read, so inspecting several trades in
+        # a row costs one download. Rows are screened on their raw trade and
+        # status cells and only matches are parsed - and unlike a capped
+        # get_pending_tasks() pass, no pending task of this trade is missed.
+        sheet = self.get_queue_tab()
+        all_rows = self._get_values_cached(sheet)
+
+        col_trade = QueueTask.HEADERS.index("trade")
+        col_status = QueueTask.HEADERS.index("status")
+        pending = TaskStatus.PENDING.value
+
+        tasks = []
+        for row in all_rows[1:]:  # Skip header
+            if len(row) <= col_status or row[col_trade] != trade or row[col_status] != pending:
+                continue
+            try:
+                tasks.append(QueueTask.from_sheets_row(row))
+            except Exception as e:
+                print(f"  Warning: Could not parse queue row: {e}")
+
+        # Sort by priority (lower = higher priority)
+        tasks.sort(key=lambda t: t.priority)
+        return tasks[:limit]
 
     @retry_on_rate_limit(max_retries=3, base_delay=10.0)
     def update_task_status(
@@ -379,46 +734,56 @@ class SequencerSheetsManager:
             error_message: Error message if failed (optional)
         """
         sheet = self.get_queue_tab()
-        all_rows = sheet.get_all_values()
-        headers = all_rows[0]
+        all_rows = self._get_values_cached(sheet)
+        cols = self._get_headers(sheet)
 
         # Find column indices
-        col_task_id = headers.index("task_id")
-        col_status = headers.index("status")
+        col_task_id = cols["task_id"]
 
         # Find and update the row
         for row_idx, row in enumerate(all_rows[1:], start=2):
             if row[col_task_id] == task_id:
-                # Update status
-                sheet.update_cell(row_idx, col_status + 1, status.value)
+                # Collect every touched cell, then write them in one call
+                fields = {"status": status.value}
 
                 # Update timestamps
                 if status == TaskStatus.IN_PROGRESS:
-                    col = headers.index("started_at")
-                    sheet.update_cell(row_idx, col + 1, datetime.utcnow().isoformat())
+                    fields["started_at"] = datetime.utcnow().isoformat()
                 elif status in (TaskStatus.COMPLETED, TaskStatus.FAILED):
-                    col = headers.index("completed_at")
-                    sheet.update_cell(row_idx, col + 1, datetime.utcnow().isoformat())
+                    fields["completed_at"] = datetime.utcnow().isoformat()
 
                 # Update counts
                 if leads_found is not None:
-                    col = headers.index("leads_found")
-                    sheet.update_cell(row_idx, col + 1, leads_found)
+                    fields["leads_found"] = leads_found
 
                 if leads_after_dedupe is not None:
-                    col = headers.index("leads_after_dedupe")
-                    sheet.update_cell(row_idx, col + 1, leads_after_dedupe)
+                    fields["leads_after_dedupe"] = leads_after_dedupe
 
                 if error_message:
-                    col = headers.index("error_message")
-                    sheet.update_cell(row_idx, col + 1, error_message)
+                    fields["error_message"] = error_message
+
+                cell_updates = [
+                    {
+                        "range": f"{self._col_letter(cols[field] + 1)}{row_idx}",
+                        "values": [[value]],
+                    }
+                    for field, value in fields.items()
+                ]
+                sheet.batch_update(cell_updates, value_input_option="USER_ENTERED")
+                _write_stats.record_batch(1)
+                self._invalidate_cache(sheet.title)
 
                 return
 
     def clear_queue(self):
         """Clear all tasks from the queue (keeps headers)."""
         sheet = self.get_queue_tab()
-        sheet.delete_rows(2, sheet.row_count)
+        # Values-only clear: one request, and the grid keeps its size
+        # instead of being shrunk here and regrown by the next append
+        last_col = self._col_letter(len(QueueTask.headers()))
+        sheet.batch_clear([f"A2:{last_col}"])
+        _write_stats.record_batch(0)
+        self._invalidate_cache(sheet.title)
 
     # =========================================================================
     # STATE OPERATIONS
@@ -458,18 +823,19 @@ class SequencerSheetsManager:
         """
         sheet = self.get_state_tab()
         row = state.to_sheets_row()
+        last_col = chr(65 + len(row) - 1)
+
+        # Ensure we have headers - checked once per manager; after that the
+        # tab is known to be set up and each save is a single write
+        if not self._state_tab_initialized:
+            if not sheet.row_values(1):
+                sheet.update(f"A1:{last_col}2", [list(RunnerState.headers()), row], value_input_option="USER_ENTERED")
+                self._state_tab_initialized = True
+                return
+            self._state_tab_initialized = True
 
-        # Ensure we have headers
-        if len(sheet.get_all_values()) == 0:
-            sheet.update('A1', [RunnerState.headers()])
-
-        # Update or append state row
-        if len(sheet.get_all_values()) < 2:
-            sheet.append_rows([row], value_input_option="USER_ENTERED")
-        else:
-            # Update row 2 (state is always in row 2)
-            cell_range = f"A2:{chr(65 + len(row) - 1)}2"
-            sheet.update(cell_range, [row], value_input_option="USER_ENTERED")
+        # Write row 2 (state is always in row 2)
+        sheet.update(f"A2:{last_col}2", [row], value_input_option="USER_ENTERED")
 
     def update_focus_trade(self, trade: str, date_str: str):
         """
@@ -508,22 +874,158 @@ class SequencerSheetsManager:
         Returns:
             List of dicts with title, row_count, col_count, headers
         """
+        worksheets = self._load_worksheets()
+        if not worksheets:
+            return []
+
+        # Header row and column A of every tab in one request, instead of a
+        # full get_all_values() per tab. Rows are counted down column A.
+        ranges = []
+        for ws in worksheets:
+            ranges.append(f"'{ws.title}'!1:1")
+            ranges.append(f"'{ws.title}'!A:A")
+        value_ranges = self.spreadsheet.values_batch_get(ranges)["valueRanges"]
+
         tabs_info = []
-        for ws in self.spreadsheet.worksheets():
-            all_rows = ws.get_all_values()
+        for i, ws in enumerate(worksheets):
+            header_rows = value_ranges[2 * i].get("values", [])
+            headers = header_rows[0] if header_rows else []
             tabs_info.append({
                 "title": ws.title,
-                "row_count": len(all_rows),
-                "col_count": len(all_rows[0]) if all_rows else 0,
-                "headers": all_rows[0] if all_rows else [],
+                "row_count": len(value_ranges[2 * i + 1].get("values", [])),
+                "col_count": len(headers),
+                "headers": headers,
             })
         return tabs_info
 
-    @retry_on_rate_limit(max_retries=3, base_delay=10.0)
+    def _get_lead_id_index(self, ttl: float = VALUES_CACHE_TTL) -> Tuple[Dict[str, int], Dict[str, int], bool]:
+        """
+        Map lead_id -> sheet row number, fetching only the lead_id column.
+
+        Args:
+            ttl: Seconds a built index stays valid (0 to force a rebuild)
+
+        Returns:
+            Tuple of (leads header columns, index, whether the index was just built)
+        """
+        sheet = self.get_leads_tab()
+        cols = self._get_headers(sheet)
+
+        now = time.monotonic()
+        if self._lead_id_index is not None and now - self._lead_id_index[0] < ttl:
+            return cols, self._lead_id_index[1], False
+
+        col = self._col_letter(cols["lead_id"] + 1)
+        response = self.spreadsheet.values_batch_get([f"'{sheet.title}'!{col}2:{col}"])
+        values = response["valueRanges"][0].get("values", [])
+
+        index: Dict[str, int] = {}
+        for row_idx, cells in enumerate(values, start=2):
+            if cells:
+                index.setdefault(cells[0], row_idx)  # First match wins, like a row scan
+
+        self._lead_id_index = (now, index)
+        return cols, index, True
+
+    def _index_appended_leads(self, leads: List[EnhancedLead], response: Any):
+        """
+        Add just-appended leads to the lead_id index without re-reading it.
+
+        Row numbers come from the append response's updatedRange
+        (e.g. "'leads'!A101:AG150"). If that can't be parsed the index is
+        dropped and rebuilt on next use.
+        """
+        if self._lead_id_index is None:
+            return
+        try:
+            updated_range = response["updates"]["updatedRange"]
+            first_cell = updated_range.split("!")[-1].split(":")[0]
+            first_row = int("".join(ch for ch in first_cell if ch.isdigit()))
+        except (KeyError, TypeError, ValueError):
+            self._lead_id_index = None
+            return
+
+        index = self._lead_id_index[1]
+        for row_idx, lead in enumerate(leads, start=first_row):
+            index.setdefault(lead.lead_id, row_idx)
+
+    def _find_lead_row(self, lead_id: str) -> Optional[Tuple[Dict[str, int], int, List[str]]]:
+        """
+        Locate a lead's row and read just that row, live.
+
+        The lead_id index may be stale (rows appended or moved by another
+        run), so the fetched row is checked against lead_id and the index
+        rebuilt once on a miss or mismatch.
+
+        Returns:
+            Tuple of (header columns, row number, row values padded to the headers),
+            or None if the lead isn't on the sheet
+        """
+        sheet = self.get_leads_tab()
+        for attempt in range(2):
+            # The index is kept for the manager's lifetime (appends are added
+            # in place) - the row check below catches anything it missed
+            cols, index, fresh = self._get_lead_id_index(ttl=0 if attempt else float("inf"))
+            row_idx = index.get(lead_id)
+            if row_idx is not None:
+                row = sheet.row_values(row_idx)
+                col_lead_id = cols["lead_id"]
+                if len(row) > col_lead_id and row[col_lead_id] == lead_id:
+                    width = max(cols.values()) + 1
+                    if len(row) < width:
+                        row += [""] * (width - len(row))
+                    return cols, row_idx, row
+            if fresh:
+                break  # Index was just built from the live sheet - no point retrying
+        return None
+
+    def _resolve_lead_rows(self, lead_ids: List[Optional[str]]) -> Dict[str, int]:
+        """
+        Map lead IDs to their current sheet rows via the lead_id index.
+
+        Like _find_lead_row, the kept index is checked against the live
+        sheet - here with one read of the lead_id column across the rows it
+        resolved - and rebuilt once on a miss or mismatch. Duplicate lead
+        IDs resolve to their first row.
+
+        Returns:
+            Dict of lead_id -> row number, for the IDs found on the sheet
+        """
+        wanted = {lead_id for lead_id in lead_ids if lead_id}
+        if not wanted:
+            return {}
+
+        sheet = self.get_leads_tab()
+        for attempt in range(2):
+            cols, index, fresh = self._get_lead_id_index(ttl=0 if attempt else float("inf"))
+            rows = {lead_id: index[lead_id] for lead_id in wanted if lead_id in index}
+            if fresh:
+                return rows  # Just built from the live sheet
+            if len(rows) < len(wanted):
+                continue  # Some IDs missing - rebuild
+
+            first, last = min(rows.values()), max(rows.values())
+            col = self._col_letter(cols["lead_id"] + 1)
+            response = self._batch_get_ranges([f"'{sheet.title}'!{col}{first}:{col}{last}"])
+            values = response["valueRanges"][0].get("values", [])
+            live = {
+                row_idx: cells[0] if cells else ""
+                for row_idx, cells in enumerate(values, start=first)
+            }
+            if all(live.get(row_idx) == lead_id for lead_id, row_idx in rows.items()):
+                return rows
+        return rows
+
     def append_leads(self, leads: List[EnhancedLead]) -> int:
         """
         Append leads to the leads tab.
 
+        Rows go out LEADS_APPEND_CHUNK at a time, in order, so a large
+        insert is never one oversized request and a rate-limit retry
+        resends only the chunk that failed - never rows already written.
+        Chunks are sequential on purpose: write quota is per request, so
+        sending them concurrently would only reach the limit sooner.
+
         Args:
             leads: List of EnhancedLead objects
 
@@ -534,44 +1036,229 @@ class SequencerSheetsManager:
             return 0
 
         sheet = self.get_leads_tab()
-        rows = [lead.to_sheets_row() for lead in leads]
-        sheet.append_rows(rows, value_input_option="USER_ENTERED")
+        rows = EnhancedLead.to_sheets_rows_bulk(leads)
+        try:
+            for start in range(0, len(rows), LEADS_APPEND_CHUNK):
+                chunk = rows[start:start + LEADS_APPEND_CHUNK]
+                response = self._append_rows(sheet, chunk)
+                self._index_appended_leads(leads[start:start + LEADS_APPEND_CHUNK], response)
 
-        # Track in global stats
-        _write_stats.record_batch(len(rows))
+                # Track in global stats
+                _write_stats.record_batch(len(chunk))
+        finally:
+            self._invalidate_cache(sheet.title)
 
         return len(rows)
 
     @retry_on_rate_limit(max_retries=3, base_delay=10.0)
-    def get_all_leads(self, limit: int = 10000) -> List[EnhancedLead]:
+    def _append_rows(self, sheet: gspread.Worksheet, rows: List[List[Any]]) -> Any:
+        """append_rows with retries (one chunk of append_leads)."""
+        return sheet.append_rows(rows, value_input_option="USER_ENTERED")
+
+    def get_leads_batch(self, max_age: float = 300.0) -> EnhancedLeadBatch:
         """
-        Get all leads (for analysis/breakdown).
+        Get the whole leads tab in column-oriented form for analytics scans.
+
+        With LEADS_SNAPSHOT_ENABLED, served from the local snapshot when it
+        is younger than max_age, or when the spreadsheet's Drive modifiedTime
+        still matches the one the snapshot was taken at (one metadata request
+        instead of the whole tab). Otherwise - or if Drive can't be read -
+        read from Sheets and the snapshot refreshed. Results may lag the
+        sheet by up to max_age - don't use for send decisions.
 
         Args:
-            limit: Maximum number to return
+            max_age: Seconds a snapshot stays valid (0 to force a Sheets read)
 
         Returns:
-            List of EnhancedLead objects
+            EnhancedLeadBatch of all data rows
+        """
+        if not LEADS_SNAPSHOT_ENABLED:
+            return EnhancedLeadBatch.from_sheets_rows(self._read_all_lead_rows()[1:])
+
+        batch = self.load_leads_snapshot(max_age)
+        if batch is not None:
+            return batch
+
+        # Taken before the read: if the sheet changes in between, the
+        # snapshot carries the older token and is simply re-read next time
+        token = self._get_change_token()
+        if token is not None:
+            batch = self.load_leads_snapshot(max_age, token=token)
+            if batch is not None:
+                return batch
+
+        all_rows = self._read_all_lead_rows()
+        batch = EnhancedLeadBatch.from_sheets_rows(all_rows[1:])
+        self.save_leads_snapshot(batch, token=token)
+        return batch
+
+    def _get_change_token(self) -> Optional[str]:
+        """
+        The spreadsheet's Drive modifiedTime, a cheap "has anything changed" token.
+
+        Returns:
+            modifiedTime string, or None if Drive metadata can't be read
+        """
+        try:
+            response = self.client.request(
+                "get",
+                f"{DRIVE_FILES_API_V3_URL}/{self.spreadsheet.id}",
+                params={"fields": "modifiedTime", "supportsAllDrives": True},
+            )
+            return response.json().get("modifiedTime")
+        except Exception as e:
+            # No Drive access (scope, sharing, network) - callers read live
+            print(f"  Warning: Could not read sheet modifiedTime: {e}")
+            return None
+
+    @retry_on_rate_limit(max_retries=3, base_delay=10.0)
+    def _read_all_lead_rows(self) -> List[List[str]]:
+        """All values on the leads tab, header row included."""
+        return self.get_leads_tab().get_all_values()
+
+    def save_leads_snapshot(
+        self, batch: EnhancedLeadBatch, path: str = LEADS_SNAPSHOT_PATH, token: Optional[str] = None
+    ):
+        """
+        Write a leads batch to the local snapshot file.
+
+        token is the change token (see _get_change_token) the batch was
+        read under, if known.
+
+        Written to a temp file and renamed into place, so a concurrent
+        reader never sees a half-written snapshot. Failures are logged and
+        ignored - the snapshot is only an accelerator.
+        """
+        directory = os.path.dirname(path) or "."
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(
+                    {
+                        "saved_at": time.time(),
+                        "sheet_id": self.spreadsheet.id,
+                        "token": token,
+                        "columns": batch.columns,
+                        "widths": batch.widths,
+                    },
+                    f,
+                )
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"  Warning: Could not write leads snapshot: {e}")
+
+    def load_leads_snapshot(
+        self, max_age: float = 300.0, path: str = LEADS_SNAPSHOT_PATH, token: Optional[str] = None
+    ) -> Optional[EnhancedLeadBatch]:
+        """
+        Read the local leads snapshot.
+
+        Args:
+            max_age: Seconds the snapshot stays valid
+            path: Snapshot file
+            token: Current change token - a snapshot saved under the same
+                   token is valid whatever its age
+
+        Returns:
+            EnhancedLeadBatch, or None if missing, stale or unreadable
+        """
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if data.get("sheet_id") != self.spreadsheet.id:
+            return None  # Taken from another spreadsheet
+        unchanged = token is not None and data.get("token") == token
+        if not unchanged and time.time() - data.get("saved_at", 0) > max_age:
+            return None
+        if set(data.get("columns", {})) != set(EnhancedLead.HEADERS):
+            return None  # Written for an older column layout
+
+        return EnhancedLeadBatch(data["columns"], data["widths"])
+
+    @retry_on_rate_limit(max_retries=3, base_delay=10.0)
+    def _read_lead_rows_chunk(self, sheet: gspread.Worksheet, start: int, end: int) -> List[List[Any]]:
+        """Leads tab rows start..end (1-based, inclusive), typed, trailing blank rows trimmed."""
+        last_col = self._col_letter(len(EnhancedLead.HEADERS))
+        response = self.spreadsheet.values_get(
+            f"'{sheet.title}'!A{start}:{last_col}{end}", params=TYPED_READ_PARAMS
+        )
+        return response.get("values", [])
+
+    def _iter_lead_row_chunks(self, chunk_size: int = LEADS_READ_CHUNK) -> Iterator[List[List[Any]]]:
+        """
+        Stream raw leads tab data rows, chunk_size rows per range read.
+
+        Only the chunks the caller actually consumes are downloaded. Blank
+        rows are dropped (a run of cleared rows doesn't end the scan) - the
+        scan runs to the tab's grid row count. If data reaches the last
+        known row, the grid size is re-read in case appends grew it.
         """
         sheet = self.get_leads_tab()
-        all_rows = sheet.get_all_values()
+        row_count = sheet.row_count
+        start = 2
+        while start <= row_count:
+            end = min(start + chunk_size - 1, row_count)
+            rows = self._read_lead_rows_chunk(sheet, start, end)
+            data = [row for row in rows if row]
+            if data:
+                yield data
+
+            # Trailing blank rows are trimmed, so a full-length result means
+            # the range's last row holds data
+            reached_end = len(rows) == end - start + 1
+            start = end + 1
+            if reached_end and start > row_count:
+                # Data runs to the last known row - appends may have grown the grid
+                sheet = self._reload_worksheet(sheet.title)
+                row_count = sheet.row_count
+
+    def _iter_lead_rows(self, chunk_size: int = LEADS_READ_CHUNK) -> Iterator[List[Any]]:
+        """Raw leads tab data rows, one at a time (see _iter_lead_row_chunks)."""
+        for rows in self._iter_lead_row_chunks(chunk_size):
+            yield from rows
+
+    def iter_all_leads(self, limit: int = 10000) -> Iterator[EnhancedLead]:
+        """
+        Stream leads in sheet order, parsing each chunk as it arrives.
 
-        if len(all_rows) < 2:
-            return []
+        Stops reading the sheet once limit leads have been yielded (or the
+        caller stops iterating), so the tail of a large tab is never fetched.
 
-        leads = []
-        for row in all_rows[1:]:
+        Args:
+            limit: Maximum number to yield
+
+        Yields:
+            EnhancedLead objects
+        """
+        count = 0
+        for row in self._iter_lead_rows():
             try:
-                leads.append(EnhancedLead.from_sheets_row(row))
+                lead = EnhancedLead.from_sheets_row(row)
             except Exception as e:
                 print(f"  Warning: Could not parse lead row: {e}")
+                continue
 
-            if len(leads) >= limit:
-                break
+            yield lead
+            count += 1
+            if count >= limit:
+                return
 
-        return leads
+    def get_all_leads(self, limit: int = 10000) -> List[EnhancedLead]:
+        """
+        Get all leads (for analysis/breakdown).
+
+        Args:
+            limit: Maximum number to return
+
+        Returns:
+            List of EnhancedLead objects
+        """
+        return list(islice(self.iter_all_leads(limit), limit))
 
-    @retry_on_rate_limit(max_retries=3, base_delay=10.0)
     def get_leads_by_status(self, status: str, limit: int = 100) -> List[EnhancedLead]:
         """
         Get leads with a specific status.
@@ -583,29 +1270,25 @@ class SequencerSheetsManager:
         Returns:
             List of EnhancedLead objects
         """
-        sheet = self.get_leads_tab()
-        all_rows = sheet.get_all_values()
-
-        if len(all_rows) < 2:
-            return []
-
-        headers = all_rows[0]
-        col_status = headers.index("status")
+        # Filter on the raw status cell first; only matching rows get parsed,
+        # and reading stops once limit matches are found
+        col_status = EnhancedLead.HEADERS.index("status")
+        wanted = status.upper()
 
         leads = []
-        for row in all_rows[1:]:
-            if len(row) > col_status and row[col_status].upper() == status.upper():
-                try:
-                    leads.append(EnhancedLead.from_sheets_row(row))
-                except Exception as e:
-                    print(f"  Warning: Could not parse lead row: {e}")
+        for row in self._iter_lead_rows():
+            if len(row) <= col_status or str(row[col_status]).upper() != wanted:
+                continue
+            try:
+                leads.append(EnhancedLead.from_sheets_row(row))
+            except Exception as e:
+                print(f"  Warning: Could not parse lead row: {e}")
 
             if len(leads) >= limit:
                 break
 
         return leads
 
-    @retry_on_rate_limit(max_retries=3, base_delay=10.0)
     def get_eligible_leads(self, limit: int = 100) -> List[EnhancedLead]:
         """
         Get leads that are send-eligible and have status NEW or APPROVED.
@@ -616,40 +1299,173 @@ class SequencerSheetsManager:
         - email exists and is not empty
         - lead has not been sent (status != "SENT")
 
+        Candidate rows are picked server-side (see _get_eligible_row_numbers)
+        and only those rows are downloaded. If that fails, leads are streamed
+        and reading stops as soon as limit eligible leads are found.
+
         Args:
             limit: Maximum number to return
 
         Returns:
             List of EnhancedLead objects
         """
-        sheet = self.get_leads_tab()
-        all_rows = sheet.get_all_values()
+        row_numbers = self._get_eligible_row_numbers()
+        if row_numbers is not None:
+            return self.select_eligible_leads(self._iter_lead_rows_at(row_numbers), limit)
+
+        def parsed_leads() -> Iterator[EnhancedLead]:
+            for rows in self._iter_lead_row_chunks():
+                # Screen each chunk column-wise; only candidate rows are parsed
+                batch = EnhancedLeadBatch.from_sheets_rows(rows)
+                for row in batch.filter(batch.send_candidate_mask()).rows():
+                    # Use from_sheets_row for robust parsing (handles short rows gracefully)
+                    try:
+                        yield EnhancedLead.from_sheets_row(row)
+                    except Exception:
+                        continue
 
-        if len(all_rows) < 2:
-            return []
+        return self.select_eligible_leads(parsed_leads(), limit)
 
-        # Use from_sheets_row for robust parsing (handles short rows gracefully)
-        leads = []
-        for row in all_rows[1:]:
+    def get_helpers_tab(self) -> gspread.Worksheet:
+        """Get the helpers worksheet (formula cells)."""
+        return self.get_or_create_tab(SHEETS_TABS["helpers"], HELPER_HEADERS)
+
+    @retry_on_rate_limit(max_retries=3, base_delay=10.0)
+    def _get_eligible_row_numbers(self) -> Optional[List[int]]:
+        """
+        Row numbers of leads that may be send-eligible, filtered by Sheets.
+
+        A FILTER formula on the helpers tab (written once per manager) spills
+        the rows whose status normalizes to NEW/APPROVED (blank and the legacy
+        boolean tokens included, as in EnhancedLead._normalize_status), a
+        non-blank email, and either APPROVED or a send_eligible that isn't a
+        false token (anything else parses as true). That is a superset of
+        select_eligible_leads(), which still makes the final call.
+
+        Returns:
+            Ascending row numbers, or None if the formula can't be used
+            (missing columns, spill blocked, write refused)
+        """
+        helpers_sheet = self.get_helpers_tab()
+
+        if not self._eligible_rows_formula_set:
+            leads_sheet = self.get_leads_tab()
+            cols = self._get_headers(leads_sheet)
+            if not {"status", "email", "send_eligible"} <= cols.keys():
+                return None
+
+            tab = f"'{leads_sheet.title}'"
+            status_col = self._col_letter(cols["status"] + 1)
+            email_col = self._col_letter(cols["email"] + 1)
+            eligible_col = self._col_letter(cols["send_eligible"] + 1)
+            # Status spellings that normalize to NEW / APPROVED (see _STATUS_NORM)
+            status = f"LOWER(TRIM(TO_TEXT({tab}!{status_col}2:{status_col})))"
+            approved = f'REGEXMATCH({status},"^(approved|true|1|yes)$")'
+            new = f'REGEXMATCH({status},"^(new|false|0|no)?$")'
+            formula = (
+                f"=IFNA(FILTER(ROW({tab}!{status_col}2:{status_col}),"
+                f"({new})+({approved}),"
+                f"LEN(TRIM({tab}!{email_col}2:{email_col}))>0,"
+                f"({approved})+NOT(REGEXMATCH(LOWER(TRIM(TO_TEXT({tab}!{eligible_col}2:{eligible_col}))),"
+                f'"^(false|0|no|n|f)?$"))),"")'
+            )
             try:
-                lead = EnhancedLead.from_sheets_row(row)
-            except Exception:
+                helpers_sheet.update(ELIGIBLE_ROWS_CELL, [[formula]], value_input_option="USER_ENTERED")
+            except APIError as e:
+                if getattr(e.response, 'status_code', None) in (429, 500, 503):
+                    raise  # Transient - left to the retry decorator
+                return None
+            self._eligible_rows_formula_set = True
+
+        col = "".join(ch for ch in ELIGIBLE_ROWS_CELL if ch.isalpha())
+        response = self.spreadsheet.values_get(
+            f"'{helpers_sheet.title}'!{ELIGIBLE_ROWS_CELL}:{col}",
+            params={"valueRenderOption": "UNFORMATTED_VALUE"},
+        )
+
+        row_numbers = []
+        for cells in response.get("values", []):
+            if not cells or cells[0] == "":
                 continue
+            if not isinstance(cells[0], (int, float)):
+                return None  # Error value (e.g. #REF! when the spill is blocked)
+            row_numbers.append(int(cells[0]))
+        return row_numbers
+
+    def _iter_lead_rows_at(self, row_numbers: List[int]) -> Iterator[EnhancedLead]:
+        """
+        Fetch and parse just the given leads tab rows, in order.
+
+        Consecutive rows are merged into one range, and ranges go out
+        ELIGIBLE_FETCH_RANGES per values_batch_get, so a caller that stops
+        early never fetches the rest.
+        """
+        sheet = self.get_leads_tab()
+        last_col = self._col_letter(len(EnhancedLead.HEADERS))
+
+        runs: List[Tuple[int, int]] = []
+        for row_idx in row_numbers:
+            if runs and row_idx == runs[-1][1] + 1:
+                runs[-1] = (runs[-1][0], row_idx)
+            else:
+                runs.append((row_idx, row_idx))
+
+        for i in range(0, len(runs), ELIGIBLE_FETCH_RANGES):
+            ranges = [
+                f"'{sheet.title}'!A{first}:{last_col}{last}"
+                for first, last in runs[i:i + ELIGIBLE_FETCH_RANGES]
+            ]
+            response = self._batch_get_ranges(ranges, params=TYPED_READ_PARAMS)
+            for value_range in response.get("valueRanges", []):
+                for row in value_range.get("values", []):
+                    try:
+                        yield EnhancedLead.from_sheets_row(row)
+                    except Exception:
+                        continue
+
+    @retry_on_rate_limit(max_retries=3, base_delay=10.0)
+    def _batch_get_ranges(self, ranges: List[str], params: Dict[str, str] = None) -> Dict[str, Any]:
+        """values_batch_get with retries."""
+        return self.spreadsheet.values_batch_get(ranges, params=params)
+
+    @staticmethod
+    def select_eligible_leads(
+        leads: Iterable[EnhancedLead],
+        limit: int = 100,
+        sanitize: Optional[Callable[[str], Any]] = None,
+    ) -> List[EnhancedLead]:
+        """
+        Filter already-fetched leads with the get_eligible_leads() criteria.
+
+        APPROVED leads with a valid email are marked send_eligible in place.
+
+        Args:
+            leads: Leads to filter (e.g. from get_all_leads or iter_all_leads)
+            limit: Maximum number to return
+            sanitize: sanitize_email() replacement, e.g. a caller's memoized
+                      one (defaults to a process-wide memoized sanitize_email)
+
+        Returns:
+            List of eligible EnhancedLead objects, in sheet order
+        """
+        if sanitize is None:
+            sanitize = _sanitize_email_cached
 
+        eligible = []
+        for lead in leads:
             # Must have email
             if not lead.email or not lead.email.strip():
                 continue
 
             # Must be NEW or APPROVED (not SENT, FAILED, etc.)
-            if lead.status not in ("NEW", "APPROVED"):
+            if lead.status not in NEW_OR_APPROVED:
                 continue
 
             # Must be send-eligible OR have APPROVED status with valid email
             if not lead.send_eligible:
                 # Fallback: APPROVED leads with valid email are eligible
                 if lead.status == "APPROVED":
-                    from src.email_sanitizer import sanitize_email
-                    sanitization = sanitize_email(lead.email)
+                    sanitization = sanitize(lead.email)
                     if sanitization.valid:
                         lead.send_eligible = True
                     else:
@@ -657,12 +1473,12 @@ class SequencerSheetsManager:
                 else:
                     continue
 
-            leads.append(lead)
+            eligible.append(lead)
 
-            if len(leads) >= limit:
+            if len(eligible) >= limit:
                 break
 
-        return leads
+        return eligible
 
     @retry_on_rate_limit(max_retries=3, base_delay=10.0)
     def update_lead_status(self, lead_id: str, status: str, send_eligible: bool = None, **kwargs):
@@ -676,40 +1492,50 @@ class SequencerSheetsManager:
             **kwargs: Additional fields to update (sent_at, bounced_at, etc.)
         """
         sheet = self.get_leads_tab()
-        all_rows = sheet.get_all_values()
-        headers = all_rows[0]
+        found = self._find_lead_row(lead_id)
+        if found is None:
+            return
+        cols, row_idx, _ = found
 
-        col_lead_id = headers.index("lead_id")
-        col_status = headers.index("status")
-        col_updated = headers.index("updated_at")
+        col_status = cols["status"]
+        col_updated = cols["updated_at"]
         
         # Normalize status to uppercase
         status_normalized = str(status).strip().upper()
 
-        for row_idx, row in enumerate(all_rows[1:], start=2):
-            if row[col_lead_id] == lead_id:
-                # Update status (normalized)
-                sheet.update_cell(row_idx, col_status + 1, status_normalized)
-                sheet.update_cell(row_idx, col_updated + 1, datetime.utcnow().isoformat())
-                
-                # Update send_eligible if provided
-                if send_eligible is not None and "send_eligible" in headers:
-                    col_eligible = headers.index("send_eligible")
-                    # Store as string "TRUE" or "FALSE" for Google Sheets
-                    sheet.update_cell(row_idx, col_eligible + 1, "TRUE" if send_eligible else "FALSE")
-
-                # Update additional fields
-                for field, value in kwargs.items():
-                    if field in headers:
-                        col = headers.index(field)
-                        if isinstance(value, datetime):
-                            value = value.isoformat()
-                        elif isinstance(value, bool):
-                            # Convert boolean to string for Google Sheets
-                            value = "TRUE" if value else "FALSE"
-                        sheet.update_cell(row_idx, col + 1, value)
+        # Update status (normalized); every touched cell goes out in
+        # a single batch_update
+        cell_updates = [
+            {"range": f"{self._col_letter(col_status + 1)}{row_idx}", "values": [[status_normalized]]},
+            {"range": f"{self._col_letter(col_updated + 1)}{row_idx}", "values": [[datetime.utcnow().isoformat()]]},
+        ]
 
-                return
+        # Update send_eligible if provided
+        if send_eligible is not None and "send_eligible" in cols:
+            col_eligible = cols["send_eligible"]
+            # Store as string "TRUE" or "FALSE" for Google Sheets
+            cell_updates.append({
+                "range": f"{self._col_letter(col_eligible + 1)}{row_idx}",
+                "values": [["TRUE" if send_eligible else "FALSE"]],
+            })
+
+        # Update additional fields
+        for field, value in kwargs.items():
+            if field in cols:
+                col = cols[field]
+                if isinstance(value, datetime):
+                    value = value.isoformat()
+                elif isinstance(value, bool):
+                    # Convert boolean to string for Google Sheets
+                    value = "TRUE" if value else "FALSE"
+                cell_updates.append({
+                    "range": f"{self._col_letter(col + 1)}{row_idx}",
+                    "values": [[value]],
+                })
+
+        sheet.batch_update(cell_updates, value_input_option="USER_ENTERED")
+        _write_stats.record_batch(1)
+        self._invalidate_cache(sheet.title)
 
     @retry_on_rate_limit(max_retries=3, base_delay=10.0)
     def claim_lead_for_sending(self, lead_id: str, expected_status: str = "NEW") -> bool:
@@ -727,28 +1553,31 @@ class SequencerSheetsManager:
             True if successfully claimed, False if status didn't match
         """
         sheet = self.get_leads_tab()
-        all_rows = sheet.get_all_values()
-        headers = all_rows[0]
-
-        col_lead_id = headers.index("lead_id")
-        col_status = headers.index("status")
-        col_updated = headers.index("updated_at")
-
-        for row_idx, row in enumerate(all_rows[1:], start=2):
-            if row[col_lead_id] == lead_id:
-                current_status = row[col_status].upper()
-
-                # Compare-and-set: only claim if status matches expected
-                if current_status != expected_status.upper():
-                    print(f"  [Claim] Lead {lead_id[:8]} status is {current_status}, expected {expected_status} - skipping")
-                    return False
-
-                # Claim by setting to QUEUED
-                sheet.update_cell(row_idx, col_status + 1, "QUEUED")
-                sheet.update_cell(row_idx, col_updated + 1, datetime.utcnow().isoformat())
-                return True
-
-        return False
+        # Index lookup, then a live read of just this row - the
+        # compare-and-set must see the current status
+        found = self._find_lead_row(lead_id)
+        if found is None:
+            return False
+        cols, row_idx, row = found
+
+        col_status = cols["status"]
+        col_updated = cols["updated_at"]
+
+        current_status = row[col_status].upper()
+
+        # Compare-and-set: only claim if status matches expected
+        if current_status != expected_status.upper():
+            print(f"  [Claim] Lead {lead_id[:8]} status is {current_status}, expected {expected_status} - skipping")
+            return False
+
+        # Claim by setting to QUEUED (status + updated_at in one write)
+        sheet.batch_update([
+            {"range": f"{self._col_letter(col_status + 1)}{row_idx}", "values": [["QUEUED"]]},
+            {"range": f"{self._col_letter(col_updated + 1)}{row_idx}", "values": [[datetime.utcnow().isoformat()]]},
+        ], value_input_option="USER_ENTERED")
+        _write_stats.record_batch(1)
+        self._invalidate_cache(sheet.title)
+        return True
 
     @retry_on_rate_limit(max_retries=3, base_delay=10.0)
     def batch_update_leads(
@@ -759,7 +1588,11 @@ class SequencerSheetsManager:
         Batch update multiple leads efficiently.
 
         Uses range-based updates to minimize API calls.
-        Much more efficient than individual update_cell calls.
+        Much more efficient than individual update_cell calls: the whole
+        batch is one values.batchUpdate request however many leads it
+        touches. Sheets write quota is counted per request per user, so
+        splitting a batch into concurrent requests would only spend the
+        quota faster - keep callers on this single call.
 
         Args:
             updates: List of dicts with 'lead_id' and fields to update.
@@ -768,69 +1601,142 @@ class SequencerSheetsManager:
         Returns:
             Number of leads updated
         """
-        if not updates:
+        # Column-oriented: fields absent from an update are left alone (None),
+        # an explicit None clears the cell
+        lead_ids = []
+        columns: Dict[str, List[Any]] = {}
+        for i, update in enumerate(updates):
+            lead_ids.append(update.get("lead_id"))
+            for field, value in update.items():
+                if field == "lead_id":
+                    continue
+                values = columns.setdefault(field, [None] * len(updates))
+                values[i] = "" if value is None else value
+
+        return self._write_lead_columns(lead_ids, columns)
+
+    @retry_on_rate_limit(max_retries=3, base_delay=10.0)
+    def batch_update_leads_columns(
+        self,
+        lead_ids: List[str],
+        columns: Dict[str, List[Any]],
+    ) -> int:
+        """
+        Batch update leads from column-oriented values.
+
+        Same write as batch_update_leads(), without a dict per lead: each
+        column's sheet letter is resolved once, then rows are zipped in.
+
+        Args:
+            lead_ids: Lead IDs to update
+            columns: Field name -> values parallel to lead_ids. A None value
+                     leaves that cell unchanged.
+
+        Returns:
+            Number of leads updated
+        """
+        return self._write_lead_columns(lead_ids, columns)
+
+    def _write_lead_columns(
+        self,
+        lead_ids: List[Optional[str]],
+        columns: Dict[str, List[Any]],
+    ) -> int:
+        """
+        Write the given columns for each lead in one values.batchUpdate.
+
+        Shared by batch_update_leads() and batch_update_leads_columns().
+        updated_at is always stamped; leads not on the sheet are skipped.
+
+        Args:
+            lead_ids: Lead IDs to update (blank IDs are skipped)
+            columns: Field name -> values parallel to lead_ids. A None value
+                     leaves that cell unchanged; unknown fields are ignored.
+
+        Returns:
+            Number of leads updated
+        """
+        if not lead_ids:
             return 0
 
         sheet = self.get_leads_tab()
-        all_rows = sheet.get_all_values()
-        headers = all_rows[0]
-
-        # Build index of lead_id -> row number
-        col_lead_id = headers.index("lead_id")
-        lead_id_to_row = {}
-        for row_idx, row in enumerate(all_rows[1:], start=2):
-            if len(row) > col_lead_id:
-                lead_id_to_row[row[col_lead_id]] = row_idx
+        cols = self._get_headers(sheet)
+        lead_id_to_row = self._resolve_lead_rows(lead_ids)
+
+        # Resolve each field's column once (unknown fields are skipped)
+        targets = [
+            (cols[field], values)
+            for field, values in columns.items()
+            if field in cols
+        ]
+        updated_at_idx = cols.get("updated_at")
+        now = datetime.utcnow().isoformat()
 
-        # Collect all cell updates
-        cell_updates = []
+        cells = []
         updated_count = 0
 
-        for update in updates:
-            lead_id = update.get("lead_id")
-            if not lead_id or lead_id not in lead_id_to_row:
+        for i, lead_id in enumerate(lead_ids):
+            row_idx = lead_id_to_row.get(lead_id)
+            if row_idx is None:
                 continue
 
-            row_idx = lead_id_to_row[lead_id]
-
-            for field, value in update.items():
-                if field == "lead_id":
-                    continue
-                if field not in headers:
+            for col_idx, values in targets:
+                value = values[i]
+                if value is None:
                     continue
-
-                col_idx = headers.index(field) + 1  # 1-based
-
                 # Convert values for sheets
                 if isinstance(value, bool):
                     value = "TRUE" if value else "FALSE"
                 elif isinstance(value, datetime):
                     value = value.isoformat()
-                elif value is None:
-                    value = ""
-
-                cell_updates.append({
-                    "range": f"{self._col_letter(col_idx)}{row_idx}",
-                    "values": [[value]]
-                })
+                cells.append((row_idx, col_idx, value))
 
             # Always update updated_at
-            if "updated_at" in headers:
-                col_idx = headers.index("updated_at") + 1
-                cell_updates.append({
-                    "range": f"{self._col_letter(col_idx)}{row_idx}",
-                    "values": [[datetime.utcnow().isoformat()]]
-                })
+            if updated_at_idx is not None:
+                cells.append((row_idx, updated_at_idx, now))
 
             updated_count += 1
 
-        # Batch update all cells
-        if cell_updates:
-            sheet.batch_update(cell_updates, value_input_option="USER_ENTERED")
+        # Batch update all cells, adjacent columns merged into one range
+        if cells:
+            sheet.batch_update(self._coalesce_cell_ranges(cells), value_input_option="USER_ENTERED")
             _write_stats.record_batch(updated_count)
+            # Keep the cached tab warm for the next call in this batch
+            self._patch_cached_values(sheet.title, cells)
 
         return updated_count
 
+    def _coalesce_cell_ranges(self, cells: List[Tuple[int, int, Any]]) -> List[Dict[str, Any]]:
+        """
+        Turn cell writes into batch_update ranges, one per run of adjacent columns.
+
+        Only cells being written are merged - gaps are never filled in from
+        cached values, so untouched cells can't be overwritten with stale
+        data. A cell written twice keeps its last value.
+
+        Args:
+            cells: (1-based row, 0-based column, value) triples
+
+        Returns:
+            List of {"range", "values"} dicts for Worksheet.batch_update
+        """
+        by_row: Dict[int, Dict[int, Any]] = {}
+        for row_idx, col, value in cells:
+            by_row.setdefault(row_idx, {})[col] = value
+
+        ranges = []
+        for row_idx, row_cells in by_row.items():
+            cols = sorted(row_cells)
+            start = cols[0]
+            for prev, col in zip(cols, cols[1:] + [None]):
+                if col == prev + 1:
+                    continue
+                first = f"{self._col_letter(start + 1)}{row_idx}"
+                a1 = first if start == prev else f"{first}:{self._col_letter(prev + 1)}{row_idx}"
+                ranges.append({"range": a1, "values": [[row_cells[c] for c in range(start, prev + 1)]]})
+                start = col
+        return ranges
+
     def _col_letter(self, col_num: int) -> str:
         """Convert column number (1-based) to letter (A, B, ... Z, AA, AB, ...)."""
         result = ""
@@ -963,15 +1869,15 @@ class SequencerSheetsManager:
         """Update a run log entry."""
         sheet = self.get_run_log_tab()
         all_rows = sheet.get_all_values()
-        headers = all_rows[0]
+        cols = self._get_headers(sheet)
 
-        col_run_id = headers.index("run_id")
+        col_run_id = cols["run_id"]
 
         for row_idx, row in enumerate(all_rows[1:], start=2):
             if row[col_run_id] == run_id:
                 for field, value in kwargs.items():
-                    if field in headers:
-                        col = headers.index(field)
+                    if field in cols:
+                        col = cols[field]
                         if isinstance(value, datetime):
                             value = value.isoformat()
                         sheet.update_cell(row_idx, col + 1, value)
@@ -1018,48 +1924,115 @@ class SequencerSheetsManager:
             value_input_option="USER_ENTERED"
         )
 
+    # =========================================================================
+    # SENDS TODAY OPERATIONS
+    # =========================================================================
+    # One row per SENT lead for the current UTC day, so quota and duplicate
+    # checks read a few rows instead of the whole leads history
+
+    def get_sends_today_tab(self) -> gspread.Worksheet:
+        """Get the sends_today worksheet."""
+        return self.get_or_create_tab(
+            SHEETS_TABS["sends_today"],
+            ["lead_id", "email", "sent_at"]
+        )
+
+    @retry_on_rate_limit(max_retries=3, base_delay=10.0)
+    def append_sends_today(self, sends: List[List[str]]):
+        """
+        Record sent emails in the sends_today tab.
+
+        Args:
+            sends: Rows of [lead_id, email, sent_at (ISO)]
+        """
+        if not sends:
+            return
+        sheet = self.get_sends_today_tab()
+        sheet.append_rows(sends, value_input_option="RAW")
+        _write_stats.record_batch(len(sends))
+
+    @retry_on_rate_limit(max_retries=3, base_delay=10.0)
+    def get_sends_on(self, date_str: str) -> List[Tuple[str, str]]:
+        """
+        Get (email, sent_at) for sends recorded on the given date.
+
+        Args:
+            date_str: Date in YYYY-MM-DD format (UTC, matching sent_at)
+
+        Returns:
+            List of (lowercase email, sent_at) tuples
+        """
+        sheet = self.get_sends_today_tab()
+        all_rows = sheet.get_all_values()
+
+        return [
+            (row[1].strip().lower(), row[2])
+            for row in all_rows[1:]
+            if len(row) > 2 and row[2].startswith(date_str)
+        ]
+
+    @retry_on_rate_limit(max_retries=3, base_delay=10.0)
+    def prune_sends_before(self, date_str: str):
+        """
+        Drop sends_today rows from before the given date (UTC midnight roll-over).
+
+        Rows are appended in send order, so the stale rows are a prefix of
+        the tab: they are removed with one delete_rows, leaving rows other
+        runs append meanwhile untouched (no clear-and-rewrite).
+
+        Args:
+            date_str: First date to keep, YYYY-MM-DD
+        """
+        sheet = self.get_sends_today_tab()
+        sent_ats = sheet.col_values(3)[1:]
+
+        stale = 0
+        for sent_at in sent_ats:
+            if sent_at[:10] >= date_str:
+                break
+            stale += 1
+        if stale:
+            sheet.delete_rows(2, stale + 1)
+
     # =========================================================================
     # SAFETY METRICS
     # =========================================================================
 
     @retry_on_rate_limit(max_retries=3, base_delay=10.0)
-    def get_safety_metrics(self, lookback_days: int = 7) -> Dict[str, Any]:
+    def get_safety_events(self, lookback_days: int = 7) -> Dict[str, List[float]]:
         """
-        Calculate safety metrics for the lookback period.
+        Get send/bounce/complaint timestamps for the lookback period.
+
+        Bounces and complaints are keyed on the lead's sent_at, so rates are
+        per send in the window (see SequencerEmailSender.get_safety_metrics).
 
         Args:
             lookback_days: Number of days to look back
 
         Returns:
-            Dict with bounce_count, complaint_count, total_sent, bounce_rate, complaint_rate
+            Dict with "sent", "bounced", "complained" lists of UTC epoch
+            seconds, each in ascending order
         """
-        from datetime import timedelta
+        from datetime import timedelta, timezone
+
+        events: Dict[str, List[float]] = {"sent": [], "bounced": [], "complained": []}
 
         sheet = self.get_leads_tab()
         all_rows = sheet.get_all_values()
 
         if len(all_rows) < 2:
-            return {
-                "bounce_count": 0,
-                "complaint_count": 0,
-                "total_sent": 0,
-                "bounce_rate": 0.0,
-                "complaint_rate": 0.0,
-            }
+            return events
 
-        headers = all_rows[0]
-        col_sent_at = headers.index("sent_at")
-        col_bounced_at = headers.index("bounced_at")
-        col_complained_at = headers.index("complained_at")
+        cols = self._get_headers(sheet)
+        col_sent_at = cols["sent_at"]
+        col_bounced_at = cols["bounced_at"]
+        col_complained_at = cols["complained_at"]
+        min_len = max(col_sent_at, col_bounced_at, col_complained_at)
 
         cutoff = datetime.utcnow() - timedelta(days=lookback_days)
 
-        total_sent = 0
-        bounce_count = 0
-        complaint_count = 0
-
         for row in all_rows[1:]:
-            if len(row) <= max(col_sent_at, col_bounced_at, col_complained_at):
+            if len(row) <= min_len:
                 continue
 
             sent_at_str = row[col_sent_at]
@@ -1071,24 +2044,19 @@ class SequencerSheetsManager:
                 if sent_at < cutoff:
                     continue
 
-                total_sent += 1
+                ts = sent_at.replace(tzinfo=timezone.utc).timestamp()
+                events["sent"].append(ts)
 
                 if row[col_bounced_at]:
-                    bounce_count += 1
+                    events["bounced"].append(ts)
 
                 if row[col_complained_at]:
-                    complaint_count += 1
+                    events["complained"].append(ts)
 
             except Exception:
                 continue
 
-        bounce_rate = (bounce_count / total_sent) if total_sent > 0 else 0.0
-        complaint_rate = (complaint_count / total_sent) if total_sent > 0 else 0.0
+        for times in events.values():
+            times.sort()
 
-        return {
-            "bounce_count": bounce_count,
-            "complaint_count": complaint_count,
-            "total_sent": total_sent,
-            "bounce_rate": bounce_rate,
-            "complaint_rate": complaint_rate,
-        }
+        return events
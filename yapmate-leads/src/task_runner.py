@@ -27,7 +27,7 @@ from src.sequencer_config import (
 )
 from src.sequencer_models import (
     QueueTask, TaskStatus, SessionType, RunnerState,
-    EnhancedLead, DedupeKey, RunLogEntry, DedupeMatchType
+    EnhancedLead, DedupeKey, RunLogEntry, DedupeMatchType, freeze_now
 )
 from src.sequencer_sheets import SequencerSheetsManager, get_write_stats
 from src.apify_client import ApifyLeadScraper, ApifyTimeoutError
@@ -500,43 +500,45 @@ class TaskRunner:
             unique_leads = []
             duplicates = 0
 
-            for raw_lead in raw_leads:
-                # Check dedupe
-                is_dup, match_type, matched_id = self.check_duplicate(
-                    place_id=raw_lead.raw_data.get("placeId"),
-                    source_url=raw_lead.raw_data.get("url"),
-                    email=raw_lead.email,
-                    phone=raw_lead.phone,
-                    business_name=raw_lead.business_name,
-                    city=raw_lead.city
-                )
-
-                if is_dup:
-                    duplicates += 1
-                    continue
+            # One timestamp for the whole batch of new leads
+            with freeze_now():
+                for raw_lead in raw_leads:
+                    # Check dedupe
+                    is_dup, match_type, matched_id = self.check_duplicate(
+                        place_id=raw_lead.raw_data.get("placeId"),
+                        source_url=raw_lead.raw_data.get("url"),
+                        email=raw_lead.email,
+                        phone=raw_lead.phone,
+                        business_name=raw_lead.business_name,
+                        city=raw_lead.city
+                    )
 
-                # Create EnhancedLead
-                lead = EnhancedLead(
-                    lead_id=str(uuid.uuid4()),
-                    business_name=raw_lead.business_name,
-                    email=raw_lead.email,
-                    phone=raw_lead.phone,
-                    website=raw_lead.website,
-                    trade=raw_lead.trade,
-                    city=raw_lead.city,
-                    lead_source=raw_lead.lead_source,
-                    place_id=raw_lead.raw_data.get("placeId"),
-                    source_url=raw_lead.raw_data.get("url"),
-                    task_id=task.task_id,
-                    raw_data=raw_lead.raw_data,
-                )
+                    if is_dup:
+                        duplicates += 1
+                        continue
+
+                    # Create EnhancedLead
+                    lead = EnhancedLead(
+                        lead_id=str(uuid.uuid4()),
+                        business_name=raw_lead.business_name,
+                        email=raw_lead.email,
+                        phone=raw_lead.phone,
+                        website=raw_lead.website,
+                        trade=raw_lead.trade,
+                        city=raw_lead.city,
+                        lead_source=raw_lead.lead_source,
+                        place_id=raw_lead.raw_data.get("placeId"),
+                        source_url=raw_lead.raw_data.get("url"),
+                        task_id=task.task_id,
+                        raw_data=raw_lead.raw_data,
+                    )
 
-                # Check for soft match
-                if match_type == DedupeMatchType.NAME_CITY:
-                    lead.soft_match = True
-                    lead.soft_match_lead_id = matched_id
+                    # Check for soft match
+                    if match_type == DedupeMatchType.NAME_CITY:
+                        lead.soft_match = True
+                        lead.soft_match_lead_id = matched_id
 
-                unique_leads.append(lead)
+                    unique_leads.append(lead)
 
             log_entry.leads_after_dedupe = len(unique_leads)
             print(f"  {duplicates} duplicates removed")
@@ -0,0 +1,476 @@
+"""
+Unit tests for SequencerEmailSender's Resend path and batched sheet writes.
+
+Resend is replaced by a stub HTTP session and the sheets manager by a stub
+recording its calls - nothing here touches the network.
+"""
+
+from concurrent.futures import Future
+
+import pytest
+
+pytest.importorskip("dotenv")
+pytest.importorskip("requests")
+
+from src import sequencer_email_sender as sender_module
+from src.sequencer_email_sender import (
+    CIRCUIT_COOLDOWN_SECONDS,
+    CIRCUIT_FAILURE_THRESHOLD,
+    SendStatus,
+    SequencerEmailSender,
+    StructuredLog,
+)
+from src.sequencer_models import EnhancedLead
+
+
+# =============================================================================
+# STUBS
+# =============================================================================
+
+class FakeClock:
+    """Stands in for the time module inside sequencer_email_sender."""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+class StubResponse:
+    def __init__(self, status_code: int = 200, body=None):
+        self.status_code = status_code
+        self.headers = {}
+        self._body = body if body is not None else {}
+        self.text = str(self._body)
+
+    def json(self):
+        return self._body
+
+
+class StubSession:
+    """
+    Resend session double. Each post() takes the next scripted reply: an
+    exception to raise, a StubResponse, or a callable building one from the
+    JSON payload.
+    """
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.calls = []
+
+    def post(self, url, json=None, headers=None, timeout=None):
+        self.calls.append((url, json))
+        reply = self.replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        if callable(reply):
+            return reply(json)
+        return reply
+
+
+class StubSheets:
+    """Sheets manager double for the sender's write path."""
+
+    def __init__(self, fail_batch: bool = False):
+        self.fail_batch = fail_batch
+        self.calls = []
+
+    def batch_update_leads_columns(self, lead_ids, columns):
+        self.calls.append(("batch_update_leads_columns", list(lead_ids), {k: list(v) for k, v in columns.items()}))
+        if self.fail_batch:
+            raise RuntimeError("quota exceeded")
+        return len(lead_ids)
+
+    def update_lead_status(self, lead_id, status, **fields):
+        self.calls.append(("update_lead_status", lead_id, status, fields))
+        return True
+
+    def prune_sends_before(self, day):
+        self.calls.append(("prune_sends_before", day))
+
+    def append_sends_today(self, rows):
+        self.calls.append(("append_sends_today", [list(row) for row in rows]))
+
+
+def ok(email_id: str = "re_1") -> StubResponse:
+    return StubResponse(200, {"id": email_id})
+
+
+def error(status_code: int = 500) -> StubResponse:
+    return StubResponse(status_code, {"message": "server error"})
+
+
+def batch_ok(payload) -> StubResponse:
+    """Batch reply accepting every email in the payload."""
+    return StubResponse(200, {"data": [{"id": f"re_{p['to'][0]}"} for p in payload]})
+
+
+def make_lead(lead_id: str, email: str = None) -> EnhancedLead:
+    return EnhancedLead(
+        lead_id=lead_id,
+        business_name=f"{lead_id} Plumbing",
+        email=f"{lead_id}@example-trades.co.uk" if email is None else email,
+        phone=None,
+        website=None,
+        trade="Plumber",
+        city="Leeds",
+        lead_source="test",
+        send_eligible=True,
+        status="APPROVED",
+    )
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(sender_module, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def session(monkeypatch):
+    """Install a StubSession as the shared Resend session; script it via .replies."""
+    session = StubSession()
+    monkeypatch.setattr(sender_module, "_get_resend_session", lambda: session)
+    return session
+
+
+@pytest.fixture
+def sheets():
+    return StubSheets()
+
+
+@pytest.fixture
+def sender(sheets, clock, session):
+    sender = SequencerEmailSender(sheets, env={"RESEND_API_KEY": "re_test"})
+    # Send gate comes from process config - open it for these tests
+    sender._send_enabled = True
+    sender._pipeline_dry_run = False
+    # Fixed content so batch grouping is deterministic
+    sender.generate_email = lambda lead: ("Subject", "<p>Body</p>", "Body")
+    yield sender
+    sender.close()
+
+
+# =============================================================================
+# CIRCUIT BREAKER
+# =============================================================================
+
+def trip_breaker(sender, session):
+    session.replies += [error()] * CIRCUIT_FAILURE_THRESHOLD
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+        with pytest.raises(RuntimeError, match="Resend API error 500"):
+            sender._send_via_resend({"to": ["a@example.com"]})
+
+
+def test_breaker_opens_after_consecutive_failures(sender, session):
+    trip_breaker(sender, session)
+
+    with pytest.raises(RuntimeError, match="circuit_open"):
+        sender._send_via_resend({"to": ["a@example.com"]})
+    assert len(session.calls) == CIRCUIT_FAILURE_THRESHOLD  # failed fast
+
+
+def test_breaker_stays_closed_below_threshold(sender, session):
+    session.replies += [error()] * (CIRCUIT_FAILURE_THRESHOLD - 1) + [ok(), error(), ok()]
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD - 1):
+        with pytest.raises(RuntimeError):
+            sender._send_via_resend({})
+    sender._send_via_resend({})  # Success resets the count
+    with pytest.raises(RuntimeError, match="Resend API error"):
+        sender._send_via_resend({})
+
+    assert sender._send_via_resend({}) == {"id": "re_1"}
+    assert len(session.calls) == CIRCUIT_FAILURE_THRESHOLD + 2
+
+
+def test_breaker_half_open_failure_reopens_with_doubled_cooldown(sender, session, clock):
+    trip_breaker(sender, session)
+
+    # Cooldown over: one probe goes out, fails, and re-opens at once
+    clock.now += CIRCUIT_COOLDOWN_SECONDS
+    session.replies.append(error())
+    with pytest.raises(RuntimeError, match="Resend API error 500"):
+        sender._send_via_resend({})
+    assert len(session.calls) == CIRCUIT_FAILURE_THRESHOLD + 1
+
+    # Second trip waits twice as long
+    clock.now += CIRCUIT_COOLDOWN_SECONDS
+    with pytest.raises(RuntimeError, match="circuit_open"):
+        sender._send_via_resend({})
+    clock.now += CIRCUIT_COOLDOWN_SECONDS
+    session.replies.append(ok())
+    assert sender._send_via_resend({}) == {"id": "re_1"}
+
+
+def test_breaker_half_open_success_closes(sender, session, clock):
+    trip_breaker(sender, session)
+
+    clock.now += CIRCUIT_COOLDOWN_SECONDS
+    session.replies.append(ok())
+    sender._send_via_resend({})
+
+    # Closed again: a single failure no longer opens it, and the next trip
+    # starts from the base cooldown
+    trip_breaker(sender, session)
+    clock.now += CIRCUIT_COOLDOWN_SECONDS
+    session.replies.append(ok())
+    assert sender._send_via_resend({}) == {"id": "re_1"}
+
+
+def test_breaker_ignores_failures_in_flight_when_it_opened(sender, session, clock):
+    def tripped_meanwhile(payload):
+        # Other workers open the breaker while this request is in flight
+        trip_breaker(sender, session)
+        return error()
+
+    session.replies.append(tripped_meanwhile)
+    with pytest.raises(RuntimeError, match="Resend API error 500"):
+        sender._send_via_resend({})
+
+    # The late failure didn't re-trip (and double) the cooldown
+    assert sender._circuit_trips == 1
+    clock.now += CIRCUIT_COOLDOWN_SECONDS
+    session.replies.append(ok())
+    assert sender._send_via_resend({}) == {"id": "re_1"}
+
+
+# =============================================================================
+# WORKER POOL (submit_send / _deliver)
+# =============================================================================
+
+def test_submit_send_delivers_on_worker_pool(sender, session):
+    session.replies.append(ok("re_42"))
+
+    result, log = sender.submit_send(make_lead("alice")).result(timeout=5)
+
+    assert result.success and result.status == SendStatus.SENT
+    assert result.email_id == "re_42"
+    assert log.status == SendStatus.SENT
+    url, payload = session.calls[0]
+    assert url.endswith("/emails")
+    assert payload["to"] == ["alice@example-trades.co.uk"]
+    assert sender._io_executor is not None
+
+
+def test_submit_send_resolves_failed_checks_without_sending(sender, session):
+    future = sender.submit_send(make_lead("nobody", email=""))
+
+    assert future.done()
+    result, _ = future.result()
+    assert result.status == SendStatus.INVALID
+    assert session.calls == []
+    assert sender._io_executor is None  # Pool not started for nothing
+
+
+def test_deliver_reports_resend_error_as_failed(sender, session):
+    session.replies.append(error(422))
+
+    result, log = sender.submit_send(make_lead("alice")).result(timeout=5)
+
+    assert not result.success and result.status == SendStatus.FAILED
+    assert "422" in result.error
+    assert log.status == SendStatus.FAILED
+
+
+def test_deliver_fails_fast_while_breaker_open(sender, session):
+    trip_breaker(sender, session)
+
+    futures = [sender.submit_send(make_lead(name)) for name in ("alice", "bob")]
+    results = [future.result(timeout=5)[0] for future in futures]
+
+    assert [r.error for r in results] == ["circuit_open", "circuit_open"]
+    assert len(session.calls) == CIRCUIT_FAILURE_THRESHOLD
+
+
+def test_close_shuts_down_worker_pool(sender, session):
+    session.replies.append(ok())
+    sender.submit_send(make_lead("alice")).result(timeout=5)
+
+    sender.close()
+
+    assert sender._io_executor is None
+
+
+# =============================================================================
+# BATCH SENDS (send_emails_batch / _dispatch_batch)
+# =============================================================================
+
+def test_send_emails_batch_partial_failure(sender, session):
+    leads = [make_lead("a"), make_lead("b"), make_lead("nobody", email=""), make_lead("c")]
+    session.replies += [batch_ok, error(500)]
+
+    outcomes = sender.send_emails_batch(leads, chunk_size=2)
+
+    statuses = [result.status for result, _ in outcomes]
+    assert statuses == [SendStatus.SENT, SendStatus.SENT, SendStatus.INVALID, SendStatus.FAILED]
+    assert [result.lead_id for result, _ in outcomes] == ["a", "b", "nobody", "c"]
+    assert outcomes[0][0].email_id == "re_a@example-trades.co.uk"
+    assert "Resend API error 500" in outcomes[3][0].error
+    assert outcomes[3][1].status == SendStatus.FAILED
+
+    # One request per chunk, the invalid lead never sent
+    assert [url.rsplit("/", 2)[-2:] for url, _ in session.calls] == [["emails", "batch"]] * 2
+    assert [len(payload) for _, payload in session.calls] == [2, 1]
+
+
+def test_send_emails_batch_missing_ids_fail(sender, session):
+    session.replies.append(StubResponse(200, {"data": [{"id": "re_only"}]}))
+
+    outcomes = sender.send_emails_batch([make_lead("a"), make_lead("b")])
+
+    assert outcomes[0][0].email_id == "re_only"
+    assert outcomes[1][0].status == SendStatus.FAILED
+    assert outcomes[1][0].error == "Missing id in batch response"
+
+
+def test_send_emails_batch_counts_towards_breaker(sender, session):
+    session.replies += [error()] * CIRCUIT_FAILURE_THRESHOLD
+    for name in ("a", "b", "c"):
+        sender.send_emails_batch([make_lead(name)])
+
+    outcomes = sender.send_emails_batch([make_lead("d")])
+
+    assert outcomes[0][0].error == "circuit_open"
+    assert len(session.calls) == CIRCUIT_FAILURE_THRESHOLD
+
+
+def test_dispatch_batch_resolves_futures_in_order(sender, session):
+    pending = []
+    for name in ("a", "b", "c"):
+        lead = make_lead(name)
+        _, log, clean_email = sender._prepare_send(lead)
+        pending.append((lead, log, clean_email, Future()))
+    futures = [item[3] for item in pending]
+    session.replies.append(StubResponse(200, {"data": [{"id": "re_a"}, {"id": "re_b"}]}))
+
+    sender._dispatch_batch(pending)
+
+    assert pending == []
+    results = [future.result(timeout=0)[0] for future in futures]
+    assert [r.email_id for r in results[:2]] == ["re_a", "re_b"]
+    assert results[2].status == SendStatus.FAILED
+
+
+def test_abandon_batch_fails_pending_without_sending(sender, session):
+    lead = make_lead("a")
+    log = StructuredLog.for_lead(lead, SendStatus.SENT, "Email valid")
+    pending = [(lead, log, "a@example-trades.co.uk", Future())]
+    future = pending[0][3]
+
+    SequencerEmailSender._abandon_batch(pending, "send loop aborted")
+
+    assert pending == []
+    result, log = future.result(timeout=0)
+    assert result.status == SendStatus.FAILED and result.error == "send loop aborted"
+    assert log.reason == "Send failed: send loop aborted"
+    assert session.calls == []
+
+
+# =============================================================================
+# BATCHED SHEET WRITES (flush_updates)
+# =============================================================================
+
+def test_flush_coalesces_repeats_in_first_seen_order(sender, sheets):
+    sender._queue_lead_update("a", "SENT", sent_at="2026-01-05T09:00:00", resend_id="re_old")
+    sender._queue_lead_update("b", "INVALID", eligibility_reason="Bad domain")
+    sender._queue_lead_update("a", "SENT", resend_id="re_new")
+    sender._queue_lead_update("c", "SENT", sent_at="2026-01-05T09:02:00")
+    sender._queue_lead_update("b", "INVALID")
+
+    assert sender.flush_updates() == 3
+
+    (name, lead_ids, columns), = sheets.calls
+    assert name == "batch_update_leads_columns"
+    assert lead_ids == ["a", "b", "c"]
+    assert columns["status"] == ["SENT", "INVALID", "SENT"]
+    # Later non-empty fields win; an empty repeat never clears a field
+    assert columns["resend_id"] == ["re_new", None, None]
+    assert columns["sent_at"] == ["2026-01-05T09:00:00", None, "2026-01-05T09:02:00"]
+    assert columns["eligibility_reason"] == [None, "Bad domain", None]
+
+
+def test_flush_keeps_status_changes_for_one_lead_in_order(sender, sheets):
+    sender._queue_lead_update("a", "SENDING")
+    sender._queue_lead_update("a", "FAILED", eligibility_reason="timeout")
+    sender._queue_lead_update("a", "SENDING")
+
+    sender.flush_updates()
+
+    _, lead_ids, columns = sheets.calls[0]
+    assert lead_ids == ["a", "a"]
+    assert columns["status"] == ["SENDING", "FAILED"]
+    assert columns["eligibility_reason"] == [None, "timeout"]
+
+
+def test_flush_falls_back_to_single_writes_in_coalesced_order(sender, clock):
+    sender.sheets = sheets = StubSheets(fail_batch=True)
+    sender._queue_lead_update("a", "SENT", resend_id="re_a")
+    sender._queue_lead_update("b", "INVALID", eligibility_reason="Bad domain")
+    sender._queue_lead_update("a", "SENT", sent_at="2026-01-05T09:00:00")
+    started = clock.now
+
+    assert sender.flush_updates() == 0
+
+    assert sheets.calls[1:] == [
+        ("update_lead_status", "a", "SENT", {"sent_at": "2026-01-05T09:00:00", "resend_id": "re_a"}),
+        ("update_lead_status", "b", "INVALID", {"eligibility_reason": "Bad domain"}),
+    ]
+    assert clock.now - started == 2  # Paced between writes, not after the last
+
+
+def test_flush_drains_queue(sender, sheets):
+    sender._queue_lead_update("a", "SENT")
+    sender.flush_updates()
+
+    assert sender.flush_updates() == 0
+    assert len(sheets.calls) == 1
+
+
+def test_single_send_defers_sends_today_row_to_next_full_flush(sender, session, sheets):
+    session.replies += [ok("re_a"), ok("re_b")]
+
+    sender.send_email(make_lead("a"))
+    assert [call[0] for call in sheets.calls] == ["batch_update_leads_columns"]
+
+    sender.send_email(make_lead("b"), flush=False)
+    sender.flush_updates()
+
+    names = [call[0] for call in sheets.calls]
+    assert names == [
+        "batch_update_leads_columns",
+        "prune_sends_before",
+        "append_sends_today",
+        "batch_update_leads_columns",
+    ]
+    appended = sheets.calls[2][1]
+    assert [row[:2] for row in appended] == [
+        ["a", "a@example-trades.co.uk"],
+        ["b", "b@example-trades.co.uk"],
+    ]
+
+
+def test_sends_today_pruned_once_per_day(sender, session, sheets, clock):
+    session.replies += [ok(), ok(), ok()]
+
+    for name in ("a", "b"):
+        sender.send_email(make_lead(name), flush=False)
+        sender.flush_updates()
+    clock.now += 86400
+    sender.send_email(make_lead("c"), flush=False)
+    sender.flush_updates()
+
+    prunes = [call for call in sheets.calls if call[0] == "prune_sends_before"]
+    assert len(prunes) == 2
+    assert prunes[0][1] != prunes[1][1]
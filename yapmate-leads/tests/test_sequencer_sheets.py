@@ -0,0 +1,260 @@
+"""
+Unit tests for SequencerSheetsManager's lead_id row index and the
+request quota gate.
+
+The spreadsheet is an in-memory stub that counts reads, so these check both
+which rows an update resolves to and how many requests it took.
+"""
+
+import re
+
+import pytest
+
+pytest.importorskip("gspread")
+
+from src import sequencer_sheets as sheets_module
+from src.sequencer_config import SHEETS_TABS
+from src.sequencer_models import EnhancedLead
+from src.sequencer_sheets import QuotaGatedSession, RequestWindow, SequencerSheetsManager
+
+HEADERS = EnhancedLead.headers()
+LEAD_ID_COL = HEADERS.index("lead_id")
+STATUS_COL = HEADERS.index("status")
+
+
+# =============================================================================
+# STUBS
+# =============================================================================
+
+def col_number(letters: str) -> int:
+    """A1 column letters -> 1-based column number."""
+    number = 0
+    for ch in letters:
+        number = number * 26 + ord(ch) - 64
+    return number
+
+
+class StubWorksheet:
+    """In-memory worksheet: row 1 holds the headers."""
+
+    def __init__(self, title: str, rows):
+        self.title = title
+        self.rows = [list(row) for row in rows]
+
+    @property
+    def row_count(self) -> int:
+        return max(len(self.rows), 1000)
+
+    def row_values(self, row_idx: int):
+        return list(self.rows[row_idx - 1]) if row_idx <= len(self.rows) else []
+
+    def column_cells(self, col: int, first: int, last=None):
+        """Cells of a 1-based column as Sheets returns them (trailing blanks dropped)."""
+        last = len(self.rows) if last is None else min(last, len(self.rows))
+        values = []
+        for row in self.rows[first - 1:last]:
+            cell = row[col - 1] if len(row) >= col else ""
+            values.append([cell] if cell else [])
+        while values and not values[-1]:
+            values.pop()
+        return values
+
+    def batch_update(self, data, value_input_option=None):
+        for item in data:
+            match = re.fullmatch(r"([A-Z]+)(\d+)(?::[A-Z]+\d+)?", item["range"])
+            first_col, row_idx = col_number(match.group(1)), int(match.group(2))
+            row = self.rows[row_idx - 1]
+            for offset, value in enumerate(item["values"][0]):
+                row[first_col - 1 + offset] = value
+
+    def delete_row(self, row_idx: int):
+        del self.rows[row_idx - 1]
+
+    def append(self, row):
+        self.rows.append(list(row))
+
+
+class StubSpreadsheet:
+    """values_batch_get over single-column ranges, recording each request."""
+
+    def __init__(self, worksheet: StubWorksheet):
+        self.worksheet = worksheet
+        self.reads = []
+
+    def values_batch_get(self, ranges, params=None):
+        self.reads.append(list(ranges))
+        value_ranges = []
+        for a1 in ranges:
+            match = re.fullmatch(r"'[^']+'!([A-Z]+)(\d+):([A-Z]+)(\d+)?", a1)
+            last = int(match.group(4)) if match.group(4) else None
+            values = self.worksheet.column_cells(col_number(match.group(1)), int(match.group(2)), last)
+            value_ranges.append({"range": a1, "values": values})
+        return {"valueRanges": value_ranges}
+
+
+def lead_row(lead_id: str, status: str = "APPROVED"):
+    row = [""] * len(HEADERS)
+    row[LEAD_ID_COL] = lead_id
+    row[STATUS_COL] = status
+    return row
+
+
+def make_manager(lead_ids):
+    """A manager over a stub leads tab, bypassing credentials and connection."""
+    worksheet = StubWorksheet(SHEETS_TABS["leads"], [HEADERS] + [lead_row(lead_id) for lead_id in lead_ids])
+    manager = SequencerSheetsManager.__new__(SequencerSheetsManager)
+    manager.spreadsheet = StubSpreadsheet(worksheet)
+    manager._worksheets = {worksheet.title: worksheet}
+    manager._tab_lookup = {}
+    manager._values_cache = {}
+    manager._headers = {}
+    manager._lead_id_index = None
+    return manager, worksheet
+
+
+@pytest.fixture(autouse=True)
+def default_leads_tab(monkeypatch):
+    monkeypatch.delenv("LEADS_SHEET_TAB", raising=False)
+
+
+# =============================================================================
+# _resolve_lead_rows
+# =============================================================================
+
+def test_resolve_builds_index_once_then_verifies_span():
+    manager, _ = make_manager(["a", "b", "c", "d"])
+
+    assert manager._resolve_lead_rows(["b", "d"]) == {"b": 3, "d": 5}
+    assert len(manager.spreadsheet.reads) == 1  # Index built, nothing to verify
+
+    assert manager._resolve_lead_rows(["c", "b"]) == {"c": 4, "b": 3}
+    # Kept index checked with one read over just the rows it resolved
+    assert len(manager.spreadsheet.reads) == 2
+    assert manager.spreadsheet.reads[1] == [f"'{SHEETS_TABS['leads']}'!A3:A4"]
+
+
+def test_resolve_rebuilds_index_when_row_moves():
+    manager, worksheet = make_manager(["a", "b", "c", "d"])
+    manager._resolve_lead_rows(["c"])
+
+    # Another run deletes a row above, shifting everything up one
+    worksheet.delete_row(3)
+
+    assert manager._resolve_lead_rows(["c", "d"]) == {"c": 3, "d": 4}
+    # Verify read mismatched, index rebuilt once
+    assert len(manager.spreadsheet.reads) == 3
+    assert manager._lead_id_index[1]["d"] == 4
+
+
+def test_resolve_rebuilds_index_for_lead_appended_elsewhere():
+    manager, worksheet = make_manager(["a", "b"])
+    manager._resolve_lead_rows(["a"])
+
+    worksheet.append(lead_row("z"))
+
+    assert manager._resolve_lead_rows(["a", "z"]) == {"a": 2, "z": 4}
+    assert len(manager.spreadsheet.reads) == 2  # Straight to a rebuild, no verify read
+
+
+def test_resolve_omits_leads_not_on_sheet():
+    manager, _ = make_manager(["a", "b"])
+    manager._resolve_lead_rows(["a"])
+
+    assert manager._resolve_lead_rows(["a", "gone", None, ""]) == {"a": 2}
+
+
+def test_resolve_duplicate_lead_id_takes_first_row():
+    manager, _ = make_manager(["a", "dup", "b", "dup"])
+
+    assert manager._resolve_lead_rows(["dup"]) == {"dup": 3}
+    assert manager._resolve_lead_rows(["dup"]) == {"dup": 3}
+
+
+def test_resolve_skips_blank_lead_id_cells():
+    manager, worksheet = make_manager(["a", "b", "c"])
+    worksheet.rows[2][LEAD_ID_COL] = ""
+
+    assert manager._resolve_lead_rows(["a", "c"]) == {"a": 2, "c": 4}
+    assert manager._resolve_lead_rows(["a", "c"]) == {"a": 2, "c": 4}
+    assert len(manager.spreadsheet.reads) == 2
+
+
+def test_batch_update_writes_to_moved_row():
+    manager, worksheet = make_manager(["a", "b", "c"])
+    manager._resolve_lead_rows(["c"])
+    worksheet.delete_row(2)
+
+    updated = manager.batch_update_leads_columns(["c"], {"status": ["SENT"]})
+
+    assert updated == 1
+    assert worksheet.rows[2][LEAD_ID_COL] == "c"
+    assert worksheet.rows[2][STATUS_COL] == "SENT"
+    assert worksheet.rows[1][STATUS_COL] == "APPROVED"
+
+
+# =============================================================================
+# QuotaGatedSession
+# =============================================================================
+
+class StubHTTPResponse:
+    def __init__(self, status_code: int, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+@pytest.fixture
+def windows(monkeypatch):
+    read_window, write_window = RequestWindow(60), RequestWindow(60)
+    monkeypatch.setattr(sheets_module, "_read_window", read_window)
+    monkeypatch.setattr(sheets_module, "_write_window", write_window)
+    return read_window, write_window
+
+
+def test_credential_refresh_retry_takes_one_slot(monkeypatch, windows):
+    read_window, write_window = windows
+    calls = []
+
+    def authorized_request(self, method, url, *args, _credential_refresh_attempt=0, **kwargs):
+        # Like AuthorizedSession.request: a 401 refreshes the token and
+        # retries through self.request
+        calls.append(_credential_refresh_attempt)
+        if not _credential_refresh_attempt:
+            return self.request(method, url, *args, _credential_refresh_attempt=1, **kwargs)
+        return StubHTTPResponse(200)
+
+    monkeypatch.setattr(sheets_module.AuthorizedSession, "request", authorized_request)
+    session = QuotaGatedSession(object())
+
+    assert session.request("GET", "https://sheets.googleapis.com/v4/x").status_code == 200
+    assert calls == [0, 1]
+    assert len(read_window._sent) == 1
+
+    session.request("POST", "https://sheets.googleapis.com/v4/x")
+    assert len(write_window._sent) == 1
+
+
+def test_gate_released_after_failed_request(monkeypatch, windows):
+    read_window, _ = windows
+
+    def failing_request(self, method, url, *args, **kwargs):
+        raise ConnectionError("reset")
+
+    monkeypatch.setattr(sheets_module.AuthorizedSession, "request", failing_request)
+    session = QuotaGatedSession(object())
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            session.request("GET", "https://sheets.googleapis.com/v4/x")
+    assert len(read_window._sent) == 2  # Each outer call gated
+
+
+def test_retry_after_blocks_window(monkeypatch, windows):
+    read_window, _ = windows
+    monkeypatch.setattr(
+        sheets_module.AuthorizedSession, "request",
+        lambda self, method, url, *args, **kwargs: StubHTTPResponse(429, {"Retry-After": "5"}),
+    )
+
+    QuotaGatedSession(object()).request("GET", "https://sheets.googleapis.com/v4/x")
+
+    assert read_window.blocked_until > 0